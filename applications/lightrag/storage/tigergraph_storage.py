@@ -5,6 +5,7 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any, Dict
 import numpy as np
@@ -13,6 +14,7 @@ from lightrag.base import BaseGraphStorage
 from lightrag.utils import logger
 
 from tigergraphx import Graph
+from tigergraphx.core import BufferedGraphWriter, PointReadBatcher
 
 
 @dataclass
@@ -50,6 +52,12 @@ class TigerGraphStorage(BaseGraphStorage):
 
             # Initialize the graph
             self._graph = Graph(graph_schema)
+
+            # Batch the point reads that LightRAG issues from many coroutines
+            self._batcher = PointReadBatcher(self._graph)
+
+            # Buffer upserts; reads flush pending writes first
+            self._writer = BufferedGraphWriter(self._graph)
         except Exception as e:
             logger.error(f"An error occurred during initialization: {e}")
             raise
@@ -61,52 +69,71 @@ class TigerGraphStorage(BaseGraphStorage):
             return value[1:-1]
         return value
 
+    async def _flush_writes(self) -> None:
+        if len(self._writer):
+            await asyncio.to_thread(self._writer.flush)
+
+    async def index_done_callback(self):
+        await self._flush_writes()
+
     async def has_node(self, node_id: str) -> bool:
-        return self._graph.has_node(self.clean_quotes(node_id))
+        await self._flush_writes()
+        return await self._batcher.has_node(self.clean_quotes(node_id))
 
     async def has_edge(self, source_node_id: str, target_node_id: str) -> bool:
-        return self._graph.has_edge(
+        await self._flush_writes()
+        return await self._batcher.has_edge(
             self.clean_quotes(source_node_id), self.clean_quotes(target_node_id)
         )
 
     async def node_degree(self, node_id: str) -> int:
-        result = self._graph.degree(self.clean_quotes(node_id))
+        await self._flush_writes()
+        result = await self._batcher.degree(self.clean_quotes(node_id))
         return result
 
     async def edge_degree(self, src_id: str, tgt_id: str) -> int:
-        return self._graph.degree(self.clean_quotes(src_id)) + self._graph.degree(
-            self.clean_quotes(tgt_id)
+        await self._flush_writes()
+        src_degree, tgt_degree = await asyncio.gather(
+            self._batcher.degree(self.clean_quotes(src_id)),
+            self._batcher.degree(self.clean_quotes(tgt_id)),
         )
+        return src_degree + tgt_degree
 
     async def get_node(self, node_id: str) -> dict | None:
-        result = self._graph.get_node_data(self.clean_quotes(node_id))
+        await self._flush_writes()
+        result = await self._batcher.get_node_data(self.clean_quotes(node_id))
         return result
 
     async def get_edge(self, source_node_id: str, target_node_id: str) -> dict | None:
-        result = self._graph.get_edge_data(
+        await self._flush_writes()
+        result = await self._batcher.get_edge_data(
             self.clean_quotes(source_node_id), self.clean_quotes(target_node_id)
         )
         return result
 
     async def get_node_edges(self, source_node_id: str) -> list[tuple[str, str]] | None:
         source_node_id = self.clean_quotes(source_node_id)
-        if self._graph.has_node(source_node_id):
+        if await self.has_node(source_node_id):
             edges = self._graph.get_node_edges(source_node_id)
             return list(edges)
         return None
 
     async def upsert_node(self, node_id: str, node_data: Dict[str, Any]):
         node_id = self.clean_quotes(node_id)
-        self._graph.add_node(node_id, **node_data)
+        # A size-triggered flush writes to the server, so keep it off the loop
+        await asyncio.to_thread(self._writer.add_node, node_id, **node_data)
 
     async def upsert_edge(
         self, source_node_id: str, target_node_id: str, edge_data: Dict[str, Any]
     ):
         source_node_id = self.clean_quotes(source_node_id)
         target_node_id = self.clean_quotes(target_node_id)
-        self._graph.add_edge(source_node_id, target_node_id, **edge_data)
+        await asyncio.to_thread(
+            self._writer.add_edge, source_node_id, target_node_id, **edge_data
+        )
 
     async def delete_node(self, node_id: str):
+        await self._flush_writes()
         if self._graph.has_node(node_id):
             self._graph.remove_node(node_id)
             logger.info(f"Node {node_id} deleted from the graph.")
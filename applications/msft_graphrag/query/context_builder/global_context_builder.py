@@ -5,51 +5,166 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
+import json
+import logging
 import tiktoken
-from typing import Optional, List
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from tigergraphx.graphrag import BaseContextBuilder
 
 from tigergraphx.core import Graph
 
+logger = logging.getLogger(__name__)
+
 
 class GlobalContextBuilder(BaseContextBuilder):
+    """
+    Builds the global context from all community reports.
+
+    The token-bounded batches are materialized once per graph name and data
+    version, and reused until the data changes. Writes to Community nodes through
+    the graph invalidate them. Bulk loads and clears must call `invalidate`, and
+    `close` detaches the builder from the graph.
+    """
+
     def __init__(
         self,
         graph: Graph,
         token_encoder: Optional[tiktoken.Encoding] = None,
+        data_version: Optional[int | str] = None,
+        cache_dir: Optional[str | Path] = None,
     ):
-        """Initialize LocalContextBuilder with graph config and token encoder."""
+        """
+        Initialize GlobalContextBuilder with graph config and token encoder.
+
+        Args:
+            graph: The graph object.
+            token_encoder: Token encoder for text tokenization.
+            data_version: Identifies the indexed data, such as an index timestamp.
+                It must change on re-indexing, and is required with `cache_dir`.
+                None starts an in-memory cache at version 0.
+            cache_dir: Directory where materialized contexts are persisted. None
+                keeps them in memory only.
+
+        Raises:
+            ValueError: If `cache_dir` is set without `data_version`.
+        """
+        if cache_dir is not None and data_version is None:
+            raise ValueError(
+                "data_version is required with cache_dir, so that a re-indexed "
+                "graph does not reuse a context persisted for its old data."
+            )
         super().__init__(
             graph=graph,
             single_batch=False,
             token_encoder=token_encoder,
         )
-
-    async def build_context(self) -> str | List[str]:
-        """Build local context."""
-        context: List[str] = []
-
-        config = {
+        self.config: Dict[str, Any] = {
             "max_tokens": 12000,
             "section_name": "Communities",
             "return_attributes": ["id", "rank", "title", "full_content"],
             "limit": 1000,
         }
+        self.data_version: int | str = 0 if data_version is None else data_version
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._cache: Dict[Tuple[str, str], List[str]] = {}
+        self.graph.add_write_listener(self._on_graph_write)
+
+    def invalidate(self, data_version: Optional[int | str] = None) -> None:
+        """
+        Drop the materialized context, in memory and on disk, after the data has
+        changed.
+
+        Args:
+            data_version: The new data version. None increments an integer version
+                and keeps a string version.
+        """
+        path = self._cache_path((self.graph.name, str(self.data_version)))
+        if path is not None:
+            path.unlink(missing_ok=True)
+        self._cache.clear()
+        if data_version is not None:
+            self.data_version = data_version
+        elif isinstance(self.data_version, int):
+            self.data_version += 1
+        logger.info(
+            f"Global context invalidated; data version is now {self.data_version}."
+        )
+
+    def close(self) -> None:
+        """Stop listening to writes through the graph."""
+        self.graph.remove_write_listener(self._on_graph_write)
+
+    async def build_context(self) -> str | List[str]:
+        """Build global context."""
+        key = (self.graph.name, str(self.data_version))
+        context = self._cache.get(key)
+        if context is None:
+            context = self._load_from_disk(key)
+        if context is None:
+            context = self._materialize()
+            self._save_to_disk(key, context)
+        self._cache[key] = context
+        return list(context)
+
+    def _materialize(self) -> List[str]:
+        context: List[str] = []
         df = self.graph.get_nodes(
             node_type="Community",
-            return_attributes=config["return_attributes"],
-            limit=config["limit"],
+            return_attributes=self.config["return_attributes"],
+            limit=self.config["limit"],
         )
         if df is not None:
             text_context = self.batch_and_convert_to_text(
                 graph_data=df,
-                max_tokens=config["max_tokens"],
+                max_tokens=self.config["max_tokens"],
                 single_batch=self.single_batch,
-                section_name=config["section_name"],
+                section_name=self.config["section_name"],
             )
             context.extend(
                 text_context if isinstance(text_context, list) else [text_context]
             )
-
         return context
+
+    def _cache_path(self, key: Tuple[str, str]) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        graph_name, data_version = key
+        return self.cache_dir / f"{graph_name}.{data_version}.global_context.json"
+
+    def _load_from_disk(self, key: Tuple[str, str]) -> Optional[List[str]]:
+        path = self._cache_path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            with open(path, "r") as file:
+                payload = json.load(file)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable global context cache {path}: {e}")
+            return None
+        # Contexts built with other settings are rebuilt
+        if payload.get("config") != self.config:
+            return None
+        return payload.get("context")
+
+    def _save_to_disk(self, key: Tuple[str, str], context: List[str]) -> None:
+        path = self._cache_path(key)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so readers never see a partial file
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as file:
+            json.dump({"config": self.config, "context": context}, file)
+        tmp_path.replace(path)
+
+    def _on_graph_write(
+        self,
+        operation: Literal["upsert", "remove", "clear", "invalidate"],
+        node_type: Optional[str],
+        nodes: List[Tuple[str, Dict[str, Any]]],
+    ) -> None:
+        # Bulk operations report no node type; their callers invalidate explicitly
+        if node_type == "Community":
+            self.invalidate()
@@ -5,6 +5,7 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
+import asyncio
 import tiktoken
 from typing import Optional, List
 
@@ -65,14 +66,23 @@ class LocalContextBuilder(BaseContextBuilder):
             },
         ]
 
-        # Iterate over different neighbor types
-        for neighbor in neighbor_types:
-            df = self.graph.get_neighbors(
-                start_nodes=top_k_objects,
-                start_node_type="Entity",
-                target_node_types=neighbor["target_node_types"],
-                return_attributes=neighbor["return_attributes"],
+        # Fetch all neighbor sections concurrently, so the latency is that of the
+        # slowest request rather than the sum of all of them
+        neighbor_dfs = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self.graph.get_neighbors,
+                    start_nodes=top_k_objects,
+                    start_node_type="Entity",
+                    target_node_types=neighbor["target_node_types"],
+                    return_attributes=neighbor["return_attributes"],
+                )
+                for neighbor in neighbor_types
             )
+        )
+
+        # Convert the sections in order
+        for neighbor, df in zip(neighbor_types, neighbor_dfs):
             if df is not None:
                 text_context = self.batch_and_convert_to_text(
                     graph_data=df,
@@ -7,7 +7,7 @@
 
 import logging
 from dataclasses import dataclass
-from typing import Literal
+from typing import AsyncIterator, Dict, List, Literal
 import asyncio
 import json
 
@@ -18,6 +18,7 @@ from .context_builder import (
 )
 
 from tigergraphx import Graph
+from tigergraphx.graphrag import MapReduceExecutor
 from tigergraphx.factories import create_openai_components
 
 logger = logging.getLogger(__name__)
@@ -52,19 +53,30 @@ class GraphRAG:
             graph_schema=self.schema_path,
             drop_existing_graph=False,
         )
-        # Load Data
-        if self.to_load_data:
-            logger.info(
-                "Loading data into graph using loading job config: %s",
-                self.loading_job_path,
-            )
-            graph.load_data(loading_job_config=self.loading_job_path)
         # Create Context Builders
         (self.openai_chat, search_engine) = create_openai_components(self.settings_path, graph)
         self.local_context_builder = LocalContextBuilder(
             graph=graph, search_engine=search_engine
         )
         self.global_context_builder = GlobalContextBuilder(graph=graph)
+        self.map_reduce_executor = MapReduceExecutor(
+            max_concurrency=8, token_budget=8000
+        )
+        self.graph = graph
+        # Load Data
+        if self.to_load_data:
+            self.load_data()
+
+    def load_data(self):
+        """
+        Load data into the graph and drop contexts materialized from older data.
+        """
+        logger.info(
+            "Loading data into graph using loading job config: %s",
+            self.loading_job_path,
+        )
+        self.graph.load_data(loading_job_config=self.loading_job_path)
+        self.global_context_builder.invalidate()
 
     def query(self, query: str, param: QueryParam = QueryParam()):
         logger.info("Executing query with parameters: %s", param)
@@ -87,6 +99,35 @@ class GraphRAG:
             raise ValueError(f"Unknown mode {param.mode}")
         return response
 
+    async def aquery_stream(
+        self, query: str, param: QueryParam = QueryParam()
+    ) -> AsyncIterator[str]:
+        """
+        Execute a query and yield the final answer as it is generated.
+
+        Context building and the global map stage complete first; only the final
+        chat call is streamed.
+        """
+        logger.info("Starting asynchronous streaming query execution.")
+        if param.mode == "local":
+            prepared = await self._prepare_local_query(query, param)
+        elif param.mode == "global":
+            prepared = await self._prepare_global_query(query, param)
+        else:
+            raise ValueError(f"Unknown mode {param.mode}")
+
+        # A string is a final answer that needs no chat call
+        if isinstance(prepared, str):
+            yield prepared
+            return
+
+        try:
+            async for delta in self.openai_chat.chat_stream(prepared):
+                yield delta
+        except Exception as e:
+            logger.error(f"Error during aquery_stream: {e}")
+            yield "An error occurred while processing the query."
+
     async def local_query(
         self,
         query: str,
@@ -95,6 +136,28 @@ class GraphRAG:
         """
         Perform a local search using the context builder and return the result.
         """
+        prepared = await self._prepare_local_query(query, query_param)
+        if isinstance(prepared, str):
+            return prepared
+
+        # Perform the query using OpenAIChat
+        logger.info("Executing final query with OpenAIChat.")
+        try:
+            response = await self.openai_chat.chat(prepared)
+            return response
+        except Exception as e:
+            logger.error(f"Error during local_query: {e}")
+            return "An error occurred while processing the query."
+
+    async def _prepare_local_query(
+        self,
+        query: str,
+        query_param: QueryParam,
+    ) -> str | List[Dict[str, str]]:
+        """
+        Build the local context and return either a final answer or the messages
+        for the final chat call.
+        """
         logger.info("Performing local query with top_k: %d", query_param.top_k)
         # Generate context using the local context builder
         context = await self.local_context_builder.build_context(
@@ -114,30 +177,40 @@ class GraphRAG:
         system_prompt = PROMPTS["local_rag_response"].format(
             context_data=context, response_type=query_param.response_type
         )
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": query},
+        ]
 
-        # Perform the query using OpenAIChat
-        logger.info("Executing final query with OpenAIChat.")
+    async def global_query(
+        self,
+        query: str,
+        query_param: QueryParam,
+    ) -> str:
+        """
+        Execute a global query using the provided context and query parameters.
+        """
+        prepared = await self._prepare_global_query(query, query_param)
+        if isinstance(prepared, str):
+            return prepared
+
+        # Perform the final query using OpenAIChat
         try:
-            response = await self.openai_chat.chat(
-                [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": query},
-                ]
-            )
+            response = await self.openai_chat.chat(prepared)
             return response
         except Exception as e:
-            logger.error(f"Error during local_query: {e}")
+            logger.error(f"Error during global_query: {e}")
             return "An error occurred while processing the query."
 
-    async def global_query(
+    async def _prepare_global_query(
         self,
         query: str,
         query_param: QueryParam,
-    ) -> str:
+    ) -> str | List[Dict[str, str]]:
         """
-        Execute a global query using the provided context and query parameters.
+        Run the map stage and return either a final answer or the messages for the
+        reduce chat call.
         """
-
         logger.info("Performing global query.")
         # Retrieve context using the global context builder
         context_list = await self.global_context_builder.build_context()
@@ -152,73 +225,48 @@ class GraphRAG:
         if not context_list:
             return PROMPTS["fail_response"]
 
-        # Map process: Process each context in the context_list
-        async def _process_context(context: str) -> dict:
+        # Map each context to scored points, then reduce the points until they
+        # fit in the reduce prompt
+        async def _map_points(context: str) -> List[Dict]:
             """
-            Process an individual context through the map stage.
+            Ask the LLM for the key points of a context, or of a group of points.
             """
-            # Construct system prompt for map stage
             sys_prompt = PROMPTS["global_map_rag_points"].format(context_data=context)
             try:
-                # Perform the query using OpenAIChat
                 response = await self.openai_chat.chat(
                     [
                         {"role": "system", "content": sys_prompt},
                         {"role": "user", "content": query},
                     ]
                 )
-                # Parse JSON response
-                if isinstance(response, dict):
-                    return json.loads(response).get("points", {})
-                else:
-                    return {}
+                points = json.loads(response).get("points", [])
+                return [point for point in points if isinstance(point, dict)]
             except Exception as e:
                 logger.error(f"Error during map stage: {e}")
-                return {}  # Fallback to an empty dict on failure
+                return []  # Fallback to no points on failure
 
-        # Apply the map process to all contexts in context_list
         try:
             logger.info("Mapping contexts.")
-            mapped_contexts = await asyncio.gather(
-                *[_process_context(context) for context in context_list]
+            result = await self.map_reduce_executor.run(
+                context_list, map_fn=_map_points, reduce_fn=_map_points
             )
         except Exception as e:
             logger.error(f"Error during mapping phase: {e}")
             return "An error occurred during the mapping process."
-
-        # Combine mapped contexts
-        combined_points = []
-        for context in mapped_contexts:
-            combined_points.extend(context)
-
-        logger.info("Combining and sorting mapped contexts.")
-        # Sort combined points by score in descending order
-        combined_points.sort(key=lambda x: x.get("score", 0), reverse=True)
+        logger.info("Map-reduce timings: %s", result.timings)
 
         # Prepare data for the reduction step
-        combined_context = "\n".join(
-            f"{point['description']} (Score: {point['score']})"
-            for point in combined_points
-        )
+        combined_context = self.map_reduce_executor.format_points(result.points)
 
         # Construct the system prompt for reduction
         system_prompt = PROMPTS["global_reduce_rag_response"].format(
             report_data=combined_context,
             response_type=query_param.response_type,
         )
-
-        # Perform the final query using OpenAIChat
-        try:
-            response = await self.openai_chat.chat(
-                [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": query},
-                ]
-            )
-            return response
-        except Exception as e:
-            logger.error(f"Error during global_query: {e}")
-            return "An error occurred while processing the query."
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": query},
+        ]
 
     @staticmethod
     def always_get_an_event_loop() -> asyncio.AbstractEventLoop:
@@ -182,12 +182,16 @@ async def process_all_documents(
             relationships.setdefault(rel_type, []).append(rel)
 
     # Add embeddings to the graph documents for Product nodes
-    for node in nodes.get("Product", []):
-        if "features" in node.get("properties", {}):
-            embedding = await openai_embedding.generate_embedding(
-                node["properties"]["features"]
-            )
-            node["properties"]["embedding"] = " ".join(map(str, embedding))
+    products = [
+        node
+        for node in nodes.get("Product", [])
+        if "features" in node.get("properties", {})
+    ]
+    embeddings = await openai_embedding.generate_embeddings(
+        [node["properties"]["features"] for node in products]
+    )
+    for node, embedding in zip(products, embeddings):
+        node["properties"]["embedding"] = " ".join(map(str, embedding))
 
     # Write CSV files
     await asyncio.gather(
@@ -222,7 +226,11 @@ def main():
     openai = OpenAIManager(config={})
     openai_chat = OpenAIChat(openai, config={"model": "gpt-4o-mini"})
     openai_embedding = OpenAIEmbedding(
-        openai, config={"model": "text-embedding-3-small"}
+        openai,
+        config={
+            "model": "text-embedding-3-small",
+            "cache_file": "data/cache/embeddings.sqlite",
+        },
     )
     output_dir = "data/output"
     asyncio.run(
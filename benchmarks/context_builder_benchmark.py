@@ -0,0 +1,117 @@
+"""
+Benchmark `BaseContextBuilder.batch_and_convert_to_text` on large sections.
+
+The previous implementation, which encodes one row at a time and grows each batch
+by string concatenation, is kept as the baseline.
+
+Usage:
+    python -m benchmarks.context_builder_benchmark --rows 100000 --max-tokens 12000
+"""
+
+import argparse
+import time
+from typing import Callable, List
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import tiktoken
+
+from tigergraphx.graphrag import BaseContextBuilder
+
+
+class BenchContextBuilder(BaseContextBuilder):
+    async def build_context(self, *args, **kwargs) -> str | List[str]:
+        return ""
+
+
+def row_by_row_batches(
+    graph_data: pd.DataFrame,
+    section_name: str,
+    single_batch: bool,
+    max_tokens: int,
+    token_encoder: tiktoken.Encoding,
+) -> str | List[str]:
+    """The previous row-by-row conversion, kept as the baseline."""
+    header = f"-----{section_name}-----\n" + "|".join(graph_data.columns) + "\n"
+    content_rows = ["|".join(str(value) for value in row) for row in graph_data.values]
+    header_tokens = len(token_encoder.encode(header))
+    batches = []
+    current_batch = header
+    current_tokens = header_tokens
+    for row in content_rows:
+        row_tokens = len(token_encoder.encode(row))
+        if current_tokens + row_tokens > max_tokens:
+            batches.append(current_batch.strip())
+            if single_batch:
+                return batches[0]
+            current_batch = header + row + "\n"
+            current_tokens = header_tokens + row_tokens
+        else:
+            current_batch += row + "\n"
+            current_tokens += row_tokens
+    if current_batch.strip():
+        batches.append(current_batch.strip())
+    return batches[0] if single_batch else batches
+
+
+def seconds(func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--max-tokens", type=int, default=12_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    words = np.array(["graph", "node", "edge", "community", "entity", "relation"])
+    data = pd.DataFrame(
+        {
+            "id": [f"entity_{i}" for i in range(args.rows)],
+            "rank": rng.integers(0, 100, size=args.rows),
+            "description": [
+                " ".join(rng.choice(words, size=rng.integers(5, 40)))
+                for _ in range(args.rows)
+            ],
+        }
+    )
+
+    token_encoder = tiktoken.get_encoding("cl100k_base")
+    builder = BenchContextBuilder(graph=MagicMock(), token_encoder=token_encoder)
+
+    for single_batch in [True, False]:
+        results = {
+            "row by row": seconds(
+                lambda: row_by_row_batches(
+                    data, "Entities", single_batch, args.max_tokens, token_encoder
+                )
+            ),
+            "exact counts": seconds(
+                lambda: builder.batch_and_convert_to_text(
+                    data,
+                    "Entities",
+                    single_batch=single_batch,
+                    max_tokens=args.max_tokens,
+                    estimate_by_bytes=False,
+                )
+            ),
+            "byte estimate": seconds(
+                lambda: builder.batch_and_convert_to_text(
+                    data,
+                    "Entities",
+                    single_batch=single_batch,
+                    max_tokens=args.max_tokens,
+                )
+            ),
+        }
+        print(f"single_batch={single_batch}")
+        for name, value in results.items():
+            print(f"  {name:<16} {value * 1000:>10,.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
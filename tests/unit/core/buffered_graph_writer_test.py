@@ -0,0 +1,114 @@
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+
+from tigergraphx.core.buffered_graph_writer import BufferedGraphWriter
+from tigergraphx.core.graph import Graph
+
+
+class TestBufferedGraphWriter:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        with patch(
+            "tigergraphx.core.tigergraph_api.api.admin_api.AdminAPI.get_version"
+        ) as mock_get_version:
+            mock_get_version.return_value = "4.2.0"
+            schema = {
+                "graph_name": "WriterGraph",
+                "nodes": {
+                    "Person": {
+                        "primary_key": "name",
+                        "attributes": {"name": "STRING", "age": "INT"},
+                    }
+                },
+                "edges": {
+                    "Knows": {
+                        "is_directed_edge": False,
+                        "from_node_type": "Person",
+                        "to_node_type": "Person",
+                        "attributes": {"since": "INT"},
+                    },
+                    "Meets": {
+                        "is_directed_edge": False,
+                        "from_node_type": "Person",
+                        "to_node_type": "Person",
+                        "discriminator": "date",
+                        "attributes": {"date": "STRING"},
+                    },
+                },
+            }
+            self.graph = Graph(graph_schema=schema, mode="lazy")
+        self.graph._node_manager = MagicMock()
+        self.graph._node_manager.add_nodes_from.side_effect = (
+            lambda nodes, node_type: len(nodes)
+        )
+        self.graph._edge_manager = MagicMock()
+        self.graph._edge_manager.add_edges_from.side_effect = (
+            lambda edges, s, e, t: len(edges)
+        )
+        yield
+
+    def test_flush_on_exit_coalesces_updates(self):
+        with BufferedGraphWriter(self.graph, flush_interval=None) as writer:
+            writer.add_node("Alice", age=30)
+            writer.add_node("Bob", age=25)
+            writer.add_node("Alice", age=31, city="Paris")
+            writer.add_edge("Alice", "Bob", "Person", "Knows", "Person", since=2020)
+            writer.add_edge("Alice", "Bob", "Person", "Knows", "Person", since=2021)
+            writer.add_edge("Alice", "Bob", "Person", "Meets", "Person", date="a")
+            writer.add_edge("Alice", "Bob", "Person", "Meets", "Person", date="b")
+            assert len(writer) == 5
+            self.graph._node_manager.add_nodes_from.assert_not_called()
+
+        self.graph._node_manager.add_nodes_from.assert_called_once_with(
+            [("Alice", {"age": 31, "city": "Paris"}), ("Bob", {"age": 25})], "Person"
+        )
+        edge_calls = self.graph._edge_manager.add_edges_from.call_args_list
+        assert [c.args[2] for c in edge_calls] == ["Knows", "Meets"]
+        assert edge_calls[0].args[0] == [("Alice", "Bob", {"since": 2021})]
+        assert len(edge_calls[1].args[0]) == 2
+        assert writer.written == 5
+        assert len(writer) == 0
+
+    def test_flush_by_size(self):
+        writer = BufferedGraphWriter(self.graph, max_batch_size=2, flush_interval=None)
+        writer.add_node("Alice")
+        writer.add_node("Alice", age=30)
+        self.graph._node_manager.add_nodes_from.assert_not_called()
+        writer.add_node("Bob")
+        self.graph._node_manager.add_nodes_from.assert_called_once()
+        assert len(writer) == 0
+
+    def test_flush_by_time(self):
+        writer = BufferedGraphWriter(self.graph, flush_interval=0.01)
+        writer.add_node("Alice")
+        deadline = time.monotonic() + 2
+        while writer.written == 0 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert writer.written == 1
+        writer.close()
+
+    def test_failed_batches_stay_buffered(self):
+        self.graph._node_manager.add_nodes_from.side_effect = None
+        self.graph._node_manager.add_nodes_from.return_value = None
+        writer = BufferedGraphWriter(self.graph, flush_interval=None)
+        writer.add_node("Alice", age=30)
+
+        assert writer.flush() == 0
+        assert len(writer) == 1
+
+        writer.add_node("Alice", city="Paris")
+        self.graph._node_manager.add_nodes_from.return_value = 1
+        assert writer.flush() == 1
+        self.graph._node_manager.add_nodes_from.assert_called_with(
+            [("Alice", {"age": 30, "city": "Paris"})], "Person"
+        )
+
+    def test_writes_notify_listeners_on_flush(self):
+        listener = MagicMock()
+        self.graph.add_write_listener(listener)
+        writer = BufferedGraphWriter(self.graph, flush_interval=None)
+        writer.add_node("Alice", age=30)
+        listener.assert_not_called()
+        writer.flush()
+        listener.assert_called_once_with("upsert", "Person", [("Alice", {"age": 30})])
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock, call, patch
 
 from tigergraphx.core.graph import Graph
 
@@ -88,6 +88,27 @@ class TestGraph:
         assert edge == "Knows"
         assert tgt == "Person"
 
+    def test_resolve_types_and_graph_schema(self):
+        schema = {
+            "graph_name": "SingleEdgeTypeGraph",
+            "nodes": {
+                "Person": {"primary_key": "name", "attributes": {"name": "STRING"}},
+            },
+            "edges": {
+                "Knows": {
+                    "is_directed_edge": False,
+                    "from_node_type": "Person",
+                    "to_node_type": "Person",
+                },
+            },
+        }
+        graph = Graph(graph_schema=schema, mode="lazy")
+        assert graph.resolve_node_type() == "Person"
+        assert graph.resolve_edge_type() == ("Person", "Knows", "Person")
+        assert graph.graph_schema.nodes["Person"].primary_key == "name"
+        with pytest.raises(ValueError, match="Invalid node type"):
+            graph.resolve_node_type("Company")
+
     def test_validate_edge_type_multiple_edge_types(self):
         schema = {
             "graph_name": "MultiEdgeTypeGraph",
@@ -147,6 +168,166 @@ class TestGraph:
         with pytest.raises(ValueError, match="Invalid edge type"):
             graph._validate_edge_types_as_set(["UnknownEdge"])
 
+    def test_write_listeners_notified_on_node_writes(self):
+        schema = {
+            "graph_name": "ListenerGraph",
+            "nodes": {
+                "Person": {"primary_key": "name", "attributes": {"name": "STRING"}}
+            },
+            "edges": {},
+        }
+        graph = Graph(graph_schema=schema, mode="lazy")
+        graph._node_manager = MagicMock()
+        graph._node_manager.add_nodes_from.side_effect = [1, None, 2]
+        graph._node_manager.remove_node.return_value = True
+        graph._vector_manager = MagicMock()
+        graph._vector_manager.upsert.return_value = 1
+        listener = MagicMock()
+        graph.add_write_listener(listener)
+
+        assert graph.add_node("Carol", age=41) is None
+        # A failed write does not notify listeners
+        graph.add_node("Dave")
+        graph.add_nodes_from([("Alice", {"age": 30}), "Bob"])
+        graph.upsert({"name": "Eve", "emb": [0.1, 0.2]})
+        graph.remove_node("Bob")
+        graph.remove_write_listener(listener)
+        graph.remove_node("Alice")
+
+        assert listener.call_args_list == [
+            call("upsert", "Person", [("Carol", {"age": 41})]),
+            call("upsert", "Person", [("Alice", {"age": 30}), ("Bob", {})]),
+            call("upsert", "Person", [("Eve", {"emb": [0.1, 0.2]})]),
+            call("remove", "Person", [("Bob", {})]),
+        ]
+
+    def test_bulk_removals_notify_listeners(self):
+        schema = {
+            "graph_name": "RemovalGraph",
+            "nodes": {
+                "Person": {"primary_key": "name", "attributes": {"name": "STRING"}}
+            },
+            "edges": {
+                "Knows": {
+                    "is_directed_edge": False,
+                    "from_node_type": "Person",
+                    "to_node_type": "Person",
+                }
+            },
+        }
+        graph = Graph(graph_schema=schema, mode="lazy")
+        graph._node_manager = MagicMock()
+        graph._node_manager.remove_nodes.return_value = 2
+        graph._node_manager.remove_nodes_where.return_value = 3
+        graph._edge_manager = MagicMock()
+        graph._edge_manager.remove_edges.return_value = 1
+        listener = MagicMock()
+        graph.add_write_listener(listener)
+
+        assert graph.remove_nodes([1, 2]) == 2
+        assert graph.remove_nodes_where("Person", "s.name == \"x\"") == 3
+        assert graph.remove_edges([(1, 2)]) == 1
+
+        graph._node_manager.remove_nodes.assert_called_once_with(
+            ["1", "2"], "Person", 1000
+        )
+        graph._edge_manager.remove_edges.assert_called_once_with(
+            [("1", "2")], "Person", "Knows", "Person", 1000
+        )
+        assert listener.call_args_list == [
+            call("remove", "Person", [("1", {}), ("2", {})]),
+            call("invalidate", "Person", []),
+        ]
+
+    def test_data_loads_notify_listeners(self):
+        schema = {
+            "graph_name": "LoadGraph",
+            "nodes": {
+                "Person": {"primary_key": "name", "attributes": {"name": "STRING"}}
+            },
+            "edges": {},
+        }
+        graph = Graph(graph_schema=schema, mode="lazy")
+        graph._data_manager = MagicMock()
+        listener = MagicMock()
+        graph.add_write_listener(listener)
+
+        graph.load_data({"loading_job_name": "job", "files": []})
+        graph.load_data_async({"loading_job_name": "job", "files": []})
+        assert listener.call_args_list == [call("invalidate", None, [])] * 2
+
+        # The job notifies listeners again once it has ended
+        graph._data_manager.load_data_async.call_args.kwargs["on_done"]()
+        assert listener.call_count == 3
+
+    def test_read_cache_hits_and_invalidation_on_write(self):
+        schema = {
+            "graph_name": "CacheGraph",
+            "nodes": {
+                "Person": {"primary_key": "name", "attributes": {"name": "STRING"}}
+            },
+            "edges": {},
+        }
+        graph = Graph(graph_schema=schema, mode="lazy")
+        graph._query_manager = MagicMock()
+        graph._query_manager.get_nodes.return_value = [{"name": "Alice"}]
+        graph._node_manager = MagicMock()
+        graph._node_manager.add_nodes_from.return_value = 1
+        cache = graph.enable_read_cache(max_entries=10)
+
+        first = graph.get_nodes("Person", return_attributes=["name"])
+        first.append({"name": "Mallory"})
+        second = graph.get_nodes("Person", return_attributes=["name"])
+        graph.add_nodes_from(["Bob"])
+        graph.get_nodes("Person", return_attributes=["name"])
+
+        assert second == [{"name": "Alice"}]
+        assert graph._query_manager.get_nodes.call_count == 2
+        # Writes also keep later reads from joining reads already in flight
+        assert graph._context.write_generation == 1
+        assert cache.metrics["hits"] == 1
+        assert cache.metrics["misses"] == 2
+        assert cache.metrics["invalidations"] == 1
+
+        # Installed queries may write, so running one drops the cache
+        graph.run_query("add_person", {"name": "Carol"})
+        graph.get_nodes("Person", return_attributes=["name"])
+        assert graph._query_manager.get_nodes.call_count == 3
+        assert cache.metrics["invalidations"] == 2
+
+        graph.disable_read_cache()
+        graph.get_nodes("Person", return_attributes=["name"])
+        assert graph._query_manager.get_nodes.call_count == 4
+
+    def test_read_cache_skips_results_of_swallowed_errors(self):
+        schema = {
+            "graph_name": "CacheGraph",
+            "nodes": {
+                "Person": {"primary_key": "name", "attributes": {"name": "STRING"}}
+            },
+            "edges": {},
+        }
+        graph = Graph(graph_schema=schema, mode="lazy")
+        tigergraph_api = graph._context.tigergraph_api
+
+        def get_node_data(node_id, node_type):
+            if tigergraph_api.swallowed_error_total == 0:
+                # A transient failure the manager turns into "no data"
+                tigergraph_api.record_swallowed_error(
+                    "get_node_data", TimeoutError("timed out")
+                )
+                return None
+            return {"name": node_id}
+
+        graph._node_manager = MagicMock()
+        graph._node_manager.get_node_data.side_effect = get_node_data
+        graph.enable_read_cache()
+
+        assert graph.get_node_data("Alice") is None
+        assert graph.get_node_data("Alice") == {"name": "Alice"}
+        assert graph.get_node_data("Alice") == {"name": "Alice"}
+        assert graph._node_manager.get_node_data.call_count == 2
+
     def test_to_str_node_id(self):
         assert Graph._to_str_node_id(123) == "123"
         assert Graph._to_str_node_id("Alice") == "Alice"
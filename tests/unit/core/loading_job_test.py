@@ -0,0 +1,172 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+
+from tigergraphx.core.loading_job import LoadingJob
+
+
+def make_status(status, valid=0, rejected=0, progress=0.0, duration=0):
+    return {
+        "jobId": "G.job.file.m1.1",
+        "status": status,
+        "overall": {
+            "progress": progress,
+            "duration": duration,
+            "averageSpeed": 500,
+        },
+        "workers": [
+            {
+                "tasks": [
+                    {
+                        "filename": "/data/persons.csv",
+                        "statistics": {
+                            "fileLevel": {
+                                "validLine": valid,
+                                "rejectLine": rejected,
+                            }
+                        },
+                    },
+                    {
+                        "filename": "/data/friends.csv",
+                        "statistics": {
+                            "fileLevel": {"validLine": valid, "notEnoughToken": 1}
+                        },
+                    },
+                ]
+            }
+        ],
+    }
+
+
+class TestLoadingJob:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.mock_tigergraph_api = MagicMock()
+        self.mock_tigergraph_api.gsql.return_value = "Successfully dropped jobs"
+        self.on_done = MagicMock()
+        self.job = LoadingJob(
+            tigergraph_api=self.mock_tigergraph_api,
+            graph_name="G",
+            job_name="job",
+            job_id="G.job.file.m1.1",
+            poll_interval=0,
+            on_done=self.on_done,
+        )
+
+    def test_status_parses_file_progress(self):
+        self.mock_tigergraph_api.get_loading_job_status.return_value = make_status(
+            "RUNNING", valid=90, rejected=10, progress=0.5, duration=2000
+        )
+        status = self.job.status()
+
+        self.mock_tigergraph_api.get_loading_job_status.assert_called_once_with(
+            "G", "G.job.file.m1.1"
+        )
+        assert status.status == "RUNNING"
+        assert not status.done
+        assert status.progress == 0.5
+        assert status.duration == 2.0
+        assert status.lines_per_second == 500
+        assert [f.file_name for f in status.files] == [
+            "/data/persons.csv",
+            "/data/friends.csv",
+        ]
+        assert (status.files[0].lines_read, status.files[0].lines_rejected) == (
+            100,
+            10,
+        )
+        assert status.files[1].lines_rejected == 1
+        assert status.lines_loaded == 180
+        assert status.lines_rejected == 11
+        assert self.job.last_status is status
+        self.on_done.assert_not_called()
+
+    def test_wait_polls_until_finished_and_drops_job(self):
+        self.mock_tigergraph_api.get_loading_job_status.side_effect = [
+            make_status("RUNNING", valid=10),
+            make_status("FINISHED", valid=20, progress=1),
+        ]
+        callback = MagicMock()
+        status = self.job.wait(callback=callback)
+
+        assert status.succeeded
+        assert callback.call_count == 2
+        self.mock_tigergraph_api.gsql.assert_called_once_with(
+            "USE GRAPH G\nDROP JOB job"
+        )
+        self.on_done.assert_called_once()
+        assert self.job.done()
+        assert not self.job.cancel()
+
+    def test_wait_raises_when_job_failed(self):
+        self.mock_tigergraph_api.get_loading_job_status.return_value = make_status(
+            "FAILED"
+        )
+        with pytest.raises(RuntimeError):
+            self.job.wait()
+        self.on_done.assert_called_once()
+
+    def test_wait_timeout(self):
+        self.mock_tigergraph_api.get_loading_job_status.return_value = make_status(
+            "RUNNING"
+        )
+        with pytest.raises(TimeoutError):
+            self.job.wait(timeout=0)
+        self.mock_tigergraph_api.gsql.assert_not_called()
+
+    def test_wait_async(self):
+        self.mock_tigergraph_api.get_loading_job_status.side_effect = [
+            make_status("RUNNING"),
+            make_status("FINISHED", valid=5),
+        ]
+        status = asyncio.run(self.job.wait_async())
+        assert status.lines_loaded == 10
+
+    def test_cancel_aborts_and_drops_job(self):
+        self.mock_tigergraph_api.get_loading_job_status.return_value = make_status(
+            "ABORTED"
+        )
+        assert self.job.cancel()
+        commands = [c[0][0] for c in self.mock_tigergraph_api.gsql.call_args_list]
+        assert commands == [
+            "USE GRAPH G\nABORT LOADING JOB G.job.file.m1.1",
+            "USE GRAPH G\nDROP JOB job",
+        ]
+        self.on_done.assert_called_once()
+
+        # An aborted job is reported without raising
+        assert self.job.wait().status == "ABORTED"
+        assert self.mock_tigergraph_api.gsql.call_count == 2
+
+    def test_cancel_waits_for_abort_in_progress(self):
+        self.mock_tigergraph_api.get_loading_job_status.side_effect = [
+            make_status("RUNNING"),
+            make_status("ABORTED"),
+        ]
+        assert self.job.cancel()
+        self.on_done.assert_not_called()
+        assert self.job.wait().status == "ABORTED"
+        self.on_done.assert_called_once()
+
+    def test_cancel_reports_failed_abort(self):
+        self.mock_tigergraph_api.gsql.return_value = (
+            "Failed to abort loading job: job G.job.file.m1.1 does not exist"
+        )
+        assert not self.job.cancel()
+        assert not self.job.cancelled
+        self.mock_tigergraph_api.get_loading_job_status.assert_not_called()
+
+        # The job is still polled afterwards
+        self.mock_tigergraph_api.get_loading_job_status.return_value = make_status(
+            "RUNNING"
+        )
+        assert not self.job.status().done
+
+    def test_cancel_after_job_finished_on_server(self):
+        self.mock_tigergraph_api.get_loading_job_status.return_value = make_status(
+            "FINISHED", valid=5
+        )
+        assert not self.job.cancel()
+        assert not self.job.cancelled
+        self.on_done.assert_called_once()
+        assert self.job.wait().succeeded
@@ -66,3 +66,48 @@ class TestDataManager:
     def test_format_unsupported_type(self):
         with pytest.raises(TypeError):
             DataManager._format_column_name([1, 2, 3])  # pyright: ignore
+
+    def test_load_data_async_starts_job(self):
+        loading_job_config = LoadingJobConfig(loading_job_name="test_job", files=[])
+        self.mock_tigergraph_api.gsql.return_value = (
+            "Using graph 'MyGraph'\n"
+            "Successfully created loading jobs: [test_job_1a2b3c4d].\n"
+            "Running the following loading job:\n"
+            "  Job name: test_job_1a2b3c4d\n"
+            "  Jobid: MyGraph.test_job_1a2b3c4d.file.m1.1700000000000\n"
+        )
+        job = self.data_manager.load_data_async(loading_job_config, poll_interval=0.5)
+
+        assert job.job_id == "MyGraph.test_job_1a2b3c4d.file.m1.1700000000000"
+        assert job.job_name.startswith("test_job_")
+        assert job.poll_interval == 0.5
+        gsql_script = self.mock_tigergraph_api.gsql.call_args[0][0]
+        assert f"RUN LOADING JOB -noprint {job.job_name}" in gsql_script
+        assert "DROP JOB" not in gsql_script
+
+    def test_load_data_async_unique_job_names(self):
+        loading_job_config = LoadingJobConfig(loading_job_name="test_job", files=[])
+        self.mock_tigergraph_api.gsql.return_value = (
+            "Using graph 'MyGraph'\n"
+            "Successfully created loading jobs:\n"
+            "  Jobid: MyGraph.job.file.m1.1\n"
+        )
+        first = self.data_manager.load_data_async(loading_job_config)
+        second = self.data_manager.load_data_async(loading_job_config)
+        assert first.job_name != second.job_name
+
+    def test_load_data_async_without_job_id_drops_job(self):
+        loading_job_config = LoadingJobConfig(loading_job_name="test_job", files=[])
+        self.mock_tigergraph_api.gsql.return_value = (
+            "Using graph 'MyGraph'\nSuccessfully created loading jobs:\nError"
+        )
+        with pytest.raises(RuntimeError):
+            self.data_manager.load_data_async(loading_job_config)
+        assert "DROP JOB" in self.mock_tigergraph_api.gsql.call_args[0][0]
+
+    def test_load_data_async_creation_failure(self):
+        loading_job_config = LoadingJobConfig(loading_job_name="test_job", files=[])
+        self.mock_tigergraph_api.gsql.return_value = "Using graph 'MyGraph'\nError"
+        with pytest.raises(RuntimeError):
+            self.data_manager.load_data_async(loading_job_config)
+        self.mock_tigergraph_api.gsql.assert_called_once()
@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import MagicMock
 
 from tigergraphx.core.managers.edge_manager import EdgeManager
+from tigergraphx.core.tigergraph_api.single_flight import SingleFlight
 
 from tigergraphx.config import (
     GraphSchema,
@@ -16,6 +17,7 @@ class TestEdgeManager:
     @pytest.fixture(autouse=True)
     def setup(self):
         self.mock_tigergraph_api = MagicMock()
+        self.mock_tigergraph_api.single_flight = SingleFlight()
 
         mock_context = MagicMock()
         mock_context.tigergraph_api = self.mock_tigergraph_api
@@ -103,6 +105,44 @@ class TestEdgeManager:
         )
         assert result is None
 
+    def test_remove_edges_in_chunks(self):
+        self.mock_tigergraph_api.run_interpreted_query.side_effect = [
+            [{"deleted": 2}],
+            [{"deleted": 1}],
+        ]
+
+        result = self.edge_manager.remove_edges(
+            [("a", "b"), ("a|x", "c"), ("d", "e")],
+            "MyNode",
+            "MyEdge",
+            "MyNode",
+            chunk_size=2,
+        )
+
+        calls = self.mock_tigergraph_api.run_interpreted_query.call_args_list
+        gsql_script, params = calls[0].args
+        assert "pairs.contains(s.name + separator + t.name)" in gsql_script
+        assert "DELETE (e)" in gsql_script
+        # The separator must not occur in any ID of the chunk
+        assert params == {
+            "sources": ["a", "a|x"],
+            "pairs": ["a\tb", "a|x\tc"],
+            "separator": "\t",
+        }
+        assert calls[1].args[1]["pairs"] == ["d|e"]
+        assert result == 3
+
+    def test_remove_edges_skips_reversed_undirected_duplicates(self):
+        self.mock_tigergraph_api.run_interpreted_query.return_value = [{"deleted": 1}]
+        self.edge_manager._graph_schema.edges["MyEdge"].is_directed_edge = False
+
+        self.edge_manager.remove_edges(
+            [("a", "b"), ("b", "a")], "MyNode", "MyEdge", "MyNode"
+        )
+
+        params = self.mock_tigergraph_api.run_interpreted_query.call_args.args[1]
+        assert params["pairs"] == ["a|b"]
+
     def test_has_edge_exists(self):
         src_node_id = "node1"
         tgt_node_id = "node2"
@@ -192,6 +232,47 @@ class TestEdgeManager:
         )
         assert result == {"since": 2021}
 
+    def test_get_edges_data(self):
+        def edge(from_id, to_id, **extra):
+            return {
+                "e_type": "Friend",
+                "directed": False,
+                "from_id": from_id,
+                "from_type": "Person",
+                "to_id": to_id,
+                "to_type": "Person",
+                "attributes": {"since": 2021},
+                **extra,
+            }
+
+        self.mock_tigergraph_api.run_interpreted_query.return_value = [
+            {
+                "edges": [
+                    edge("node2", "node1"),
+                    edge("node1", "node3"),
+                    edge("node4", "node3", discriminator="a"),
+                    edge("node4", "node3", discriminator="b"),
+                ]
+            }
+        ]
+
+        result = self.edge_manager.get_edges_data(
+            [("node1", "node2"), ("node4", "node3"), ("node1", "node5")],
+            "Person",
+            "Friend",
+            "Person",
+        )
+
+        _, params = self.mock_tigergraph_api.run_interpreted_query.call_args.args
+        assert params == {
+            "sources": ["node1", "node4"],
+            "targets": ["node2", "node3", "node5"],
+        }
+        assert result == {
+            ("node1", "node2"): {"since": 2021},
+            ("node4", "node3"): {"a": {"since": 2021}, "b": {"since": 2021}},
+        }
+
     def test_get_edge_data_no_edges(self):
         src_node_id = "node1"
         tgt_node_id = "node2"
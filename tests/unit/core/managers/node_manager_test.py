@@ -1,7 +1,10 @@
 import pytest
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 
 from tigergraphx.core.managers.node_manager import NodeManager
+from tigergraphx.core.tigergraph_api.single_flight import SingleFlight
 
 from tigergraphx.config import (
     GraphSchema,
@@ -17,8 +20,11 @@ class TestNodeManager:
         """Set up a mock context and NodeManager for all tests."""
         # Mocking the connection and graph schema
         self.mock_tigergraph_api = MagicMock()
+        self.mock_tigergraph_api.single_flight = SingleFlight()
         mock_context = MagicMock()
         mock_context.tigergraph_api = self.mock_tigergraph_api
+        mock_context.write_generation = 0
+        self.mock_context = mock_context
         mock_context.graph_schema = GraphSchema(
             graph_name="MyGraph",
             nodes={
@@ -117,6 +123,69 @@ class TestNodeManager:
         )
         assert result is False
 
+    def test_remove_nodes_in_chunks(self):
+        self.mock_tigergraph_api.run_interpreted_query.side_effect = [
+            [{"deleted": 2}],
+            [{"deleted": 1}],
+        ]
+
+        result = self.node_manager.remove_nodes(["a", "b", "c"], "MyNode", chunk_size=2)
+
+        calls = self.mock_tigergraph_api.run_interpreted_query.call_args_list
+        assert [c.args[1] for c in calls] == [{"input": ["a", "b"]}, {"input": ["c"]}]
+        assert "POST-ACCUM DELETE (s)" in calls[0].args[0]
+        assert result == 3
+
+    def test_remove_nodes_where_until_partial_chunk(self):
+        self.mock_tigergraph_api.run_interpreted_query.side_effect = [
+            [{"matched": 5}],
+            [{"deleted": 2}],
+            [{"deleted": 2}],
+            [{"deleted": 1}],
+        ]
+
+        result = self.node_manager.remove_nodes_where(
+            "MyNode", "s.value == false", chunk_size=2
+        )
+
+        gsql_script = self.mock_tigergraph_api.run_interpreted_query.call_args.args[0]
+        assert "WHERE s.value == false" in gsql_script
+        assert "LIMIT 2" in gsql_script
+        assert self.mock_tigergraph_api.run_interpreted_query.call_count == 4
+        assert result == 5
+
+    def test_remove_nodes_where_stops_after_matched_count(self):
+        # Deletions that never take effect must not loop forever
+        self.mock_tigergraph_api.run_interpreted_query.side_effect = [
+            [{"matched": 4}]
+        ] + [[{"deleted": 2}]] * 10
+
+        result = self.node_manager.remove_nodes_where(
+            "MyNode", "s.value == false", chunk_size=2
+        )
+
+        calls = self.mock_tigergraph_api.run_interpreted_query.call_args_list
+        assert "PRINT Nodes.size() AS matched" in calls[0].args[0]
+        assert len(calls) == 3
+        assert result == 4
+
+    def test_remove_nodes_where_without_matches(self):
+        self.mock_tigergraph_api.run_interpreted_query.return_value = [{"matched": 0}]
+        result = self.node_manager.remove_nodes_where("MyNode", "s.value == false")
+        self.mock_tigergraph_api.run_interpreted_query.assert_called_once()
+        assert result == 0
+
+    def test_remove_nodes_where_stops_on_error(self):
+        self.mock_tigergraph_api.run_interpreted_query.side_effect = [
+            [{"matched": 3}],
+            [{"deleted": 2}],
+            Exception("Error"),
+        ]
+        result = self.node_manager.remove_nodes_where(
+            "MyNode", "s.value == false", chunk_size=2
+        )
+        assert result == 2
+
     def test_has_node_exists(self):
         node_id = "node1"
         node_type = "Person"
@@ -140,6 +209,73 @@ class TestNodeManager:
         )
         assert result is False
 
+    def test_concurrent_identical_reads_are_coalesced(self):
+        release = threading.Event()
+
+        def retrieve_a_node(graph_name, node_type, node_id):
+            release.wait(timeout=5)
+            return [{"attributes": {"name": node_id}}]
+
+        self.mock_tigergraph_api.retrieve_a_node.side_effect = retrieve_a_node
+        single_flight = self.mock_tigergraph_api.single_flight
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(self.node_manager.get_node_data, "node1", "Person")
+                for _ in range(3)
+            ]
+            while single_flight.coalesced < 2:
+                release.wait(timeout=0.001)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert results == [{"name": "node1"}] * 3
+        self.mock_tigergraph_api.retrieve_a_node.assert_called_once_with(
+            "MyGraph", "Person", "node1"
+        )
+
+    def test_reads_after_a_write_are_not_coalesced_with_earlier_reads(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        def retrieve_a_node(graph_name, node_type, node_id):
+            started.set()
+            release.wait(timeout=5)
+            return [{"attributes": {"name": node_id}}]
+
+        self.mock_tigergraph_api.retrieve_a_node.side_effect = retrieve_a_node
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            before = executor.submit(self.node_manager.get_node_data, "node1", "Person")
+            started.wait(timeout=5)
+            self.mock_context.write_generation += 1
+            after = executor.submit(self.node_manager.get_node_data, "node1", "Person")
+            while self.mock_tigergraph_api.retrieve_a_node.call_count < 2:
+                release.wait(timeout=0.001)
+            release.set()
+            assert before.result() == after.result() == {"name": "node1"}
+
+        assert self.mock_tigergraph_api.single_flight.coalesced == 0
+
+    def test_get_nodes_data(self):
+        self.mock_tigergraph_api.run_interpreted_query.return_value = [
+            {
+                "Nodes": [
+                    {"v_id": "node1", "v_type": "Person", "attributes": {"age": 30}},
+                    {"v_id": "node2", "v_type": "Person", "attributes": {"age": 25}},
+                ]
+            }
+        ]
+
+        result = self.node_manager.get_nodes_data(["node1", "node2", "node3"], "Person")
+
+        gsql_script, params = (
+            self.mock_tigergraph_api.run_interpreted_query.call_args.args
+        )
+        assert "SET<VERTEX<Person>> input" in gsql_script
+        assert params == {"input": ["node1", "node2", "node3"]}
+        assert result == {"node1": {"age": 30}, "node2": {"age": 25}}
+
     def test_get_node_data_success(self):
         node_id = "node1"
         node_type = "Person"
@@ -162,6 +298,15 @@ class TestNodeManager:
         )
         assert result is None
 
+    def test_has_node_records_swallowed_error(self):
+        error = TimeoutError("Request timed out")
+        self.mock_tigergraph_api.retrieve_a_node.side_effect = error
+        result = self.node_manager.has_node("node1", "Person")
+        self.mock_tigergraph_api.record_swallowed_error.assert_called_once_with(
+            "has_node", error, log=True
+        )
+        assert result is False
+
     def test_get_node_edges_success(self):
         node_id = "node1"
         node_type = "Person"
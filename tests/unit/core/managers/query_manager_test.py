@@ -4,6 +4,7 @@ from unittest.mock import MagicMock
 import pandas as pd
 
 from tigergraphx.core.managers.query_manager import QueryManager
+from tigergraphx.core.tigergraph_api.single_flight import SingleFlight
 from tigergraphx.config import NodeSpec, EdgeSpec, NeighborSpec
 
 
@@ -11,6 +12,7 @@ class TestQueryManager:
     @pytest.fixture(autouse=True)
     def setup(self):
         self.mock_tigergraph_api = MagicMock()
+        self.mock_tigergraph_api.single_flight = SingleFlight()
         self.mock_tigergraph_api.run_installed_query_get = MagicMock()
         self.mock_tigergraph_api.run_interpreted_query = MagicMock()
 
@@ -1,12 +1,14 @@
 import pytest
 from unittest.mock import MagicMock
 from tigergraphx.core.managers.statistics_manager import StatisticsManager
+from tigergraphx.core.tigergraph_api.single_flight import SingleFlight
 
 
 class TestStatisticsManager:
     @pytest.fixture(autouse=True)
     def setup(self):
         self.mock_tigergraph_api = MagicMock()
+        self.mock_tigergraph_api.single_flight = SingleFlight()
         self.mock_tigergraph_api.run_interpreted_query = MagicMock()
         mock_context = MagicMock()
         mock_context.tigergraph_api = self.mock_tigergraph_api
@@ -39,6 +41,16 @@ class TestStatisticsManager:
         self.mock_tigergraph_api.run_interpreted_query.assert_called_once()
         assert result == 0
 
+    def test_degrees(self):
+        self.mock_tigergraph_api.run_interpreted_query.return_value = [
+            {"Nodes": [{"v_id": "node1", "attributes": {"degree": 3}}]}
+        ]
+        result = self.statistics_manager.degrees(["node1", "node2"], "Person", {"Friend"})
+        gsql_script, params = self.mock_tigergraph_api.run_interpreted_query.call_args.args
+        assert "FROM Nodes:s -(Friend)- :t" in gsql_script
+        assert params == {"input": ["node1", "node2"]}
+        assert result == {"node1": 3, "node2": 0}
+
     def test_number_of_nodes_single_type(self):
         node_type = "Person"
         self.mock_tigergraph_api.run_interpreted_query.return_value = [{"number_of_nodes": 5}]
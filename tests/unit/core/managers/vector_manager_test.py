@@ -9,12 +9,15 @@ from tigergraphx.config import (
     DataType,
 )
 from tigergraphx.core.managers.vector_manager import VectorManager
+from tigergraphx.core.tigergraph_api import TigerGraphAPIError
+from tigergraphx.core.tigergraph_api.single_flight import SingleFlight
 
 
 class TestVectorManager:
     @pytest.fixture(autouse=True)
     def setup(self):
         self.mock_tigergraph_api = MagicMock()
+        self.mock_tigergraph_api.single_flight = SingleFlight()
         self.mock_tigergraph_api.run_installed_query_get = MagicMock()
         self.mock_tigergraph_api.full_version = "4.2.0"
 
@@ -390,7 +393,7 @@ class TestVectorManager:
         return_attributes = [["name"], ["number"]]
         limit = 2
 
-        def mock_run_installed_query(graph_name, query_name, params):
+        def mock_run_installed_query(graph_name, query_name, params, idempotent=False):
             if "emb1" in query_name:
                 return [
                     {"map_node_distance": {"Account1": 0.1, "Account2": 0.2}},
@@ -464,7 +467,9 @@ class TestVectorManager:
         return_attributes = None  # All attributes will be returned
         limit = 2
 
-        def mock_run_installed_query(graph_name, query_name, params, usePost=True):
+        def mock_run_installed_query(
+            graph_name, query_name, params, usePost=True, idempotent=False
+        ):
             if "emb1" in query_name:
                 return [
                     {"map_node_distance": {"Account1": 0.1, "Account2": 0.2}},
@@ -841,6 +846,240 @@ class TestVectorManager:
         assert "name" in result[0]
         assert "value" not in result[0]
 
+    def test_search_with_filter_expression(self):
+        """
+        Test case for search with a filter expression pushed down to the server.
+        """
+        data = [-0.0177, -0.0101, -0.0165]
+        self.mock_tigergraph_api.run_interpreted_query.return_value = [
+            {"map_node_distance": {"Account1": 0.1}},
+            {
+                "Nodes": [
+                    {
+                        "v_id": "Account1",
+                        "attributes": {"name": "Scott", "value": True},
+                    },
+                ]
+            },
+        ]
+
+        result = self.vector_manager.search(
+            data,
+            "emb1",
+            "Account",
+            limit=3,
+            filter_expression="s.value == TRUE",
+        )
+
+        # Assert that the interpreted query is used instead of the installed one
+        self.mock_tigergraph_api.run_installed_query_post.assert_not_called()
+        gsql_script, params = self.mock_tigergraph_api.run_interpreted_query.call_args[
+            0
+        ]
+        assert "WHERE s.value == TRUE" in gsql_script
+        assert "{Account.*}" in gsql_script
+        assert params == {"k": 3, "query_vector": data}
+        assert result == [
+            {"id": "Account1", "distance": 0.1, "name": "Scott", "value": True}
+        ]
+
+    def test_create_gsql_search_with_filter_and_candidate_ids(self):
+        gsql_script, params = self.vector_manager._create_gsql_search(
+            vector_attribute_name="emb1",
+            node_type="Account",
+            limit=5,
+            data=[0.1, 0.2, 0.3],
+            candidate_ids={"Account1"},
+            filter_expression="n.value == TRUE",
+            node_alias="n",
+        )
+        expected_gsql_script = (
+            "INTERPRET QUERY(\n"
+            "  UINT k=10,\n"
+            "  LIST<FLOAT> query_vector,\n"
+            "  SET<VERTEX<Account>> set_candidate\n"
+            ") FOR GRAPH MyGraph SYNTAX v3 {\n"
+            "  MapAccum<Vertex, Float> @@map_node_distance;\n"
+            "\n"
+            "  Candidates = {set_candidate};\n"
+            "  Candidates =\n"
+            "    SELECT n\n"
+            "    FROM Candidates:n\n"
+            "    WHERE n.value == TRUE\n"
+            "  ;\n"
+            "  Nodes = Candidates;\n"
+            "  IF Candidates.size() > 0 THEN\n"
+            "    Nodes = vectorSearch(\n"
+            "      {Account.emb1},\n"
+            "      query_vector,\n"
+            "      k,\n"
+            "      { distance_map: @@map_node_distance, candidate_set: Candidates}\n"
+            "    );\n"
+            "  END;\n"
+            "\n"
+            "  PRINT @@map_node_distance AS map_node_distance;\n"
+            "  PRINT Nodes;\n"
+            "}"
+        )
+        assert gsql_script == expected_gsql_script
+        assert params == {
+            "k": 5,
+            "query_vector": [0.1, 0.2, 0.3],
+            "set_candidate": ["Account1"],
+        }
+
+    def test_search_batch(self):
+        self.mock_tigergraph_api.run_installed_query_post.return_value = [
+            {
+                "map_query_node_distance": {
+                    "0": {"Account2": 0.3, "Account1": 0.1},
+                    "1": {"Account3": 0.2},
+                }
+            }
+        ]
+
+        result = self.vector_manager.search_batch(
+            data=[[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]],
+            vector_attribute_name="emb1",
+            node_type="Account",
+            limit=2,
+        )
+
+        self.mock_tigergraph_api.run_installed_query_post.assert_called_once_with(
+            "MyGraph",
+            "api_search_batch_Account_emb1",
+            {
+                "k": 2,
+                "dimension": 3,
+                "query_vectors": [0.1, 0.2, 0.3, 0.4, 0.5, 0.6],
+            },
+            idempotent=True,
+        )
+        assert result == [
+            [
+                {"id": "Account1", "distance": 0.1},
+                {"id": "Account2", "distance": 0.3},
+            ],
+            [{"id": "Account3", "distance": 0.2}],
+        ]
+
+    def test_search_batch_falls_back_when_query_is_missing(self):
+        def mock_run_installed_query(graph_name, query_name, params, idempotent=False):
+            if query_name.startswith("api_search_batch_"):
+                raise TigerGraphAPIError("Query not found.")
+            vector_id = "Account1" if params["query_vector"][0] < 0.3 else "Account2"
+            return [
+                {"map_node_distance": {vector_id: 0.1, "Account3": 0.5}},
+                {
+                    "Nodes": [
+                        {"v_id": "Account3", "attributes": {"name": "Paul"}},
+                        {"v_id": vector_id, "attributes": {"name": "Scott"}},
+                    ]
+                },
+            ]
+
+        run_query = self.mock_tigergraph_api.run_installed_query_post
+        run_query.side_effect = mock_run_installed_query
+        self.mock_tigergraph_api.get_query_info.return_value = [
+            {"name": "api_search_Account_emb1", "installed": True}
+        ]
+
+        for _ in range(2):
+            result = self.vector_manager.search_batch(
+                data=[[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]],
+                vector_attribute_name="emb1",
+                node_type="Account",
+                limit=2,
+            )
+            assert result == [
+                [
+                    {"id": "Account1", "distance": 0.1},
+                    {"id": "Account3", "distance": 0.5},
+                ],
+                [
+                    {"id": "Account2", "distance": 0.1},
+                    {"id": "Account3", "distance": 0.5},
+                ],
+            ]
+
+        # The missing batch query is only tried once
+        query_names = [c.args[1] for c in run_query.call_args_list]
+        assert query_names == ["api_search_batch_Account_emb1"] + [
+            "api_search_Account_emb1"
+        ] * 4
+        self.mock_tigergraph_api.get_query_info.assert_called_once_with("MyGraph")
+
+    def test_search_batch_mismatched_dimensions(self):
+        result = self.vector_manager.search_batch(
+            data=[[0.1, 0.2, 0.3], [0.4, 0.5]],
+            vector_attribute_name="emb1",
+            node_type="Account",
+        )
+        self.mock_tigergraph_api.run_installed_query_post.assert_not_called()
+        assert result == [[], []]
+
+    def test_search_in_neighborhood(self):
+        data = [-0.0177, -0.0101, -0.0165]
+        self.mock_tigergraph_api.run_interpreted_query.return_value = [
+            {"map_node_distance": {"Account2": 0.2}},
+            {
+                "Nodes": [
+                    {
+                        "v_id": "Account2",
+                        "attributes": {"name": "Jenny", "value": False},
+                    },
+                ]
+            },
+        ]
+
+        result = self.vector_manager.search_in_neighborhood(
+            start_nodes="555-1234",
+            start_node_type="Phone",
+            data=data,
+            vector_attribute_name="emb1",
+            node_type="Account",
+            edge_type_set={"hasPhone"},
+            max_hops=2,
+            limit=3,
+            return_attributes=["name"],
+        )
+
+        gsql_script, params = self.mock_tigergraph_api.run_interpreted_query.call_args[
+            0
+        ]
+        assert "SET<VERTEX<Phone>> start_nodes" in gsql_script
+        assert "WHILE Frontier.size() > 0 LIMIT 2 DO" in gsql_script
+        assert "FROM Frontier:s -(hasPhone:e)- :t" in gsql_script
+        assert 'WHERE s.type == "Account"' in gsql_script
+        assert "{Account.emb1}" in gsql_script
+        assert params == {"k": 3, "query_vector": data, "start_nodes": ["555-1234"]}
+        assert result == [{"id": "Account2", "distance": 0.2, "name": "Jenny"}]
+
+    def test_search_in_neighborhood_with_filter_expression(self):
+        gsql_script, _ = self.vector_manager._create_gsql_search_in_neighborhood(
+            start_nodes=["555-1234"],
+            start_node_type="Phone",
+            data=[0.1, 0.2, 0.3],
+            vector_attribute_name="emb1",
+            node_type="Account",
+            filter_expression="n.value == TRUE",
+            node_alias="n",
+        )
+        assert "FROM Frontier:s -(:e)- :t" in gsql_script
+        assert 'WHERE n.type == "Account" AND (n.value == TRUE)' in gsql_script
+
+    def test_search_in_neighborhood_invalid_max_hops(self):
+        result = self.vector_manager.search_in_neighborhood(
+            start_nodes="555-1234",
+            start_node_type="Phone",
+            data=[0.1, 0.2, 0.3],
+            vector_attribute_name="emb1",
+            node_type="Account",
+            max_hops=0,
+        )
+        self.mock_tigergraph_api.run_interpreted_query.assert_not_called()
+        assert result == []
+
     def test_search_with_empty_return_attributes(self):
         """
         Test case where return_attributes is an empty list.
@@ -0,0 +1,84 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+
+from tigergraphx.core.point_read_batcher import PointReadBatcher
+
+
+class TestPointReadBatcher:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.graph = MagicMock()
+        self.graph.get_nodes_data.side_effect = lambda ids, node_type: {
+            node_id: {"id": node_id} for node_id in ids if node_id != "missing"
+        }
+        self.graph.degrees.side_effect = lambda ids, node_type, edge_types: {
+            node_id: len(node_id) for node_id in ids
+        }
+        self.graph.get_edges_data.side_effect = lambda edges, s, e, t: {
+            ("a", "b"): {"weight": 1.0}
+        }
+
+    def test_concurrent_lookups_share_one_query(self):
+        batcher = PointReadBatcher(self.graph)
+
+        async def main():
+            return await asyncio.gather(
+                batcher.has_node("Alice"),
+                batcher.get_node_data("Bob"),
+                batcher.has_node("missing"),
+                batcher.get_node_data("Bob"),
+            )
+
+        results = asyncio.run(main())
+
+        assert results == [True, {"id": "Bob"}, False, {"id": "Bob"}]
+        assert results[1] is not results[3]
+        self.graph.get_nodes_data.assert_called_once_with(
+            ["Alice", "Bob", "missing"], None
+        )
+        assert batcher.batches == 1
+        assert batcher.loads == 4
+
+    def test_lookups_are_batched_per_kind_and_type(self):
+        batcher = PointReadBatcher(self.graph)
+
+        async def main():
+            return await asyncio.gather(
+                batcher.degree("ab"),
+                batcher.degree("abc"),
+                batcher.degree("x", edge_types=["knows"]),
+                batcher.get_edge_data("a", "b"),
+                batcher.has_edge("b", "c"),
+            )
+
+        assert asyncio.run(main()) == [2, 3, 1, {"weight": 1.0}, False]
+        assert self.graph.degrees.call_count == 2
+        self.graph.degrees.assert_any_call(["ab", "abc"], None, None)
+        self.graph.degrees.assert_any_call(["x"], None, ["knows"])
+        self.graph.get_edges_data.assert_called_once_with(
+            [("a", "b"), ("b", "c")], None, None, None
+        )
+
+    def test_max_batch_size_sends_batch_early(self):
+        batcher = PointReadBatcher(self.graph, batch_window=10, max_batch_size=2)
+
+        async def main():
+            return await asyncio.wait_for(
+                asyncio.gather(batcher.has_node("a"), batcher.has_node("b")),
+                timeout=1,
+            )
+
+        assert asyncio.run(main()) == [True, True]
+
+    def test_errors_reach_every_caller(self):
+        self.graph.get_nodes_data.side_effect = ValueError("Invalid node type")
+        batcher = PointReadBatcher(self.graph)
+
+        async def main():
+            return await asyncio.gather(
+                batcher.has_node("a"), batcher.has_node("b"), return_exceptions=True
+            )
+
+        results = asyncio.run(main())
+        assert all(isinstance(r, ValueError) for r in results)
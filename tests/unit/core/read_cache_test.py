@@ -0,0 +1,63 @@
+import pandas as pd
+from unittest.mock import MagicMock, patch
+
+from tigergraphx.core.read_cache import ReadCache
+
+
+class TestReadCache:
+    def test_get_or_load_caches_result(self):
+        cache = ReadCache()
+        load = MagicMock(return_value={"name": "Alice"})
+
+        assert cache.get_or_load("key", load) == {"name": "Alice"}
+        assert cache.get_or_load("key", load) == {"name": "Alice"}
+        load.assert_called_once()
+        assert cache.metrics["hits"] == 1
+        assert cache.metrics["misses"] == 1
+        assert cache.metrics["memory_bytes"] > 0
+
+    def test_uncacheable_result_is_not_stored(self):
+        cache = ReadCache()
+        load = MagicMock(side_effect=[[], [{"name": "Alice"}]])
+
+        assert cache.get_or_load("key", load, cacheable=lambda: False) == []
+        assert cache.get_or_load("key", load) == [{"name": "Alice"}]
+        assert cache.get_or_load("key", load) == [{"name": "Alice"}]
+        assert load.call_count == 2
+
+    def test_results_are_copied(self):
+        cache = ReadCache()
+        df = pd.DataFrame({"name": ["Alice"]})
+        result = cache.get_or_load("key", lambda: df)
+        result.loc[0, "name"] = "Mallory"
+
+        assert cache.get_or_load("key", lambda: None).loc[0, "name"] == "Alice"
+
+    def test_lru_eviction(self):
+        cache = ReadCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get_or_load("a", lambda: None)
+        cache.set("c", 3)
+
+        assert len(cache) == 2
+        assert cache.get_or_load("b", lambda: "reloaded") == "reloaded"
+        assert cache.metrics["evictions"] >= 1
+
+    def test_ttl_expiry(self):
+        cache = ReadCache(ttl=10)
+        with patch("tigergraphx.core.read_cache.time.monotonic") as mock_time:
+            mock_time.return_value = 100.0
+            cache.set("key", "old")
+            mock_time.return_value = 111.0
+            assert cache.get_or_load("key", lambda: "new") == "new"
+
+    def test_clear_discards_racing_load(self):
+        cache = ReadCache()
+
+        def load():
+            cache.clear()
+            return "stale"
+
+        assert cache.get_or_load("key", load) == "stale"
+        assert len(cache) == 0
@@ -14,7 +14,9 @@ from requests.exceptions import (
     RequestException,
 )
 from tigergraphx.core.tigergraph_api.api.base_api import BaseAPI, TigerGraphAPIError
+from tigergraphx.core.tigergraph_api.host_pool import HostPool
 from tigergraphx.config import TigerGraphConnectionConfig
+from tigergraphx.utils import CircuitOpenError, RetryPolicy
 
 
 class TestBaseAPI:
@@ -39,6 +41,7 @@ class TestBaseAPI:
                 "path": f"/gsql/v1/schema/graphs/{graph_name}",
                 "method": "GET",
                 "port": "gsql_port",
+                "idempotent": name != "gsql",
             }
 
         mock_registry.get_endpoint.side_effect = get_endpoint
@@ -182,7 +185,144 @@ class TestBaseAPI:
         mock_response.status_code = 400
         mock_session.request.return_value = mock_response
 
-        with pytest.raises(
-            TigerGraphAPIError, match="Graph does not exist."
-        ):
+        with pytest.raises(TigerGraphAPIError, match="Graph does not exist."):
             base_api._request("get_schema", "4.x", graph="InvalidGraph")
+
+    def test_request_retries_with_retry_policy(self, base_api, mock_session):
+        """Test that retryable failures are retried when a retry policy is set."""
+        base_api.retry_policy = RetryPolicy(max_wait=0.01, failure_threshold=None)
+        mock_response = MagicMock()
+        mock_response.headers = {"Content-Type": "text/plain"}
+        mock_response.status_code = 200
+        mock_response.text = "pong"
+        mock_session.request.side_effect = [
+            ConnectionError("Connection reset"),
+            mock_response,
+        ]
+
+        assert base_api._request("ping") == "pong"
+        assert mock_session.request.call_count == 2
+
+    def test_request_does_not_retry_fatal_errors(self, base_api, mock_session):
+        """Test that fatal failures are raised without retrying."""
+        base_api.retry_policy = RetryPolicy(max_wait=0.01, failure_threshold=None)
+        mock_session.request.side_effect = URLRequired("missing url")
+
+        with pytest.raises(ValueError):
+            base_api._request("ping")
+        assert mock_session.request.call_count == 1
+
+    def test_request_does_not_retry_non_idempotent_endpoints(
+        self, base_api, mock_session
+    ):
+        """Test that non-idempotent endpoints are sent only once."""
+        base_api.retry_policy = RetryPolicy(max_wait=0.01, failure_threshold=None)
+        mock_session.request.side_effect = ConnectionError("Connection reset")
+
+        with pytest.raises(ConnectionError):
+            base_api._request("gsql")
+        assert mock_session.request.call_count == 1
+
+    def test_request_idempotent_overrides_endpoint(self, base_api, mock_session):
+        """Test that callers can mark a single request as safe to retry or not."""
+        base_api.config.max_retries = 2
+        base_api.retry_policy = RetryPolicy(max_wait=0.01, failure_threshold=None)
+        mock_session.request.side_effect = ConnectionError("Connection reset")
+
+        with pytest.raises(ConnectionError):
+            base_api._request("gsql", idempotent=True)
+        assert mock_session.request.call_count == 3
+
+        mock_session.request.reset_mock()
+        with pytest.raises(ConnectionError):
+            base_api._request("ping", idempotent=False)
+        assert mock_session.request.call_count == 1
+
+    def test_request_retries_up_to_max_retries(self, base_api, mock_session):
+        """Test that idempotent endpoints are retried max_retries times."""
+        base_api.config.max_retries = 2
+        base_api.retry_policy = RetryPolicy(max_wait=0.01, failure_threshold=None)
+        mock_session.request.side_effect = ConnectionError("Connection reset")
+
+        with pytest.raises(ConnectionError):
+            base_api._request("ping")
+        assert mock_session.request.call_count == 3
+
+    def test_request_fails_fast_when_host_circuit_is_open(self, base_api, mock_session):
+        """Test that an open circuit rejects requests to the host."""
+        base_api.config.max_retries = 0
+        base_api.retry_policy = RetryPolicy(
+            max_wait=0.01, failure_threshold=2, reset_timeout=60
+        )
+        mock_session.request.side_effect = ConnectionError("Connection reset")
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                base_api._request("ping")
+
+        with pytest.raises(CircuitOpenError):
+            base_api._request("get_schema")
+        assert mock_session.request.call_count == 2
+
+    def test_request_balances_restpp_requests_only(
+        self, base_api, mock_session, mock_registry
+    ):
+        """Test that REST++ requests use the host pool and GSQL requests do not."""
+        base_api.host_pool = HostPool(["http://a", "http://b"])
+        mock_registry.get_endpoint.side_effect = lambda name, version, **kwargs: {
+            "path": "/restpp/version" if name == "get_version" else "/gsql/v1/version",
+            "method": "GET",
+            "port": "gsql_port",
+        }
+        mock_response = MagicMock()
+        mock_response.headers = {"Content-Type": "text/plain"}
+        mock_response.status_code = 200
+        mock_response.text = "ok"
+        mock_session.request.return_value = mock_response
+
+        for name in ["get_version", "get_version", "get_gsql_version"]:
+            base_api._request(name)
+
+        urls = [call.kwargs["url"] for call in mock_session.request.call_args_list]
+        assert urls == [
+            "http://a:14240/restpp/version",
+            "http://b:14240/restpp/version",
+            "http://127.0.0.1:14240/gsql/v1/version",
+        ]
+
+    def test_request_pinned_failures_do_not_eject_hosts(self, base_api, mock_session):
+        """Test that failures of requests to the configured host skip the pool."""
+        host = str(base_api.config.host)
+        base_api.host_pool = HostPool([host], ejection_threshold=1)
+        mock_session.request.side_effect = ConnectionError("Connection reset")
+
+        with pytest.raises(ConnectionError):
+            base_api._request("get_schema")
+        assert base_api.host_pool.healthy_hosts == [host]
+
+    def test_request_retries_on_another_host(
+        self, base_api, mock_session, mock_registry
+    ):
+        """Test that each retry of a load balanced request chooses a host again."""
+        base_api.host_pool = HostPool(["http://a", "http://b"])
+        base_api.retry_policy = RetryPolicy(max_wait=0.01, failure_threshold=None)
+        mock_registry.get_endpoint.side_effect = lambda name, version, **kwargs: {
+            "path": "/restpp/version",
+            "method": "GET",
+            "port": "gsql_port",
+            "idempotent": True,
+        }
+        mock_response = MagicMock()
+        mock_response.headers = {"Content-Type": "text/plain"}
+        mock_response.status_code = 200
+        mock_response.text = "ok"
+        mock_session.request.side_effect = [
+            ConnectionError("Connection reset"),
+            mock_response,
+        ]
+
+        assert base_api._request("get_version") == "ok"
+        urls = [call.kwargs["url"] for call in mock_session.request.call_args_list]
+        assert urls == [
+            "http://a:14240/restpp/version",
+            "http://b:14240/restpp/version",
+        ]
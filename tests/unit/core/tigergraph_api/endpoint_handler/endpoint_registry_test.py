@@ -101,3 +101,22 @@ class TestEndpointRegistry:
             match="Port not defined for version '4.x' in endpoint 'set_schema'.",
         ):
             registry.get_endpoint("set_schema", version="4.x", graph="MyGraph")
+
+    def test_idempotent_flag(self, mock_config, create_temp_yaml):
+        """Test that endpoints inherit the default idempotent flag."""
+        yaml_content = {
+            "endpoints": {
+                "retrieve": {"path": "/restpp/retrieve", "idempotent": True},
+                "drop": {"path": "/restpp/drop", "method": "DELETE"},
+            },
+            "defaults": {
+                "idempotent": False,
+                "method": "GET",
+                "port": "gsql_port",
+            },
+        }
+        yaml_file = create_temp_yaml(yaml_content)
+        registry = EndpointRegistry(endpoint_path=Path(yaml_file), config=mock_config)
+
+        assert registry.get_endpoint("retrieve")["idempotent"] is True
+        assert registry.get_endpoint("drop")["idempotent"] is False
@@ -0,0 +1,104 @@
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock
+
+from tigergraphx.core.tigergraph_api.host_pool import HostPool
+
+HOSTS = ["http://a", "http://b", "http://c"]
+
+
+def wait_for_probes(pool, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while any(h.probing for h in pool._hosts):
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+class TestHostPool:
+    def test_round_robin(self):
+        pool = HostPool(HOSTS)
+        assert [pool.select() for _ in range(6)] == HOSTS * 2
+
+    def test_least_outstanding(self):
+        pool = HostPool(HOSTS, load_balancing="least_outstanding")
+        with pool.track("http://a"), pool.track("http://b"):
+            assert pool.select() == "http://c"
+        with pool.track("http://a"), pool.track("http://c"):
+            assert pool.select() == "http://b"
+
+    def test_latency(self):
+        pool = HostPool(HOSTS, load_balancing="latency")
+        for host, latency in zip(HOSTS, [0.3, 0.1, 0.2]):
+            pool._states[host].latency = latency
+        assert [pool.select() for _ in range(3)] == ["http://b"] * 3
+
+    def test_track_records_latency_on_success_only(self):
+        pool = HostPool(HOSTS)
+        with pytest.raises(RuntimeError):
+            with pool.track("http://a"):
+                raise RuntimeError("boom")
+        assert pool._states["http://a"].latency is None
+        with pool.track("http://a"):
+            pass
+        assert pool._states["http://a"].latency is not None
+        assert pool._states["http://a"].outstanding == 0
+
+    def test_ejects_failing_host(self):
+        pool = HostPool(HOSTS, ejection_threshold=2, ejection_duration=60)
+        pool.record_failure("http://b")
+        pool.record_success("http://b")
+        pool.record_failure("http://b")
+        assert pool.healthy_hosts == HOSTS
+
+        pool.record_failure("http://b")
+        assert pool.healthy_hosts == ["http://a", "http://c"]
+        assert "http://b" not in {pool.select() for _ in range(6)}
+
+    def test_restores_host_after_successful_health_check(self):
+        health_check = MagicMock(side_effect=[False, True])
+        pool = HostPool(
+            HOSTS, ejection_threshold=1, ejection_duration=0, health_check=health_check
+        )
+        pool.record_failure("http://a")
+
+        pool.select()
+        wait_for_probes(pool)
+        assert health_check.call_count == 1
+        assert pool._states["http://a"].ejected_until is not None
+
+        pool.select()
+        wait_for_probes(pool)
+        assert health_check.call_count == 2
+        assert pool._states["http://a"].ejected_until is None
+
+    def test_select_does_not_wait_for_health_check(self):
+        release = threading.Event()
+        health_check = MagicMock(side_effect=lambda host: release.wait(5))
+        pool = HostPool(
+            HOSTS, ejection_threshold=1, ejection_duration=0, health_check=health_check
+        )
+        pool.record_failure("http://a")
+
+        # The host is skipped while its health check runs, and checked only once
+        assert "http://a" not in {pool.select() for _ in range(6)}
+        release.set()
+        wait_for_probes(pool)
+        assert health_check.call_count == 1
+        assert pool.healthy_hosts == HOSTS
+
+    def test_all_hosts_ejected(self):
+        pool = HostPool(HOSTS[:2], ejection_threshold=1, ejection_duration=60)
+        pool.record_failure("http://b")
+        pool.record_failure("http://a")
+        assert pool.healthy_hosts == []
+        assert pool.select() == "http://b"
+
+    def test_check_health(self):
+        pool = HostPool(HOSTS, health_check=lambda host: host != "http://c")
+        assert pool.check_health() == {
+            "http://a": True,
+            "http://b": True,
+            "http://c": False,
+        }
+        assert pool.healthy_hosts == ["http://a", "http://b"]
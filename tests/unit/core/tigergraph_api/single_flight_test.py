@@ -0,0 +1,69 @@
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+from tigergraphx.core.tigergraph_api.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    def test_concurrent_threads_share_one_call(self):
+        single_flight = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def fetch():
+            calls.append(1)
+            release.wait(timeout=5)
+            return [{"v_id": "Alice"}]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(single_flight.do, ("node", {"id": "Alice"}), fetch)
+                for _ in range(4)
+            ]
+            while single_flight.coalesced < 3:
+                time.sleep(0.001)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert len(calls) == 1
+        assert results == [[{"v_id": "Alice"}]] * 4
+        # Every caller receives its own copy of a shared result
+        assert len({id(r) for r in results}) == 4
+
+    def test_sequential_calls_are_not_cached(self):
+        single_flight = SingleFlight()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return len(calls)
+
+        assert single_flight.do("key", fetch) == 1
+        assert single_flight.do("key", fetch) == 2
+        assert single_flight.coalesced == 0
+
+    def test_errors_are_shared(self):
+        single_flight = SingleFlight()
+        release = threading.Event()
+
+        def fetch():
+            release.wait(timeout=5)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(single_flight.do, "key", fetch) for _ in range(2)
+            ]
+            while single_flight.coalesced < 1:
+                time.sleep(0.001)
+            release.set()
+            for future in futures:
+                with pytest.raises(ValueError, match="boom"):
+                    future.result()
+
+    def test_unhashable_key_is_not_coalesced(self):
+        single_flight = SingleFlight()
+        assert single_flight.do(("key", object), lambda: 1) == 1
+        assert single_flight.do(["key", {"a": [1, {2}]}], lambda: 2) == 2
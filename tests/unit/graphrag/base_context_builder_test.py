@@ -0,0 +1,100 @@
+import pytest
+import numpy as np
+import pandas as pd
+from unittest.mock import MagicMock
+
+from tigergraphx.graphrag import BaseContextBuilder
+
+
+class FakeEncoder:
+    """Counts one token per whitespace-separated word, never more than bytes."""
+
+    def __init__(self):
+        self.encoded_texts = 0
+
+    def encode(self, text):
+        self.encoded_texts += 1
+        return text.split()
+
+    def encode_batch(self, texts):
+        return [self.encode(text) for text in texts]
+
+
+class ContextBuilder(BaseContextBuilder):
+    async def build_context(self, *args, **kwargs):
+        return ""
+
+
+def reference_batches(graph_data, section_name, single_batch, max_tokens, encoder):
+    """The previous row-by-row implementation."""
+    header = f"-----{section_name}-----\n" + "|".join(graph_data.columns) + "\n"
+    header_tokens = len(encoder.encode(header))
+    batches = []
+    current_batch = header
+    current_tokens = header_tokens
+    for row in graph_data.values:
+        row = "|".join(str(value) for value in row)
+        row_tokens = len(encoder.encode(row))
+        if current_tokens + row_tokens > max_tokens:
+            batches.append(current_batch.strip())
+            if single_batch:
+                return batches[0]
+            current_batch = header + row + "\n"
+            current_tokens = header_tokens + row_tokens
+        else:
+            current_batch += row + "\n"
+            current_tokens += row_tokens
+    batches.append(current_batch.strip())
+    return batches[0] if single_batch else batches
+
+
+class TestBaseContextBuilder:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.encoder = FakeEncoder()
+        self.builder = ContextBuilder(graph=MagicMock(), token_encoder=self.encoder)
+        rng = np.random.default_rng(0)
+        words = ["alpha", "beta", "gamma", "delta epsilon", "zeta eta theta iota"]
+        self.data = pd.DataFrame(
+            {
+                "id": [f"n{i}" for i in range(3000)],
+                "description": [
+                    " ".join(rng.choice(words, size=rng.integers(1, 30)))
+                    for _ in range(3000)
+                ],
+            }
+        )
+
+    @pytest.mark.parametrize("single_batch", [True, False])
+    @pytest.mark.parametrize("estimate_by_bytes", [True, False])
+    @pytest.mark.parametrize("max_tokens", [5, 300, 12000, 10**6])
+    def test_matches_reference(self, single_batch, estimate_by_bytes, max_tokens):
+        result = self.builder.batch_and_convert_to_text(
+            self.data,
+            "Entities",
+            single_batch=single_batch,
+            max_tokens=max_tokens,
+            estimate_by_bytes=estimate_by_bytes,
+        )
+        assert result == reference_batches(
+            self.data, "Entities", single_batch, max_tokens, FakeEncoder()
+        )
+
+    def test_empty_section(self):
+        result = self.builder.batch_and_convert_to_text(
+            self.data.head(0), "Entities", single_batch=False
+        )
+        assert result == ["-----Entities-----\nid|description"]
+
+    def test_single_batch_stops_early(self):
+        self.builder.batch_and_convert_to_text(
+            self.data, "Entities", single_batch=True, max_tokens=300
+        )
+        assert self.encoder.encoded_texts < len(self.data) // 2
+
+    def test_byte_estimate_skips_encoding_rows(self):
+        self.builder.batch_and_convert_to_text(
+            self.data, "Entities", single_batch=True, max_tokens=10**6
+        )
+        # Only the header is encoded when every row fits by its byte length
+        assert self.encoder.encoded_texts == 1
@@ -0,0 +1,95 @@
+import asyncio
+import pytest
+
+from tigergraphx.graphrag import MapReduceExecutor
+
+
+class FakeEncoder:
+    """Counts one token per whitespace-separated word."""
+
+    def encode_batch(self, texts):
+        return [text.split() for text in texts]
+
+
+def point(description, score):
+    return {"description": description, "score": score}
+
+
+class TestMapReduceExecutor:
+    def test_map_bounds_concurrency(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def map_fn(item):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [point(f"p{item}", item)]
+
+        executor = MapReduceExecutor(max_concurrency=3)
+        result = asyncio.run(executor.run(list(range(10)), map_fn))
+
+        assert max_in_flight == 3
+        assert [p["score"] for p in result.points] == list(range(9, -1, -1))
+        assert result.mapped_items == 10
+        assert result.skipped_items == 0
+        assert set(result.timings) == {"map", "reduce", "total"}
+
+    def test_map_stops_after_enough_points(self):
+        async def map_fn(item):
+            return [point(f"p{item}", 80), point(f"q{item}", 10)]
+
+        executor = MapReduceExecutor(max_concurrency=1, enough_points=3, min_score=50)
+        result = asyncio.run(executor.run(list(range(10)), map_fn))
+
+        assert result.mapped_items == 3
+        assert result.skipped_items == 7
+        assert len(result.points) == 6
+
+    def test_map_error_is_raised(self):
+        async def map_fn(item):
+            if item == 2:
+                raise RuntimeError("boom")
+            await asyncio.sleep(0.01)
+            return []
+
+        executor = MapReduceExecutor(max_concurrency=2)
+        with pytest.raises(RuntimeError, match="boom"):
+            asyncio.run(executor.run(list(range(5)), map_fn))
+
+    def test_tree_reduction(self):
+        reduced_groups = []
+
+        async def map_fn(item):
+            return [point(f"word{item} " * 5, item)]
+
+        async def reduce_fn(text):
+            reduced_groups.append(text)
+            return [point("summary", len(reduced_groups))]
+
+        executor = MapReduceExecutor(token_budget=20, token_encoder=FakeEncoder())
+        result = asyncio.run(executor.run(list(range(8)), map_fn, reduce_fn))
+
+        # Eight points of 7 tokens each are reduced in groups of two
+        assert len(reduced_groups) == 4
+        assert result.reduce_levels == 1
+        assert [p["description"] for p in result.points] == ["summary"] * 4
+        assert executor._num_tokens(result.points) <= 20
+
+    def test_truncation_without_reduce_fn(self):
+        async def map_fn(item):
+            return [point(f"word{item} " * 5, item)]
+
+        executor = MapReduceExecutor(token_budget=20, token_encoder=FakeEncoder())
+        result = asyncio.run(executor.run(list(range(8)), map_fn))
+
+        assert [p["score"] for p in result.points] == [7, 6]
+        assert result.reduce_levels == 0
+
+    def test_format_points(self):
+        executor = MapReduceExecutor()
+        assert executor.format_points([point("a", 3), point("b", 1)]) == (
+            "a (Score: 3)\nb (Score: 1)"
+        )
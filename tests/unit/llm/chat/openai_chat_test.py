@@ -1,10 +1,14 @@
 import pytest
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock
+from tenacity import AsyncRetrying, stop_after_attempt
 
 from tigergraphx.config import OpenAIChatConfig
 from tigergraphx.llm import (
     OpenAIManager,
     OpenAIChat,
+    InMemoryResponseCache,
+    DiskResponseCache,
 )
 
 
@@ -64,3 +68,189 @@ class TestOpenAIChat:
         openai_chat.llm.chat.completions.create.assert_awaited_once_with(
             messages=messages, model="gpt-4"
         )
+
+    @pytest.mark.asyncio
+    async def test_chat_uses_response_cache(self, openai_chat):
+        """Test that repeated messages are answered from the response cache."""
+        openai_chat.cache = InMemoryResponseCache()
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="Cached"))]
+        openai_chat.llm.chat.completions.create = AsyncMock(return_value=mock_response)
+        messages = [{"role": "user", "content": "Tell me a joke."}]
+
+        assert await openai_chat.chat(messages, temperature=0) == "Cached"
+        assert await openai_chat.chat(messages, temperature=0) == "Cached"
+        assert await openai_chat.chat(messages, seed=7) == "Cached"
+        assert await openai_chat.chat(messages, seed=7) == "Cached"
+        hi = [{"role": "user", "content": "Hi"}]
+        assert await openai_chat.chat(hi, temperature=0) == "Cached"
+
+        assert openai_chat.llm.chat.completions.create.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_chat_does_not_cache_sampled_responses(self, openai_chat):
+        """Test that requests without temperature 0 or a seed bypass the cache."""
+        openai_chat.cache = InMemoryResponseCache()
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="Sampled"))]
+        openai_chat.llm.chat.completions.create = AsyncMock(return_value=mock_response)
+        messages = [{"role": "user", "content": "Tell me a joke."}]
+
+        await openai_chat.chat(messages)
+        await openai_chat.chat(messages)
+        await openai_chat.chat(messages, temperature=0.7)
+
+        assert openai_chat.llm.chat.completions.create.await_count == 3
+        assert len(openai_chat.cache) == 0
+
+    def test_cache_from_config(self, mock_llm_manager, tmp_path):
+        """Test that the response cache backend is created from the configuration."""
+        memory_chat = OpenAIChat(
+            mock_llm_manager, OpenAIChatConfig(cache_type="memory")
+        )
+        disk_chat = OpenAIChat(
+            mock_llm_manager,
+            OpenAIChatConfig(cache_type="disk", cache_file=tmp_path / "chat.sqlite"),
+        )
+
+        assert isinstance(memory_chat.cache, InMemoryResponseCache)
+        assert isinstance(disk_chat.cache, DiskResponseCache)
+        assert OpenAIChat(mock_llm_manager, OpenAIChatConfig()).cache is None
+
+
+def make_stream(*deltas, error=None, events=None):
+    """Build an async completion stream yielding the given content deltas."""
+
+    async def stream():
+        try:
+            for delta in deltas:
+                yield MagicMock(choices=[MagicMock(delta=MagicMock(content=delta))])
+            if error is not None:
+                raise error
+        finally:
+            if events is not None:
+                events.append("closed")
+
+    return stream()
+
+
+class TestOpenAIChatStream:
+    """Test suite for OpenAIChat.chat_stream."""
+
+    @pytest.fixture
+    def openai_chat(self):
+        manager = MagicMock(spec=OpenAIManager)
+        manager.get_llm.return_value = MagicMock()
+        chat_instance = OpenAIChat(manager, OpenAIChatConfig(model="gpt-4"))
+        chat_instance.retryer = AsyncRetrying(stop=stop_after_attempt(3), reraise=True)
+        return chat_instance
+
+    @pytest.mark.asyncio
+    async def test_chat_stream(self, openai_chat):
+        openai_chat.llm.chat.completions.create = AsyncMock(
+            return_value=make_stream("Hello", None, ", ", "world")
+        )
+        messages = [{"role": "user", "content": "Hi"}]
+
+        deltas = [delta async for delta in openai_chat.chat_stream(messages)]
+
+        assert deltas == ["Hello", ", ", "world"]
+        openai_chat.llm.chat.completions.create.assert_awaited_once_with(
+            messages=messages, model="gpt-4", stream=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_retries_before_first_delta(self, openai_chat):
+        openai_chat.llm.chat.completions.create = AsyncMock(
+            side_effect=[
+                RuntimeError("connection reset"),
+                make_stream(error=RuntimeError("stream closed")),
+                make_stream("ok"),
+            ]
+        )
+
+        deltas = [delta async for delta in openai_chat.chat_stream([])]
+
+        assert deltas == ["ok"]
+        assert openai_chat.llm.chat.completions.create.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_does_not_retry_after_first_delta(self, openai_chat):
+        openai_chat.llm.chat.completions.create = AsyncMock(
+            return_value=make_stream("partial", error=RuntimeError("stream closed"))
+        )
+
+        deltas = []
+        with pytest.raises(RuntimeError, match="stream closed"):
+            async for delta in openai_chat.chat_stream([]):
+                deltas.append(delta)
+
+        assert deltas == ["partial"]
+        openai_chat.llm.chat.completions.create.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_fills_response_cache(self, openai_chat):
+        openai_chat.cache = InMemoryResponseCache()
+        openai_chat.llm.chat.completions.create = AsyncMock(
+            return_value=make_stream("a", "b")
+        )
+        messages = [{"role": "user", "content": "Hi"}]
+
+        stream = openai_chat.chat_stream
+        assert [d async for d in stream(messages, temperature=0)] == ["a", "b"]
+        assert [d async for d in stream(messages, temperature=0)] == ["ab"]
+        openai_chat.llm.chat.completions.create.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_holds_slot_until_exhausted(self, openai_chat):
+        events = []
+
+        @asynccontextmanager
+        async def limit(tokens=0):
+            events.append("acquired")
+            yield
+            events.append("released")
+
+        openai_chat.rate_limiter.limit = limit
+        openai_chat.llm.chat.completions.create = AsyncMock(
+            return_value=make_stream("a", "b", events=events)
+        )
+
+        async for delta in openai_chat.chat_stream([]):
+            events.append(delta)
+
+        assert events == ["acquired", "a", "b", "closed", "released"]
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_closes_stream_when_stopped_early(self, openai_chat):
+        events = []
+        openai_chat.llm.chat.completions.create = AsyncMock(
+            side_effect=[
+                make_stream(error=RuntimeError("stream closed"), events=events),
+                make_stream("a", "b", events=events),
+            ]
+        )
+
+        stream = openai_chat.chat_stream([])
+        assert await stream.__anext__() == "a"
+        # The failed attempt's stream is closed before the retry
+        assert events == ["closed"]
+        await stream.aclose()
+
+        assert events == ["closed", "closed"]
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_request_options_in_cache_key(self, openai_chat):
+        openai_chat.cache = InMemoryResponseCache()
+        openai_chat.llm.chat.completions.create = AsyncMock(
+            side_effect=[make_stream("cold"), make_stream("warm")]
+        )
+        messages = [{"role": "user", "content": "Hi"}]
+
+        cold = [d async for d in openai_chat.chat_stream(messages, seed=1)]
+        warm = [d async for d in openai_chat.chat_stream(messages, seed=2)]
+
+        assert (cold, warm) == (["cold"], ["warm"])
+        openai_chat.llm.chat.completions.create.assert_awaited_with(
+            messages=messages, model="gpt-4", stream=True, seed=2
+        )
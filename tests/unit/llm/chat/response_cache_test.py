@@ -0,0 +1,73 @@
+import pytest
+
+from tigergraphx.llm import (
+    BaseResponseCache,
+    InMemoryResponseCache,
+    DiskResponseCache,
+)
+
+
+@pytest.fixture(params=["memory", "disk"])
+def make_cache(request, tmp_path):
+    def make(**kwargs):
+        if request.param == "memory":
+            return InMemoryResponseCache(**kwargs)
+        return DiskResponseCache(tmp_path / "cache.sqlite", **kwargs)
+
+    return make
+
+
+class TestResponseCache:
+    def test_get_and_set(self, make_cache):
+        cache = make_cache()
+        cache.set("key", "response")
+        assert cache.get("key") == "response"
+        assert cache.get("missing") is None
+
+    def test_ttl(self, make_cache, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr("time.time", lambda: now[0])
+        cache = make_cache(ttl=10)
+        cache.set("key", "response")
+
+        now[0] = 109.0
+        assert cache.get("key") == "response"
+        now[0] = 110.0
+        assert cache.get("key") is None
+
+    def test_evicts_least_recently_used(self, make_cache, monkeypatch):
+        clock = iter(range(100))
+        monkeypatch.setattr("time.time", lambda: next(clock))
+        cache = make_cache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        assert len(cache) == 2
+        assert [cache.get(key) for key in ["a", "b", "c"]] == ["1", None, "3"]
+
+    def test_clear(self, make_cache):
+        cache = make_cache()
+        cache.set("key", "response")
+        cache.clear()
+        assert cache.get("key") is None
+
+    def test_disk_cache_persists(self, tmp_path):
+        path = tmp_path / "cache.sqlite"
+        cache = DiskResponseCache(path)
+        cache.set("key", "response")
+        cache.close()
+
+        assert DiskResponseCache(path).get("key") == "response"
+
+    def test_make_key(self):
+        messages = [{"role": "user", "content": "Hi"}]
+        key = BaseResponseCache.make_key("gpt-4o-mini", messages, {})
+        assert key == BaseResponseCache.make_key(
+            "gpt-4o-mini", [{"content": "Hi", "role": "user"}], {}
+        )
+        assert key != BaseResponseCache.make_key("gpt-4o", messages, {})
+        assert key != BaseResponseCache.make_key(
+            "gpt-4o-mini", messages, {"temperature": 0.5}
+        )
@@ -0,0 +1,79 @@
+import asyncio
+import pytest
+
+from tigergraphx.llm import RateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        clock = FakeClock()
+        monkeypatch.setattr(
+            "tigergraphx.llm.rate_limiter.time.monotonic", clock.monotonic
+        )
+        monkeypatch.setattr("tigergraphx.llm.rate_limiter.asyncio.sleep", clock.sleep)
+        return clock
+
+    @pytest.mark.asyncio
+    async def test_requests_per_minute(self, clock):
+        limiter = RateLimiter(requests_per_minute=2)
+        for _ in range(3):
+            async with limiter.limit():
+                pass
+
+        # The bucket starts full; the third request waits for one refill
+        assert clock.sleeps == [pytest.approx(30.0)]
+        assert limiter.metrics["requests"] == 3
+        assert limiter.metrics["waited_requests"] == 1
+        assert limiter.metrics["total_wait_seconds"] == pytest.approx(30.0)
+
+    @pytest.mark.asyncio
+    async def test_tokens_per_minute(self, clock):
+        limiter = RateLimiter(tokens_per_minute=600)
+        async with limiter.limit(500):
+            pass
+        async with limiter.limit(200):
+            pass
+
+        # 100 tokens are missing at 10 tokens per second
+        assert clock.sleeps == [pytest.approx(10.0)]
+
+    @pytest.mark.asyncio
+    async def test_oversized_request_waits_for_full_bucket(self, clock):
+        limiter = RateLimiter(tokens_per_minute=60)
+        async with limiter.limit(1000):
+            pass
+        assert clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_max_concurrent_requests(self):
+        limiter = RateLimiter(max_concurrent_requests=2)
+        in_flight = 0
+        peak = 0
+
+        async def request():
+            nonlocal in_flight, peak
+            async with limiter.limit():
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*[request() for _ in range(6)])
+        assert peak == 2
+
+    def test_estimate_tokens_without_token_limit(self):
+        assert RateLimiter().estimate_tokens("some text") == 0
@@ -44,10 +44,12 @@ class TestOpenAIManager:
             base_url="https://api.openai.com/v1",
             organization="test-org",
             timeout=60.0,
-            max_retries=5,
+            max_retries=0,
         )
         # Assert that the manager's LLM is set
         assert manager.get_llm() == mock_async_openai.return_value
+        # Retries are made by the shared retry policy instead of the SDK
+        assert manager.get_retry_policy().max_attempts == 6
 
     def test_init_with_config_dict(self, valid_config_dict, mock_async_openai):
         """Test initialization with a configuration dictionary."""
@@ -59,7 +61,7 @@ class TestOpenAIManager:
             base_url="https://api.openai.com/v1",
             organization="test-org",
             timeout=60.0,
-            max_retries=5,
+            max_retries=0,
         )
         # Assert that the manager's LLM is set
         assert manager.get_llm() == mock_async_openai.return_value
@@ -81,7 +83,7 @@ class TestOpenAIManager:
             base_url="https://api.openai.com/v1",
             organization="test-org",
             timeout=60.0,
-            max_retries=5,
+            max_retries=0,
         )
         # Assert that the manager's LLM is set
         assert manager.get_llm() == mock_async_openai.return_value
@@ -0,0 +1,165 @@
+import time
+from email.utils import formatdate
+from unittest.mock import MagicMock
+import openai
+import pytest
+import requests
+
+from tigergraphx.utils import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryBudget,
+    RetryPolicy,
+)
+
+
+def http_error(status_code, headers=None):
+    response = MagicMock(status_code=status_code, headers=headers or {})
+    return requests.HTTPError(f"{status_code} Error", response=response)
+
+
+class TestRetryPolicy:
+    @pytest.fixture
+    def policy(self):
+        return RetryPolicy(max_wait=0.01, failure_threshold=None)
+
+    @pytest.mark.parametrize(
+        "error, expected",
+        [
+            (http_error(429), True),
+            (http_error(503), True),
+            (http_error(400), False),
+            (http_error(409), False),
+            (http_error(401), False),
+            (requests.ConnectionError("reset"), True),
+            (TimeoutError("timed out"), True),
+            (ValueError("bad value"), False),
+            (openai.APIConnectionError(request=MagicMock()), True),
+            (
+                openai.BadRequestError(
+                    "bad request",
+                    response=MagicMock(status_code=400, headers={}),
+                    body=None,
+                ),
+                False,
+            ),
+        ],
+    )
+    def test_is_retryable(self, policy, error, expected):
+        assert policy.is_retryable(error) is expected
+
+    def test_is_retryable_follows_cause(self, policy):
+        try:
+            try:
+                raise http_error(502)
+            except requests.HTTPError as e:
+                raise RuntimeError("HTTP request failed") from e
+        except RuntimeError as e:
+            assert policy.is_retryable(e)
+
+    def test_get_retry_after(self, policy):
+        assert policy.get_retry_after(http_error(429, {"retry-after": "3"})) == 3
+        assert (
+            policy.get_retry_after(http_error(429, {"retry-after-ms": "250"})) == 0.25
+        )
+        assert policy.get_retry_after(http_error(429, {"retry-after": "600"})) == 60
+        date = formatdate(time.time() + 5, usegmt=True)
+        assert 3 < policy.get_retry_after(http_error(503, {"retry-after": date})) <= 5
+        assert policy.get_retry_after(http_error(503)) is None
+
+    def test_fatal_errors_are_not_retried(self, policy):
+        func = MagicMock(side_effect=http_error(400))
+        with pytest.raises(requests.HTTPError):
+            for attempt in policy.retrying(max_attempts=5):
+                with attempt:
+                    func()
+        assert func.call_count == 1
+
+    def test_retryable_errors_are_retried(self, policy):
+        func = MagicMock(side_effect=[http_error(503), http_error(429), "ok"])
+        for attempt in policy.retrying(max_attempts=5):
+            with attempt:
+                result = func()
+        assert result == "ok"
+        assert func.call_count == 3
+
+    def test_retry_budget(self):
+        policy = RetryPolicy(
+            max_wait=0.01,
+            failure_threshold=None,
+            budget=RetryBudget(ratio=0, min_retries=2),
+        )
+        func = MagicMock(side_effect=requests.ConnectionError("reset"))
+        with pytest.raises(requests.ConnectionError):
+            for attempt in policy.retrying(max_attempts=10):
+                with attempt:
+                    func()
+        assert func.call_count == 3
+
+    def test_circuit_opens_per_endpoint(self):
+        policy = RetryPolicy(max_wait=0.01, failure_threshold=2, reset_timeout=60)
+        func = MagicMock(side_effect=requests.ConnectionError("reset"))
+        with pytest.raises(CircuitOpenError):
+            for attempt in policy.retrying("a", max_attempts=5):
+                with attempt:
+                    func()
+        assert func.call_count == 2
+
+        # Other endpoints are unaffected
+        for attempt in policy.retrying("b"):
+            with attempt:
+                result = "ok"
+        assert result == "ok"
+
+    def test_fatal_errors_do_not_affect_circuit(self):
+        policy = RetryPolicy(max_wait=0.01, failure_threshold=2, reset_timeout=60)
+        breaker = policy.get_circuit_breaker("a")
+        breaker.record_failure()
+
+        for error in [http_error(400), ValueError("bad value")]:
+            with pytest.raises(type(error)):
+                for attempt in policy.retrying("a"):
+                    with attempt:
+                        raise error
+
+        # The earlier failure still counts, so one more opens the circuit
+        breaker.record_failure()
+        assert breaker.state == "open"
+
+
+class TestCircuitBreaker:
+    def test_half_open_trial(self, monkeypatch):
+        now = [0.0]
+        monkeypatch.setattr("time.monotonic", lambda: now[0])
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow_request()
+
+        now[0] = 10.0
+        assert breaker.state == "half_open"
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        breaker.record_failure()
+        assert breaker.state == "open"
+
+        now[0] = 20.0
+        assert breaker.allow_request()
+        # An ignored outcome frees the trial slot without closing the circuit
+        breaker.record_ignored()
+        assert breaker.state == "half_open"
+        assert breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_max_wait_override(self):
+        policy = RetryPolicy(max_wait=5, failure_threshold=None)
+        func = MagicMock(side_effect=[http_error(503), http_error(503), "ok"])
+        start = time.monotonic()
+        for attempt in policy.retrying(max_attempts=3, max_wait=0):
+            with attempt:
+                result = func()
+        assert result == "ok"
+        assert time.monotonic() - start < 0.5
@@ -0,0 +1,31 @@
+from tigergraphx.utils import SQLiteLRUStore
+
+
+class TestSQLiteLRUStore:
+    def test_get_many_and_put_many(self, tmp_path):
+        store = SQLiteLRUStore(tmp_path / "store.sqlite", "entries")
+        store.put_many([("a", b"1"), ("b", "2")])
+
+        assert store.get_many(["b", "missing", "a"]) == {"a": b"1", "b": "2"}
+        assert len(store) == 2
+
+    def test_expired_entries_are_deleted(self, tmp_path, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr("time.time", lambda: now[0])
+        store = SQLiteLRUStore(tmp_path / "store.sqlite", "entries")
+        store.put_many([("a", "1")], expires_at=110.0)
+        store.put_many([("b", "2")])
+
+        now[0] = 110.0
+        assert store.get_many(["a", "b"]) == {"b": "2"}
+        assert len(store) == 1
+
+    def test_tables_share_a_file(self, tmp_path):
+        path = tmp_path / "store.sqlite"
+        first = SQLiteLRUStore(path, "first", max_entries=1)
+        second = SQLiteLRUStore(path, "second")
+        first.put_many([("a", "1"), ("b", "2")])
+        second.put_many([("a", "3")])
+
+        assert len(first) == 1
+        assert second.get_many(["a"]) == {"a": "3"}
@@ -0,0 +1,42 @@
+import numpy as np
+
+from tigergraphx.vector_search import EmbeddingCache
+
+
+class TestEmbeddingCache:
+    def test_get_many_and_put_many(self, tmp_path):
+        cache = EmbeddingCache(tmp_path / "cache.sqlite")
+        cache.put_many([("a", [0.1, 0.2]), ("b", [0.3, 0.4])])
+
+        result = cache.get_many(["b", "missing", "a", "b"])
+
+        np.testing.assert_allclose(result[0], [0.3, 0.4], rtol=1e-6)
+        assert result[1] is None
+        np.testing.assert_allclose(result[2], [0.1, 0.2], rtol=1e-6)
+        np.testing.assert_allclose(result[3], [0.3, 0.4], rtol=1e-6)
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "cache.sqlite"
+        cache = EmbeddingCache(path)
+        cache.put_many([("a", [1.0, 2.0])])
+        cache.close()
+
+        assert EmbeddingCache(path).get_many(["a"]) == [[1.0, 2.0]]
+
+    def test_evicts_least_recently_used(self, tmp_path, monkeypatch):
+        clock = iter(range(100))
+        monkeypatch.setattr("time.time", lambda: next(clock))
+        cache = EmbeddingCache(tmp_path / "cache.sqlite", max_entries=2)
+        cache.put_many([("a", [1.0])])
+        cache.put_many([("b", [2.0])])
+        cache.get_many(["a"])
+        cache.put_many([("c", [3.0])])
+
+        assert len(cache) == 2
+        assert cache.get_many(["a", "b", "c"]) == [[1.0], None, [3.0]]
+
+    def test_make_key(self):
+        key = EmbeddingCache.make_key("model", "cl100k_base", "text")
+        assert key == EmbeddingCache.make_key("model", "cl100k_base", "text")
+        assert key != EmbeddingCache.make_key("other", "cl100k_base", "text")
+        assert key != EmbeddingCache.make_key("model", "o200k_base", "text")
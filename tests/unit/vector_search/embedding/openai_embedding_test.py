@@ -1,11 +1,14 @@
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+import numpy as np
 import pytest
 
 from tigergraphx.config import (
     OpenAIEmbeddingConfig,
     OpenAIConfig,
 )
-from tigergraphx.vector_search import OpenAIEmbedding
+from tigergraphx.vector_search import EmbeddingCache, OpenAIEmbedding
+from tigergraphx.utils import RetryPolicy
 
 
 class TestOpenAIEmbedding:
@@ -38,3 +41,129 @@ class TestOpenAIEmbedding:
                     isinstance(value, float) for value in result
                 )  # Check data type
                 mock_generate_with_retry.assert_called_once()  # Ensure the mock was called
+
+
+class FakeEncoder:
+    """One token per character, so tests don't need to download tiktoken data."""
+
+    def encode(self, text):
+        return [ord(c) for c in text]
+
+    def decode(self, tokens):
+        return "".join(chr(t) for t in tokens)
+
+    def encode_batch(self, texts):
+        return [self.encode(text) for text in texts]
+
+
+class TestOpenAIEmbeddingBatch:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        with patch("tiktoken.get_encoding", return_value=FakeEncoder()):
+            self.mock_manager = MagicMock()
+            self.mock_manager.get_retry_policy.return_value = RetryPolicy()
+            self.embedding = OpenAIEmbedding(
+                self.mock_manager,
+                OpenAIEmbeddingConfig(
+                    max_tokens=4,
+                    max_inputs_per_request=3,
+                    max_tokens_per_request=10,
+                ),
+            )
+        self.requests = []
+
+        async def create(input, model):
+            inputs = [input] if isinstance(input, str) else list(input)
+            self.requests.append(inputs)
+            # Embed each chunk as [len, 1] and return the items out of order
+            data = [
+                SimpleNamespace(index=i, embedding=[float(len(chunk)), 1.0])
+                for i, chunk in enumerate(inputs)
+            ]
+            return SimpleNamespace(data=list(reversed(data)))
+
+        self.embedding.llm.embeddings.create = create
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_packs_requests(self):
+        result = await self.embedding.generate_embeddings(["abcdef", "ab", "", "abcd"])
+
+        # Chunks: "abcd", "ef", "ab", "abcd" -> limited by 3 inputs and 10 tokens
+        assert self.requests == [["abcd", "ef", "ab"], ["abcd"]]
+        expected = np.average([[4.0, 1.0], [2.0, 1.0]], axis=0, weights=[4, 2])
+        np.testing.assert_allclose(result[0], expected / np.linalg.norm(expected))
+        np.testing.assert_allclose(result[1], np.array([2.0, 1.0]) / np.sqrt(5))
+        assert result[2] == []
+        np.testing.assert_allclose(result[3], np.array([4.0, 1.0]) / np.sqrt(17))
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_failed_request(self):
+        with patch.object(
+            OpenAIEmbedding,
+            "_generate_batch_with_retry",
+            new=AsyncMock(return_value=[[], []]),
+        ):
+            result = await self.embedding.generate_embeddings(["ab", "cd"])
+        assert result == [[], []]
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_keeps_requests_after_fatal_error(self):
+        create = self.embedding.llm.embeddings.create
+
+        async def create_or_fail(input, model):
+            if "bad" in input:
+                raise ValueError("Invalid input")
+            return await create(input, model)
+
+        self.embedding.llm.embeddings.create = create_or_fail
+        result = await self.embedding.generate_embeddings(
+            ["ab", "cd", "ef", "gh", "bad"]
+        )
+
+        # The fatal error only fails the second request
+        assert [len(embedding) for embedding in result] == [2, 2, 2, 0, 0]
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_uses_cache(self):
+        self.embedding.cache = EmbeddingCache(":memory:")
+        first = await self.embedding.generate_embeddings(["abcdef", "ab"])
+        self.requests.clear()
+
+        second = await self.embedding.generate_embeddings(["abcdef", "ab", "xyz"])
+
+        assert self.requests == [["xyz"]]
+        np.testing.assert_allclose(second[:2], first, rtol=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_generate_embedding_uses_cache(self):
+        self.embedding.cache = EmbeddingCache(":memory:")
+        self.embedding.cache.put_many([(self.embedding._cache_key("abcd"), [4.0, 1.0])])
+
+        result = await self.embedding.generate_embedding("abcdef")
+
+        # Only the uncached chunk is requested
+        assert self.requests == [["ef"]]
+        expected = np.average([[4.0, 1.0], [2.0, 1.0]], axis=0, weights=[4, 2])
+        np.testing.assert_allclose(result, expected / np.linalg.norm(expected))
+
+    @pytest.mark.asyncio
+    async def test_short_texts_skip_tokenization(self):
+        encoder = MagicMock(wraps=FakeEncoder())
+        self.embedding.token_encoder = encoder
+
+        await self.embedding.generate_embeddings(["ab", "abcd", "abcdef", "abcdefgh"])
+
+        assert self.requests == [["ab", "abcd", "abcd"], ["ef", "abcd", "efgh"]]
+        encoder.encode.assert_not_called()
+        encoder.encode_batch.assert_called_once_with(["abcdef", "abcdefgh"])
+
+    @pytest.mark.asyncio
+    async def test_generate_embedding_short_text_skips_tokenization(self):
+        encoder = MagicMock(wraps=FakeEncoder())
+        self.embedding.token_encoder = encoder
+
+        await self.embedding.generate_embedding("abc")
+
+        assert self.requests == [["abc"]]
+        encoder.encode.assert_not_called()
+        encoder.encode_batch.assert_not_called()
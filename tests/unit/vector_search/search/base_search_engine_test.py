@@ -0,0 +1,40 @@
+from unittest.mock import AsyncMock, MagicMock
+import numpy as np
+import pytest
+
+from tigergraphx.vector_search import BaseEmbedding, BaseSearchEngine, BaseVectorDB
+
+
+class TestBaseSearchEngine:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.mock_embedding = MagicMock(spec=BaseEmbedding)
+        self.mock_vector_db = MagicMock(spec=BaseVectorDB)
+        self.engine = BaseSearchEngine(self.mock_embedding, self.mock_vector_db)
+
+    @pytest.mark.asyncio
+    async def test_search_batch(self):
+        self.mock_embedding.generate_embeddings = AsyncMock(
+            return_value=[[0.1, 0.2], [0.3, 0.4]]
+        )
+        self.mock_vector_db.query_batch.return_value = [["id1"], ["id2", "id3"]]
+
+        result = await self.engine.search_batch(["a", "b"], k=2)
+
+        self.mock_embedding.generate_embeddings.assert_awaited_once_with(["a", "b"])
+        query_embeddings = self.mock_vector_db.query_batch.call_args.kwargs[
+            "query_embeddings"
+        ]
+        np.testing.assert_array_equal(query_embeddings, [[0.1, 0.2], [0.3, 0.4]])
+        assert result == [["id1"], ["id2", "id3"]]
+
+    @pytest.mark.asyncio
+    async def test_search_batch_skips_failed_embeddings(self):
+        self.mock_embedding.generate_embeddings = AsyncMock(
+            return_value=[[], [0.3, 0.4]]
+        )
+        self.mock_vector_db.query_batch.return_value = [["id2"]]
+
+        result = await self.engine.search_batch(["a", "b"], k=1)
+
+        assert result == [[], ["id2"]]
@@ -0,0 +1,94 @@
+import threading
+import numpy as np
+import pytest
+
+from tigergraphx.vector_search.vector_db.ivf_index import IVFIndex
+
+
+class TestIVFIndex:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        rng = np.random.default_rng(0)
+        self.vectors = rng.random((200, 8), dtype=np.float32)
+        self.ids = [f"id{i}" for i in range(200)]
+
+    def exact_top_k(self, query, k):
+        vectors = self.vectors / np.linalg.norm(self.vectors, axis=1, keepdims=True)
+        scores = vectors @ (query / np.linalg.norm(query))
+        return [self.ids[i] for i in np.argsort(-scores)[:k]]
+
+    def test_query_with_all_probes_is_exact(self):
+        index = IVFIndex(dimension=8, nlist=8, nprobe=8)
+        index.build(self.ids, self.vectors)
+        query = self.vectors[5]
+        results = index.query(query, k=5)
+        assert [node_id for node_id, _ in results] == self.exact_top_k(query, 5)
+        assert results[0][1] == pytest.approx(0.0, abs=1e-5)
+
+    def test_query_with_few_probes_finds_itself(self):
+        index = IVFIndex(dimension=8, nlist=16, nprobe=2)
+        index.build(self.ids, self.vectors)
+        assert index.query(self.vectors[42], k=1)[0][0] == "id42"
+
+    def test_upsert_replaces_and_inserts(self):
+        index = IVFIndex(dimension=8, nlist=4, nprobe=4)
+        index.build(self.ids[:10], self.vectors[:10])
+        index.upsert(["id0", "new"], np.stack([self.vectors[100], self.vectors[101]]))
+        assert len(index) == 11
+        assert index.query(self.vectors[100], k=1)[0][0] == "id0"
+        assert index.query(self.vectors[101], k=1)[0][0] == "new"
+
+    def test_remove(self):
+        index = IVFIndex(dimension=8, nlist=4, nprobe=4)
+        index.build(self.ids[:10], self.vectors[:10])
+        index.remove(["id3", "unknown"])
+        assert len(index) == 9
+        assert "id3" not in [node_id for node_id, _ in index.query(self.vectors[3], 10)]
+
+    def test_upsert_without_build(self):
+        index = IVFIndex(dimension=8, metric="L2")
+        index.upsert(["a", "b"], self.vectors[:2])
+        results = index.query(self.vectors[1], k=2)
+        assert [node_id for node_id, _ in results] == ["b", "a"]
+        assert results[0][1] == pytest.approx(0.0, abs=1e-5)
+
+    def test_upserts_after_sparse_build_are_reclustered(self):
+        index = IVFIndex(dimension=8, nlist=8, nprobe=8)
+        index.build([], np.empty((0, 8)))
+        for node_id, vector in zip(self.ids, self.vectors):
+            index.upsert([node_id], vector)
+
+        assert len(index._centroids) == 8
+        assert max(len(rows) for rows in index._lists) < len(self.ids)
+        query = self.vectors[5]
+        results = index.query(query, k=5)
+        assert [node_id for node_id, _ in results] == self.exact_top_k(query, 5)
+
+    def test_query_empty_index(self):
+        index = IVFIndex(dimension=8)
+        index.build([], np.empty((0, 8)))
+        assert index.query(self.vectors[0], k=3) == []
+
+    def test_concurrent_updates_and_queries(self):
+        index = IVFIndex(dimension=8, nlist=8, nprobe=8)
+        index.build(self.ids[:100], self.vectors[:100])
+        errors = []
+
+        def write():
+            try:
+                for i in range(100, 200):
+                    index.upsert([self.ids[i]], self.vectors[i : i + 1])
+                    index.remove([self.ids[i - 100]])
+            except Exception as e:
+                errors.append(e)
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        while writer.is_alive():
+            for node_id, _ in index.query(self.vectors[150], k=5):
+                assert node_id is not None
+        writer.join()
+
+        assert not errors
+        assert len(index) == 100
+        assert index.query(self.vectors[150], k=1)[0][0] == "id150"
@@ -0,0 +1,85 @@
+import pytest
+import pandas as pd
+import numpy as np
+
+from tigergraphx.vector_search.vector_db.mmap_vectordb_manager import (
+    MmapVectorDBManager,
+)
+from tigergraphx.config import MmapVectorDBConfig
+
+
+def make_data(ids, vectors):
+    return pd.DataFrame({"__id__": ids, "__vector__": list(vectors)})
+
+
+def exact_top_k(vectors, query, k):
+    vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    return list(np.argsort(-(vectors @ query), kind="stable")[:k])
+
+
+class TestMmapVectorDBManager:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.storage_dir = tmp_path / "store"
+        self.rng = np.random.default_rng(0)
+        self.vectors = self.rng.normal(size=(200, 16)).astype(np.float32)
+        self.ids = [f"id{i}" for i in range(200)]
+
+    def make_manager(self, **kwargs):
+        config = MmapVectorDBConfig(
+            storage_dir=self.storage_dir, embedding_dim=16, **kwargs
+        )
+        return MmapVectorDBManager(config)
+
+    @pytest.mark.parametrize("dtype", ["float32", "float16", "int8"])
+    def test_query_matches_exact_search(self, dtype):
+        manager = self.make_manager(dtype=dtype, block_size=64)
+        manager.insert_data(make_data(self.ids, self.vectors))
+
+        query = self.rng.normal(size=16)
+        expected = exact_top_k(self.vectors, query / np.linalg.norm(query), 5)
+        assert manager.query(query.tolist(), k=5) == [self.ids[i] for i in expected]
+
+    @pytest.mark.parametrize("dtype", ["float32", "float16"])
+    def test_query_with_blocks_smaller_than_k(self, dtype):
+        manager = self.make_manager(dtype=dtype, block_size=2)
+        manager.insert_data(make_data(self.ids[:10], self.vectors[:10]))
+
+        query = self.rng.normal(size=16)
+        expected = exact_top_k(self.vectors[:10], query / np.linalg.norm(query), 3)
+        assert manager.query(query.tolist(), k=3) == [self.ids[i] for i in expected]
+
+    def test_reopen_store(self):
+        manager = self.make_manager(dtype="int8")
+        manager.insert_data(make_data(self.ids[:100], self.vectors[:100]))
+        manager.insert_data(make_data(self.ids[100:], self.vectors[100:]))
+        queries = self.rng.normal(size=(3, 16))
+        expected = manager.query_batch(queries, k=4)
+
+        reopened = self.make_manager(dtype="int8")
+
+        assert len(reopened) == 200
+        assert isinstance(reopened._vectors, np.memmap)
+        assert reopened.query_batch(queries, k=4) == expected
+
+    def test_insert_replaces_existing_ids(self):
+        manager = self.make_manager()
+        manager.insert_data(make_data(self.ids[:10], self.vectors[:10]))
+        manager.insert_data(
+            make_data(["id3", "id3"], [self.vectors[20], self.vectors[30]])
+        )
+
+        assert len(manager) == 10
+        assert manager.query(self.vectors[30].tolist(), k=1) == ["id3"]
+
+    def test_query_empty_store(self):
+        manager = self.make_manager()
+        assert manager.query_batch(np.random.rand(2, 16), k=5) == [[], []]
+        assert not self.storage_dir.exists()
+
+    def test_open_with_mismatched_config(self):
+        self.make_manager(dtype="float16").insert_data(
+            make_data(self.ids, self.vectors)
+        )
+        with pytest.raises(ValueError, match="dtype"):
+            self.make_manager(dtype="int8")
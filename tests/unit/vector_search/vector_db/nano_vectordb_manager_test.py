@@ -27,9 +27,121 @@ class TestNanoVectorDBManager:
         )
         mock_db.insert_data(data)
         mock_db._db.upsert.assert_called_once()
+        records = mock_db._db.upsert.call_args[0][0]
+        assert [record["__id__"] for record in records] == ["id1", "id2"]
+        assert [record["attribute"] for record in records] == ["value1", "value2"]
+        assert records[0]["__vector__"].dtype == np.float32
+        np.testing.assert_allclose(
+            records[1]["__vector__"], data["__vector__"][1], rtol=1e-6
+        )
+
+    def test_insert_data_with_empty_df(self, mock_db):
+        data = pd.DataFrame(columns=pd.Index(["__id__", "__vector__"]))
+        mock_db.insert_data(data)
+        mock_db._db.upsert.assert_not_called()
 
     def test_query(self, mock_db):
         query_embedding = np.random.rand(128).tolist()
         mock_db._db.query.return_value = [{"__id__": "id1"}, {"__id__": "id2"}]
         result = mock_db.query(query_embedding, k=2)
         assert result == ["id1", "id2"]
+
+    def test_query_batch_matches_query(self, tmp_path):
+        config = NanoVectorDBConfig(
+            embedding_dim=8, storage_file=tmp_path / "nano-vectordb.json"
+        )
+        manager = NanoVectorDBManager(config=config)
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame(
+            {
+                "__id__": [f"id{i}" for i in range(20)],
+                "__vector__": list(rng.random((20, 8))),
+            }
+        )
+        manager.insert_data(data)
+
+        queries = rng.random((3, 8))
+        result = manager.query_batch(queries, k=5)
+
+        assert result == [manager.query(query.tolist(), k=5) for query in queries]
+
+    def test_query_batch_empty_db(self, tmp_path):
+        config = NanoVectorDBConfig(
+            embedding_dim=8, storage_file=tmp_path / "nano-vectordb.json"
+        )
+        manager = NanoVectorDBManager(config=config)
+        assert manager.query_batch(np.random.rand(2, 8), k=5) == [[], []]
+
+    def test_query_batch_after_update(self, tmp_path):
+        config = NanoVectorDBConfig(
+            embedding_dim=8, storage_file=tmp_path / "nano-vectordb.json"
+        )
+        manager = NanoVectorDBManager(config=config)
+        rng = np.random.default_rng(1)
+        ids = [f"id{i}" for i in range(10)]
+        manager.insert_data(
+            pd.DataFrame({"__id__": ids, "__vector__": list(rng.random((10, 8)))})
+        )
+        manager.insert_data(
+            pd.DataFrame(
+                {
+                    "__id__": ["id3", "id10", "id10"],
+                    "__vector__": list(rng.random((3, 8))),
+                }
+            )
+        )
+
+        queries = rng.random((4, 8))
+        result = manager.query_batch(queries, k=4)
+
+        assert result == [manager.query(query.tolist(), k=4) for query in queries]
+
+    def test_query_batch_with_stored_data(self, tmp_path):
+        config = NanoVectorDBConfig(
+            embedding_dim=8, storage_file=tmp_path / "nano-vectordb.json"
+        )
+        manager = NanoVectorDBManager(config=config)
+        rng = np.random.default_rng(2)
+        manager.insert_data(
+            pd.DataFrame(
+                {
+                    "__id__": [f"id{i}" for i in range(6)],
+                    "__vector__": list(rng.random((6, 8))),
+                }
+            )
+        )
+        manager._db.save()
+
+        # A new manager loads the vectors from the storage file
+        reloaded = NanoVectorDBManager(config=config)
+        queries = rng.random((2, 8))
+        result = reloaded.query_batch(queries, k=3)
+
+        assert result == [reloaded.query(query.tolist(), k=3) for query in queries]
+        assert all(len(ids) == 3 for ids in result)
+
+    def test_query_batch_with_zero_vectors(self, tmp_path):
+        config = NanoVectorDBConfig(
+            embedding_dim=4, storage_file=tmp_path / "nano-vectordb.json"
+        )
+        manager = NanoVectorDBManager(config=config)
+        manager.insert_data(
+            pd.DataFrame(
+                {
+                    "__id__": ["zero", "x", "y"],
+                    "__vector__": [np.zeros(4), np.eye(4)[0], np.eye(4)[1]],
+                }
+            )
+        )
+
+        result = manager.query_batch(np.stack([np.eye(4)[1], np.zeros(4)]), k=3)
+
+        # Zero vectors in the store rank last, and a zero query still gets k IDs
+        assert result[0] == ["y", "x", "zero"]
+        assert sorted(result[1]) == ["x", "y", "zero"]
+
+    def test_query_batch_falls_back_without_storage(self, mock_db):
+        mock_db._db.query.return_value = [{"__id__": "id1"}]
+        result = mock_db.query_batch(np.random.rand(2, 128), k=1)
+        assert result == [["id1"], ["id1"]]
+        assert mock_db._db.query.call_count == 2
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import MagicMock
 import pandas as pd
+import numpy as np
 
 from tigergraphx.config import TigerVectorConfig
 from tigergraphx.core import Graph
@@ -15,6 +16,8 @@ class TestTigerVectorManager:
         self.mock_config = MagicMock(spec=TigerVectorConfig)
         self.mock_config.vector_attribute_name = "emb_description"
         self.mock_config.node_type = "Entity"
+        self.mock_config.batch_size = 1000
+        self.mock_config.use_local_index = False
         # Mock the Graph class and its methods
         self.mock_graph = MagicMock(spec=Graph)
         # Instantiate the TigerVectorManager with mock configuration and graph
@@ -47,6 +50,36 @@ class TestTigerVectorManager:
             nodes_for_adding=expected_nodes, node_type="Entity"
         )
 
+    def test_insert_data_in_batches(self):
+        """Test that insert_data splits large DataFrames into batches."""
+        self.mock_config.batch_size = 2
+        data = pd.DataFrame(
+            {
+                "__id__": ["Entity_1", "Entity_2", "Entity_3"],
+                "__vector__": [
+                    np.array([0.1, 0.2, 0.3]),
+                    np.array([0.4, 0.5, 0.6]),
+                    np.array([0.7, 0.8, 0.9]),
+                ],
+            }
+        )
+
+        self.manager.insert_data(data)
+
+        assert self.mock_graph.add_nodes_from.call_count == 2
+        first_call, second_call = self.mock_graph.add_nodes_from.call_args_list
+        assert first_call.kwargs["nodes_for_adding"] == [
+            ("Entity_1", {"emb_description": [0.1, 0.2, 0.3]}),
+            ("Entity_2", {"emb_description": [0.4, 0.5, 0.6]}),
+        ]
+        assert second_call.kwargs["nodes_for_adding"] == [
+            ("Entity_3", {"emb_description": [0.7, 0.8, 0.9]}),
+        ]
+        # Vectors are converted to plain lists so the payload is JSON-serializable
+        assert isinstance(
+            second_call.kwargs["nodes_for_adding"][0][1]["emb_description"], list
+        )
+
     def test_query(self):
         """Test the query method of TigerVectorManager."""
         # Mock the search method to return fake data
@@ -73,6 +106,24 @@ class TestTigerVectorManager:
         # Assert that the result contains the correct node identifiers
         assert result == ["Entity_1", "Entity_2"]
 
+    def test_query_batch(self):
+        """Test the query_batch method of TigerVectorManager."""
+        self.mock_graph.search_batch.return_value = [
+            [{"id": "Entity_1", "distance": 0.1}, {"id": "Entity_2", "distance": 0.2}],
+            [{"id": "Entity_2", "distance": 0.3}],
+        ]
+
+        query_embeddings = np.array([[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]])
+        result = self.manager.query_batch(query_embeddings, k=2)
+
+        self.mock_graph.search_batch.assert_called_once_with(
+            data=[[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]],
+            vector_attribute_name="emb_description",
+            node_type="Entity",
+            limit=2,
+        )
+        assert result == [["Entity_1", "Entity_2"], ["Entity_2"]]
+
     def test_query_empty_result(self):
         """Test query method with empty results."""
         # Mock the search method to return an empty dictionary
@@ -97,3 +148,111 @@ class TestTigerVectorManager:
 
         # Check that add_nodes_from was not called since there's no data
         self.mock_graph.add_nodes_from.assert_not_called()
+
+
+class TestTigerVectorManagerLocalIndex:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.config = TigerVectorConfig(
+            graph_name="MyGraph",
+            node_type="Entity",
+            vector_attribute_name="emb",
+            batch_size=2,
+            use_local_index=True,
+            local_index_nlist=2,
+            local_index_nprobe=2,
+        )
+        self.mock_graph = MagicMock(spec=Graph)
+        self.mock_graph.get_schema.return_value = {
+            "nodes": {
+                "Entity": {
+                    "primary_key": "id",
+                    "vector_attributes": {"emb": {"dimension": 3, "metric": "COSINE"}},
+                }
+            }
+        }
+        self.vectors = {
+            "e1": [1.0, 0.0, 0.0],
+            "e2": [0.0, 1.0, 0.0],
+            "e3": [0.0, 0.0, 1.0],
+        }
+        self.mock_graph.get_nodes.return_value = [
+            {"id": "e1"},
+            {"id": "e2"},
+            {"id": "e3"},
+        ]
+        self.mock_graph.fetch_nodes.side_effect = lambda ids, *_: {
+            node_id: self.vectors[node_id] for node_id in ids
+        }
+        self.manager = TigerVectorManager(config=self.config, graph=self.mock_graph)
+
+    def test_build_local_index(self):
+        assert self.manager.build_local_index() == 3
+        # IDs are exported in batches of batch_size
+        assert self.mock_graph.fetch_nodes.call_count == 2
+        self.mock_graph.add_write_listener.assert_called_once()
+
+    def test_query_served_from_local_index(self):
+        self.manager.build_local_index()
+        assert self.manager.query([0.9, 0.1, 0.0], k=2) == ["e1", "e2"]
+        self.mock_graph.search.assert_not_called()
+
+    def test_query_falls_back_before_build_or_with_filter(self):
+        self.mock_graph.search.return_value = [{"id": "e1", "distance": 0.1}]
+        assert self.manager.query([0.9, 0.1, 0.0], k=1) == ["e1"]
+        self.manager.build_local_index()
+        self.manager.query([0.9, 0.1, 0.0], k=1, filter_expression="s.x > 1")
+        assert self.mock_graph.search.call_count == 2
+
+    def test_query_falls_back_when_stale(self):
+        self.config.local_index_max_staleness = 0.0
+        self.mock_graph.search.return_value = []
+        self.manager.build_local_index()
+        self.manager._local_index_built_at -= 1
+        self.manager.query([0.9, 0.1, 0.0], k=1)
+        self.mock_graph.search.assert_called_once()
+
+    def test_graph_writes_update_local_index(self):
+        self.manager.build_local_index()
+        self.manager._on_graph_write(
+            "upsert", "Entity", [("e4", {"emb": [1.0, 1.0, 0.0]})]
+        )
+        assert self.manager.query([1.0, 1.0, 0.0], k=1) == ["e4"]
+        self.manager._on_graph_write("remove", "Entity", [("e4", {})])
+        assert self.manager.query([1.0, 1.0, 0.0], k=1) != ["e4"]
+        self.manager._on_graph_write(
+            "upsert", "Other", [("e5", {"emb": [1.0, 1.0, 0.0]})]
+        )
+        assert len(self.manager._local_index) == 3
+
+    def test_upserts_after_clear_are_served_locally(self):
+        self.manager.build_local_index()
+        self.manager._on_graph_write("clear", None, [])
+        self.manager._on_graph_write(
+            "upsert",
+            "Entity",
+            [(node_id, {"emb": vector}) for node_id, vector in self.vectors.items()],
+        )
+
+        assert len(self.manager._local_index._centroids) == 2
+        assert self.manager.query([0.9, 0.1, 0.0], k=2) == ["e1", "e2"]
+        self.mock_graph.search.assert_not_called()
+
+    @pytest.mark.parametrize("node_type", [None, "Entity"])
+    def test_unknown_writes_mark_local_index_stale(self, node_type):
+        self.mock_graph.search.return_value = []
+        self.manager.build_local_index()
+        self.manager._on_graph_write("invalidate", node_type, [])
+        self.manager.query([0.9, 0.1, 0.0], k=1)
+        self.mock_graph.search.assert_called_once()
+
+        # Rebuilding serves queries locally again
+        self.manager.build_local_index()
+        self.manager.query([0.9, 0.1, 0.0], k=1)
+        self.mock_graph.search.assert_called_once()
+
+    def test_invalidate_of_other_type_keeps_local_index(self):
+        self.manager.build_local_index()
+        self.manager._on_graph_write("invalidate", "Other", [])
+        assert self.manager.query([0.9, 0.1, 0.0], k=1) == ["e1"]
+        self.mock_graph.search.assert_not_called()
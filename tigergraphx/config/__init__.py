@@ -43,6 +43,7 @@ from .settings import (
     BaseVectorDBConfig,
     TigerVectorConfig,
     NanoVectorDBConfig,
+    MmapVectorDBConfig,
     BaseChatConfig,
     OpenAIChatConfig,
 )
@@ -85,6 +86,7 @@ __all__ = [
     "BaseVectorDBConfig",
     "TigerVectorConfig",
     "NanoVectorDBConfig",
+    "MmapVectorDBConfig",
     "BaseChatConfig",
     "OpenAIChatConfig",
 ]
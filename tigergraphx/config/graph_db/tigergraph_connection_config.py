@@ -5,7 +5,7 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Literal, Optional
 from pydantic import HttpUrl, Field, model_validator
 from pydantic_settings import SettingsConfigDict
 
@@ -37,6 +37,33 @@ class TigerGraphConnectionConfig(BaseConfig):
         default="14240", validation_alias="TG_GSQL_PORT", description="The port for GSQL."
     )
 
+    # Multi-host load balancing
+    hosts: Optional[List[HttpUrl]] = Field(
+        default=None,
+        validation_alias="TG_HOSTS",
+        description="The host URLs of all cluster nodes. REST++ requests are spread across them, while GSQL requests stay on `host`, which defaults to the first of them.",
+    )
+    load_balancing: Literal["round_robin", "least_outstanding", "latency"] = Field(
+        default="round_robin",
+        validation_alias="TG_LOAD_BALANCING",
+        description="How REST++ requests choose among `hosts`: in turn, by fewest requests in flight, or by lowest recent latency.",
+    )
+    host_ejection_threshold: int = Field(
+        default=3,
+        validation_alias="TG_HOST_EJECTION_THRESHOLD",
+        description="Consecutive transient failures after which a host is ejected from load balancing.",
+    )
+    host_ejection_duration: float = Field(
+        default=30.0,
+        validation_alias="TG_HOST_EJECTION_DURATION",
+        description="Seconds an ejected host is skipped before a successful ping restores it.",
+    )
+    coalesce_reads: bool = Field(
+        default=True,
+        validation_alias="TG_COALESCE_READS",
+        description="Whether identical concurrent read requests share one request.",
+    )
+
     # User/password authentication
     username: Optional[str] = Field(
         default=None,
@@ -63,6 +90,28 @@ class TigerGraphConnectionConfig(BaseConfig):
         description="The API token for TigerGraph authentication. Use only for token-based authentication.",
     )
 
+    # Retries of idempotent requests
+    max_retries: int = Field(
+        default=3,
+        validation_alias="TG_MAX_RETRIES",
+        description="Maximum number of retries of idempotent requests after transient failures.",
+    )
+    retry_backoff_max: float = Field(
+        default=10.0,
+        validation_alias="TG_RETRY_BACKOFF_MAX",
+        description="Maximum jittered backoff between retries in seconds.",
+    )
+    circuit_breaker_threshold: Optional[int] = Field(
+        default=5,
+        validation_alias="TG_CIRCUIT_BREAKER_THRESHOLD",
+        description="Consecutive transient failures that open a host's circuit. None disables circuit breaking.",
+    )
+    circuit_breaker_reset_timeout: float = Field(
+        default=30.0,
+        validation_alias="TG_CIRCUIT_BREAKER_RESET_TIMEOUT",
+        description="Seconds a host's circuit stays open before a trial request.",
+    )
+
     @model_validator(mode="before")
     def check_exclusive_authentication(cls, values: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -125,6 +174,18 @@ class TigerGraphConnectionConfig(BaseConfig):
             "You must provide either 'username/password', 'secret', or 'token' for authentication."
         )
 
+    @model_validator(mode="after")
+    def default_host_to_first_host(self) -> "TigerGraphConnectionConfig":
+        """
+        Use the first of `hosts` as `host` if `host` is not set explicitly.
+
+        Returns:
+            The validated config.
+        """
+        if self.hosts and "host" not in self.model_fields_set:
+            self.host = self.hosts[0]
+        return self
+
     @classmethod
     def create(cls, **kwargs):
         """
@@ -5,6 +5,8 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
+from typing import Literal, Optional
+from pathlib import Path
 from pydantic import Field
 from ..base_config import BaseConfig
 
@@ -31,3 +33,23 @@ class OpenAIChatConfig(BaseChatConfig):
     max_retries: int = Field(
         default=10, description="Maximum number of retries for API calls."
     )
+    cache_type: Optional[Literal["memory", "disk"]] = Field(
+        default=None,
+        description=(
+            "Backend of the cache of responses to requests with temperature 0 or a "
+            "seed. None disables caching."
+        ),
+    )
+    cache_file: str | Path = Field(
+        default="chat-cache.sqlite",
+        description="Path to the SQLite file used by the disk response cache.",
+    )
+    cache_ttl: Optional[float] = Field(
+        default=None,
+        description="Seconds a cached response stays valid. None means no expiry.",
+    )
+    cache_max_entries: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of cached responses. None means unbounded.",
+    )
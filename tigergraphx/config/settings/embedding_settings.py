@@ -5,6 +5,8 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
+from typing import Optional
+from pathlib import Path
 from pydantic import Field
 from ..base_config import BaseConfig
 
@@ -35,3 +37,29 @@ class OpenAIEmbeddingConfig(BaseEmbeddingConfig):
     encoding_name: str = Field(
         default="cl100k_base", description="Token encoding name used by the model."
     )
+    max_inputs_per_request: int = Field(
+        default=2048,
+        ge=1,
+        description="Maximum number of inputs sent in one batched embedding request.",
+    )
+    max_tokens_per_request: int = Field(
+        default=300000,
+        ge=1,
+        description="Maximum number of tokens sent in one batched embedding request.",
+    )
+    max_concurrent_requests: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum number of batched embedding requests in flight.",
+    )
+    cache_file: Optional[str | Path] = Field(
+        default=None,
+        description="Path to a SQLite file caching chunk embeddings. None disables "
+        "the cache.",
+    )
+    cache_max_entries: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of cached embeddings before least recently used "
+        "entries are evicted. None means unbounded.",
+    )
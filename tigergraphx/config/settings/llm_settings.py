@@ -36,3 +36,23 @@ class OpenAIConfig(BaseLLMConfig):
     request_timeout: float = Field(
         default=180.0, description="Request timeout in seconds."
     )
+    requests_per_minute: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Client-side limit on requests per minute. None disables it.",
+    )
+    tokens_per_minute: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Client-side limit on tokens per minute. None disables it.",
+    )
+    max_concurrent_requests: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of requests in flight. None disables the limit.",
+    )
+    encoding_name: str = Field(
+        default="cl100k_base",
+        description="Token encoding used to estimate request costs for the "
+        "tokens-per-minute limit.",
+    )
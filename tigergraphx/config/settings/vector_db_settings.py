@@ -5,6 +5,7 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
+from typing import Literal, Optional
 from pathlib import Path
 from pydantic import Field
 
@@ -31,6 +32,29 @@ class TigerVectorConfig(BaseVectorDBConfig):
     vector_attribute_name: str = Field(
         description="The name of the vector attribute for embeddings."
     )
+    batch_size: int = Field(
+        default=1000,
+        ge=1,
+        description="The number of rows sent per upsert request when inserting data.",
+    )
+    use_local_index: bool = Field(
+        default=False,
+        description="Whether to serve queries from an in-memory IVF index mirror.",
+    )
+    local_index_nlist: int = Field(
+        default=100, ge=1, description="The number of clusters in the local index."
+    )
+    local_index_nprobe: int = Field(
+        default=10,
+        ge=1,
+        description="The number of clusters scanned per local index query.",
+    )
+    local_index_max_staleness: Optional[float] = Field(
+        default=None,
+        description="Seconds after a build before the local index is considered "
+        "stale and queries fall back to the server. None means it is only stale "
+        "after bulk changes, such as data loads, until it is rebuilt.",
+    )
 
 
 class NanoVectorDBConfig(BaseVectorDBConfig):
@@ -46,3 +70,38 @@ class NanoVectorDBConfig(BaseVectorDBConfig):
     embedding_dim: int = Field(
         default=1536, description="Default embedding dimension for NanoVectorDB."
     )
+
+
+class MmapVectorDBConfig(BaseVectorDBConfig):
+    """Configuration class for the memory-mapped vector store."""
+
+    type: str = Field(
+        default="MmapVectorDB", description="Default type for MmapVectorDBConfig."
+    )
+    storage_dir: str | Path = Field(
+        default="mmap-vectordb",
+        description="Directory holding the vector matrix and the ID sidecar file.",
+    )
+    embedding_dim: int = Field(
+        default=1536, description="Default embedding dimension for MmapVectorDB."
+    )
+    dtype: Literal["float32", "float16", "int8"] = Field(
+        default="float32",
+        description="Storage type of the scanned vector matrix. float16 and int8 "
+        "use scalar quantization.",
+    )
+    rescore: bool = Field(
+        default=True,
+        description="Whether to keep full-precision vectors on disk and re-score "
+        "candidates found in a quantized matrix.",
+    )
+    rescore_factor: int = Field(
+        default=4,
+        ge=1,
+        description="The number of candidates re-scored per requested result.",
+    )
+    block_size: int = Field(
+        default=65536,
+        ge=1,
+        description="The number of rows scored at a time, bounding query memory.",
+    )
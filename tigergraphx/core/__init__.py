@@ -6,12 +6,20 @@
 # under the License. The software is provided "AS IS", without warranty.
 
 from .graph import Graph
+from .buffered_graph_writer import BufferedGraphWriter
+from .loading_job import LoadingFileProgress, LoadingJob, LoadingJobStatus
+from .point_read_batcher import PointReadBatcher
 from .tigergraph_api import TigerGraphAPI, TigerGraphAPIError
 from .tigergraph_database import TigerGraphDatabase
 
 
 __all__ = [
+    "BufferedGraphWriter",
     "Graph",
+    "LoadingFileProgress",
+    "LoadingJob",
+    "LoadingJobStatus",
+    "PointReadBatcher",
     "TigerGraphAPI",
     "TigerGraphAPIError",
     "TigerGraphDatabase",
@@ -0,0 +1,254 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import logging
+import threading
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from .graph import Graph
+
+logger = logging.getLogger(__name__)
+
+EdgeGroup = Tuple[str, str, str]
+
+
+class BufferedGraphWriter:
+    """
+    Buffers node and edge upserts and writes them to the graph in batches.
+
+    Writes are grouped by node or edge type. Repeated writes to the same node or
+    edge are merged, with later attribute values taking precedence, so each is
+    sent once. The buffer is flushed when it holds `max_batch_size` items,
+    `flush_interval` seconds after the first buffered write, on `flush()`, and
+    when used as a context manager, on exit.
+
+    Buffered writes are not visible to reads until they are flushed. Call `flush()`
+    before reads that depend on them.
+
+    Example:
+        ```python
+        with BufferedGraphWriter(graph) as writer:
+            writer.add_node("Alice", "Person", age=30)
+            writer.add_edge("Alice", "Bob", "Person", "Friendship", "Person")
+        ```
+    """
+
+    def __init__(
+        self,
+        graph: Graph,
+        max_batch_size: int = 1000,
+        flush_interval: Optional[float] = 1.0,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            graph: The graph to write to.
+            max_batch_size: Number of buffered nodes and edges that triggers a flush.
+            flush_interval: Seconds after the first buffered write before the buffer
+                is flushed in the background. None disables timed flushes.
+        """
+        if max_batch_size <= 0:
+            raise ValueError("Parameter 'max_batch_size' must be greater than 0.")
+        self.graph = graph
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.written = 0
+        self._nodes: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._records: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._edges: Dict[EdgeGroup, Dict[Hashable, Tuple[str, str, Dict]]] = {}
+        self._size = 0
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        # Serializes flushes so batches reach the graph in order
+        self._flush_lock = threading.Lock()
+
+    def __enter__(self) -> "BufferedGraphWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add_node(
+        self, node_id: str | int, node_type: Optional[str] = None, **attr
+    ) -> None:
+        """
+        Buffer a node upsert.
+
+        Args:
+            node_id: The identifier of the node.
+            node_type: The type of the node.
+            **attr: Attributes of the node.
+        """
+        node_type = self.graph.resolve_node_type(node_type)
+        with self._lock:
+            nodes = self._nodes.setdefault(node_type, {})
+            self._merge(nodes, str(node_id), attr)
+        self._after_write()
+
+    def add_edge(
+        self,
+        src_node_id: str | int,
+        tgt_node_id: str | int,
+        src_node_type: Optional[str] = None,
+        edge_type: Optional[str] = None,
+        tgt_node_type: Optional[str] = None,
+        **attr,
+    ) -> None:
+        """
+        Buffer an edge upsert.
+
+        Edges of multi-edge types are told apart by their discriminator attributes.
+
+        Args:
+            src_node_id: Source node identifier.
+            tgt_node_id: Target node identifier.
+            src_node_type: Source node type.
+            edge_type: Edge type.
+            tgt_node_type: Target node type.
+            **attr: Attributes of the edge.
+        """
+        group = self.graph.resolve_edge_type(src_node_type, edge_type, tgt_node_type)
+        src_node_id, tgt_node_id = str(src_node_id), str(tgt_node_id)
+        discriminator = getattr(
+            self.graph.graph_schema.edges.get(group[1]), "discriminator", None
+        )
+        key: Tuple[str, ...] = (src_node_id, tgt_node_id)
+        if discriminator:
+            key += tuple(str(attr.get(name)) for name in sorted(discriminator))
+        with self._lock:
+            edges = self._edges.setdefault(group, {})
+            if key in edges:
+                edges[key][2].update(attr)
+            else:
+                edges[key] = (src_node_id, tgt_node_id, dict(attr))
+                self._size += 1
+        self._after_write()
+
+    def upsert(self, data: Dict | List[Dict], node_type: Optional[str] = None) -> None:
+        """
+        Buffer upserts of nodes with vector data, written with `Graph.upsert`.
+
+        Args:
+            data: Record(s) to upsert, each including the node's primary key.
+            node_type: The node type for the upsert operation.
+        """
+        node_type = self.graph.resolve_node_type(node_type)
+        primary_key = self.graph.graph_schema.nodes[node_type].primary_key
+        records = data if isinstance(data, list) else [data]
+        with self._lock:
+            buffered = self._records.setdefault(node_type, {})
+            for record in records:
+                self._merge(buffered, str(record[primary_key]), record)
+        self._after_write()
+
+    def flush(self) -> int:
+        """
+        Write all buffered nodes and edges to the graph.
+
+        Nodes are written before edges. Batches that fail stay buffered and are
+        retried by the next flush.
+
+        Returns:
+            The number of nodes and edges written.
+        """
+        with self._flush_lock:
+            with self._lock:
+                nodes, records, edges = self._nodes, self._records, self._edges
+                self._nodes, self._records, self._edges = {}, {}, {}
+                self._size = 0
+                self._cancel_timer()
+
+            written = failed = 0
+            for node_type, buffered in nodes.items():
+                items = list(buffered.items())
+                if self.graph.add_nodes_from(items, node_type) is None:
+                    self._requeue(self._nodes, node_type, buffered)
+                    failed += len(buffered)
+                else:
+                    written += len(items)
+            for node_type, buffered in records.items():
+                if self.graph.upsert(list(buffered.values()), node_type) is None:
+                    self._requeue(self._records, node_type, buffered)
+                    failed += len(buffered)
+                else:
+                    written += len(buffered)
+            for group, buffered in edges.items():
+                src_node_type, edge_type, tgt_node_type = group
+                result = self.graph.add_edges_from(
+                    list(buffered.values()), src_node_type, edge_type, tgt_node_type
+                )
+                if result is None:
+                    self._requeue(self._edges, group, buffered)
+                    failed += len(buffered)
+                else:
+                    written += len(buffered)
+
+            self.written += written
+            if failed:
+                logger.warning(f"{failed} buffered writes failed; keeping them.")
+        self._schedule_flush()
+        return written
+
+    def close(self) -> None:
+        """Flush the buffer and stop timed flushes."""
+        self.flush()
+        with self._lock:
+            self._cancel_timer()
+        if len(self):
+            logger.error(f"Closing writer with {len(self)} unwritten items.")
+
+    def _after_write(self) -> None:
+        if self._size >= self.max_batch_size:
+            self.flush()
+        else:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        with self._lock:
+            if self._timer is None and self._size and self.flush_interval is not None:
+                self._timer = threading.Timer(self.flush_interval, self._timed_flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _timed_flush(self) -> None:
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Error flushing buffered writes: {e}")
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _merge(self, buffered: Dict[str, Dict], key: str, attr: Dict) -> None:
+        if key in buffered:
+            buffered[key].update(attr)
+        else:
+            buffered[key] = dict(attr)
+            self._size += 1
+
+    def _requeue(self, target: Dict, group: Any, failed: Dict) -> None:
+        # Writes buffered since the flush began are newer and take precedence
+        with self._lock:
+            buffered = target.setdefault(group, {})
+            for key, value in failed.items():
+                if key not in buffered:
+                    buffered[key] = value
+                    self._size += 1
+                elif isinstance(value, dict):
+                    buffered[key] = {**value, **buffered[key]}
+                else:
+                    buffered[key] = (
+                        value[0],
+                        value[1],
+                        {**value[2], **buffered[key][2]},
+                    )
@@ -6,7 +6,7 @@
 # under the License. The software is provided "AS IS", without warranty.
 
 import logging
-from typing import Any, Dict, List, Literal, Optional, Sequence, Set, Tuple
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Set, Tuple
 from pathlib import Path
 import pandas as pd
 
@@ -17,6 +17,8 @@ from tigergraphx.config import (
 )
 
 from tigergraphx.core.graph_context import GraphContext
+from tigergraphx.core.loading_job import LoadingJob
+from tigergraphx.core.read_cache import ReadCache
 from tigergraphx.core.managers import (
     SchemaManager,
     DataManager,
@@ -29,6 +31,15 @@ from tigergraphx.core.managers import (
 
 logger = logging.getLogger(__name__)
 
+WriteListener = Callable[
+    [
+        Literal["upsert", "remove", "clear", "invalidate"],
+        Optional[str],
+        List[Tuple[str, Dict]],
+    ],
+    None,
+]
+
 
 class Graph:
     """
@@ -94,6 +105,12 @@ class Graph:
         self._query_manager = QueryManager(self._context)
         self._vector_manager = VectorManager(self._context)
 
+        # Callbacks notified about node writes made through this instance
+        self._write_listeners: List[WriteListener] = []
+
+        # Opt-in cache of read results, cleared by writes through this instance
+        self.read_cache: Optional[ReadCache] = None
+
         # Create the schema, drop the graph first if drop_existing_graph is True
         if mode == "normal":
             self.create_schema(drop_existing_graph=drop_existing_graph)
@@ -143,6 +160,53 @@ class Graph:
         return NodeView(self)
 
     # ------------------------------ Schema Operations ------------------------------
+    @property
+    def graph_schema(self) -> GraphSchema:
+        """
+        Return the schema the graph was created with.
+
+        Returns:
+            The graph schema.
+        """
+        return self._context.graph_schema
+
+    def resolve_node_type(self, node_type: Optional[str] = None) -> str:
+        """
+        Validate a node type, defaulting to the only node type when omitted.
+
+        Args:
+            node_type: The node type to validate.
+
+        Returns:
+            The effective node type.
+
+        Raises:
+            ValueError: If the node type is invalid or ambiguous.
+        """
+        return self._validate_node_type(node_type)
+
+    def resolve_edge_type(
+        self,
+        src_node_type: Optional[str] = None,
+        edge_type: Optional[str] = None,
+        tgt_node_type: Optional[str] = None,
+    ) -> Tuple[str, str, str]:
+        """
+        Validate node and edge types, defaulting to the only type when omitted.
+
+        Args:
+            src_node_type: Source node type.
+            edge_type: Edge type.
+            tgt_node_type: Target node type.
+
+        Returns:
+            The effective (src_node_type, edge_type, tgt_node_type).
+
+        Raises:
+            ValueError: If any provided type is invalid or ambiguous.
+        """
+        return self._validate_edge_type(src_node_type, edge_type, tgt_node_type)
+
     def get_schema(self, format: Literal["json", "dict"] = "dict") -> str | Dict:
         """
         Get the schema of the graph.
@@ -165,13 +229,16 @@ class Graph:
         Returns:
             True if schema was created successfully.
         """
-        return self._schema_manager.create_schema(drop_existing_graph)
+        result = self._schema_manager.create_schema(drop_existing_graph)
+        self._invalidate_read_cache()
+        return result
 
     def drop_graph(self) -> None:
         """
         Drop the graph from TigerGraph.
         """
-        return self._schema_manager.drop_graph()
+        self._schema_manager.drop_graph()
+        self._invalidate_read_cache()
 
     # ------------------------------ Data Loading Operations ------------------------------
     def load_data(
@@ -186,7 +253,34 @@ class Graph:
         Returns:
             GSQL response string after executing the loading job.
         """
-        return self._data_manager.load_data(loading_job_config)
+        result = self._data_manager.load_data(loading_job_config)
+        self._notify_write_listeners("invalidate", None, [])
+        return result
+
+    def load_data_async(
+        self,
+        loading_job_config: LoadingJobConfig | Dict | str | Path,
+        poll_interval: float = 1.0,
+    ) -> LoadingJob:
+        """
+        Start loading data into the graph and return without waiting for it to end.
+
+        The loading job runs under a unique name, so the same configuration may be
+        loaded several times at once. It is dropped once it has ended.
+
+        Args:
+            loading_job_config: Loading job config.
+            poll_interval: Seconds between status polls when waiting for the job.
+
+        Returns:
+            A handle to poll the progress of the job, wait for it or cancel it.
+        """
+        self._notify_write_listeners("invalidate", None, [])
+        return self._data_manager.load_data_async(
+            loading_job_config,
+            poll_interval=poll_interval,
+            on_done=lambda: self._notify_write_listeners("invalidate", None, []),
+        )
 
     # ------------------------------ Node Operations ------------------------------
     def add_node(self, node_id: str | int, node_type: Optional[str] = None, **attr):
@@ -200,7 +294,10 @@ class Graph:
         """
         node_id = self._to_str_node_id(node_id)
         node_type = self._validate_node_type(node_type)
-        return self._node_manager.add_node(node_id, node_type, **attr)
+        # Upsert as a batch of one, whose accepted count tells whether it succeeded
+        nodes = [(node_id, attr)]
+        if self._node_manager.add_nodes_from(nodes, node_type) is not None:
+            self._notify_write_listeners("upsert", node_type, nodes)
 
     def add_nodes_from(
         self,
@@ -223,7 +320,10 @@ class Graph:
         if normalized_nodes is None:
             return None
         node_type = self._validate_node_type(node_type)
-        return self._node_manager.add_nodes_from(normalized_nodes, node_type)
+        result = self._node_manager.add_nodes_from(normalized_nodes, node_type)
+        if result is not None:
+            self._notify_write_listeners("upsert", node_type, normalized_nodes)
+        return result
 
     def remove_node(self, node_id: str | int, node_type: Optional[str] = None) -> bool:
         """
@@ -238,7 +338,66 @@ class Graph:
         """
         node_id = self._to_str_node_id(node_id)
         node_type = self._validate_node_type(node_type)
-        return self._node_manager.remove_node(node_id, node_type)
+        result = self._node_manager.remove_node(node_id, node_type)
+        if result:
+            self._notify_write_listeners("remove", node_type, [(node_id, {})])
+        return result
+
+    def remove_nodes(
+        self,
+        node_ids: List[str] | List[int],
+        node_type: Optional[str] = None,
+        chunk_size: int = 1000,
+    ) -> int:
+        """
+        Remove multiple nodes of the same type, deleting them on the server with one
+        query per chunk of IDs.
+
+        Args:
+            node_ids: The identifiers of the nodes.
+            node_type: The type of the nodes.
+            chunk_size: Maximum number of nodes deleted per query.
+
+        Returns:
+            The number of nodes removed. Nodes that are not found are not counted.
+        """
+        node_ids = self._to_str_node_ids(node_ids)
+        node_type = self._validate_node_type(node_type)
+        result = self._node_manager.remove_nodes(node_ids, node_type, chunk_size)
+        if result:
+            self._notify_write_listeners(
+                "remove", node_type, [(node_id, {}) for node_id in node_ids]
+            )
+        return result
+
+    def remove_nodes_where(
+        self,
+        node_type: str,
+        filter_expression: str,
+        node_alias: str = "s",
+        chunk_size: int = 1000,
+    ) -> int:
+        """
+        Remove the nodes of a type that match a filter, deleting them on the server
+        in chunks until none are left.
+
+        Args:
+            node_type: The type of the nodes.
+            filter_expression: A GSQL condition on the nodes, e.g. "s.age > 30".
+            node_alias: The alias used for the nodes in the filter expression.
+            chunk_size: Maximum number of nodes deleted per query.
+
+        Returns:
+            The number of nodes removed.
+        """
+        node_type = self._validate_node_type(node_type)
+        result = self._node_manager.remove_nodes_where(
+            node_type, filter_expression, node_alias, chunk_size
+        )
+        if result:
+            # The removed IDs are not known, so listeners must drop what they hold
+            self._notify_write_listeners("invalidate", node_type, [])
+        return result
 
     def has_node(self, node_id: str | int, node_type: Optional[str] = None) -> bool:
         """
@@ -270,7 +429,28 @@ class Graph:
         """
         node_id = self._to_str_node_id(node_id)
         node_type = self._validate_node_type(node_type)
-        return self._node_manager.get_node_data(node_id, node_type)
+        return self._cached_read(
+            ("get_node_data", node_id, node_type),
+            lambda: self._node_manager.get_node_data(node_id, node_type),
+        )
+
+    def get_nodes_data(
+        self, node_ids: List[str] | List[int], node_type: Optional[str] = None
+    ) -> Dict[str, Dict]:
+        """
+        Get data for multiple nodes of the same type in a single query.
+
+        Args:
+            node_ids: The identifiers of the nodes.
+            node_type: The type of the nodes.
+
+        Returns:
+            The node data keyed by node identifier. Nodes that are not found are
+            left out.
+        """
+        node_ids = self._to_str_node_ids(node_ids)
+        node_type = self._validate_node_type(node_type)
+        return self._node_manager.get_nodes_data(node_ids, node_type)
 
     def get_node_edges(
         self,
@@ -301,7 +481,10 @@ class Graph:
         Returns:
             True if nodes were cleared.
         """
-        return self._node_manager.clear()
+        result = self._node_manager.clear()
+        if result:
+            self._notify_write_listeners("clear", None, [])
+        return result
 
     # ------------------------------ Edge Operations ------------------------------
     def add_edge(
@@ -328,14 +511,18 @@ class Graph:
         src_node_type, edge_type, tgt_node_type = self._validate_edge_type(
             src_node_type, edge_type, tgt_node_type
         )
-        return self._edge_manager.add_edge(
+        result = self._edge_manager.add_edge(
             src_node_id, tgt_node_id, src_node_type, edge_type, tgt_node_type, **attr
         )
+        self._invalidate_read_cache()
+        return result
 
     def add_edges_from(
         self,
-        ebunch_to_add: Sequence[Tuple[str | int, str | int]]
-        | Sequence[Tuple[str | int, str | int, Dict[str, Any]]],
+        ebunch_to_add: (
+            Sequence[Tuple[str | int, str | int]]
+            | Sequence[Tuple[str | int, str | int, Dict[str, Any]]]
+        ),
         src_node_type: Optional[str] = None,
         edge_type: Optional[str] = None,
         tgt_node_type: Optional[str] = None,
@@ -360,9 +547,46 @@ class Graph:
         src_node_type, edge_type, tgt_node_type = self._validate_edge_type(
             src_node_type, edge_type, tgt_node_type
         )
-        return self._edge_manager.add_edges_from(
+        result = self._edge_manager.add_edges_from(
             normalized_edges, src_node_type, edge_type, tgt_node_type
         )
+        self._invalidate_read_cache()
+        return result
+
+    def remove_edges(
+        self,
+        edges: List[Tuple[str | int, str | int]],
+        src_node_type: Optional[str] = None,
+        edge_type: Optional[str] = None,
+        tgt_node_type: Optional[str] = None,
+        chunk_size: int = 1000,
+    ) -> int:
+        """
+        Remove multiple edges of the same type, deleting them on the server with one
+        query per chunk of edges.
+
+        All edges between each pair of nodes are removed, including every edge of a
+        multi-edge.
+
+        Args:
+            edges: The (source node identifier, target node identifier) pairs.
+            src_node_type: Source node type.
+            edge_type: Edge type.
+            tgt_node_type: Target node type.
+            chunk_size: Maximum number of node pairs per query.
+
+        Returns:
+            The number of edges removed.
+        """
+        str_edges = [self._to_str_edge_ids(src, tgt) for src, tgt in edges]
+        src_node_type, edge_type, tgt_node_type = self._validate_edge_type(
+            src_node_type, edge_type, tgt_node_type
+        )
+        result = self._edge_manager.remove_edges(
+            str_edges, src_node_type, edge_type, tgt_node_type, chunk_size
+        )
+        self._invalidate_read_cache()
+        return result
 
     def has_edge(
         self,
@@ -422,6 +646,34 @@ class Graph:
             src_node_id, tgt_node_id, src_node_type, edge_type, tgt_node_type
         )
 
+    def get_edges_data(
+        self,
+        edges: List[Tuple[str | int, str | int]],
+        src_node_type: Optional[str] = None,
+        edge_type: Optional[str] = None,
+        tgt_node_type: Optional[str] = None,
+    ) -> Dict[Tuple[str, str], Dict | Dict[int | str, Dict]]:
+        """
+        Get data for multiple edges of the same type in a single query.
+
+        Args:
+            edges: The (source node identifier, target node identifier) pairs.
+            src_node_type: Source node type.
+            edge_type: Edge type.
+            tgt_node_type: Target node type.
+
+        Returns:
+            The edge data keyed by (source, target) pair. Edges that are not found
+            are left out.
+        """
+        str_edges = [self._to_str_edge_ids(src, tgt) for src, tgt in edges]
+        src_node_type, edge_type, tgt_node_type = self._validate_edge_type(
+            src_node_type, edge_type, tgt_node_type
+        )
+        return self._edge_manager.get_edges_data(
+            str_edges, src_node_type, edge_type, tgt_node_type
+        )
+
     # ------------------------------ Statistics Operations ------------------------------
     def degree(
         self,
@@ -447,7 +699,34 @@ class Graph:
         node_id = self._to_str_node_id(node_id)
         node_type = self._validate_node_type(node_type)
         edge_type_set = self._validate_edge_types_as_set(edge_types)
-        return self._statistics_manager.degree(node_id, node_type, edge_type_set)
+        return self._cached_read(
+            ("degree", node_id, node_type, self._freeze(edge_type_set)),
+            lambda: self._statistics_manager.degree(node_id, node_type, edge_type_set),
+        )
+
+    def degrees(
+        self,
+        node_ids: List[str] | List[int],
+        node_type: Optional[str] = None,
+        edge_types: Optional[List[str] | str] = None,
+    ) -> Dict[str, int]:
+        """
+        Get the out-degrees of multiple nodes of the same type in a single query.
+
+        Edge types are counted as in `degree`.
+
+        Args:
+            node_ids: Node identifiers.
+            node_type: Node type.
+            edge_types: List of edge types to consider. If None, use all edge types.
+
+        Returns:
+            The out-degree of each node, keyed by node identifier.
+        """
+        node_ids = self._to_str_node_ids(node_ids)
+        node_type = self._validate_node_type(node_type)
+        edge_type_set = self._validate_edge_types_as_set(edge_types)
+        return self._statistics_manager.degrees(node_ids, node_type, edge_type_set)
 
     def number_of_nodes(self, node_type: Optional[str] = None) -> int:
         """
@@ -531,7 +810,10 @@ class Graph:
         Returns:
             The query result or None if an error occurred.
         """
-        return self._query_manager.run_query(query_name, params)
+        result = self._query_manager.run_query(query_name, params)
+        # Installed queries may write, so cached reads can no longer be trusted
+        self._invalidate_read_cache()
+        return result
 
     def is_query_installed(self, query_name: str) -> bool:
         """
@@ -572,14 +854,26 @@ class Graph:
         """
         if not all_node_types:
             node_type = self._validate_node_type(node_type)
-        return self._query_manager.get_nodes(
-            node_type=node_type,
-            all_node_types=all_node_types,
-            node_alias=node_alias,
-            filter_expression=filter_expression,
-            return_attributes=return_attributes,
-            limit=limit,
-            output_type=output_type,
+        return self._cached_read(
+            (
+                "get_nodes",
+                node_type,
+                all_node_types,
+                node_alias,
+                filter_expression,
+                self._freeze(return_attributes),
+                limit,
+                output_type,
+            ),
+            lambda: self._query_manager.get_nodes(
+                node_type=node_type,
+                all_node_types=all_node_types,
+                node_alias=node_alias,
+                filter_expression=filter_expression,
+                return_attributes=return_attributes,
+                limit=limit,
+                output_type=output_type,
+            ),
         )
 
     def get_edges(
@@ -616,17 +910,32 @@ class Graph:
         source_node_type_set = self._validate_node_types_as_set(source_node_types)
         edge_type_set = self._validate_edge_types_as_set(edge_types)
         target_node_type_set = self._validate_node_types_as_set(target_node_types)
-        return self._query_manager.get_edges(
-            source_node_type_set=source_node_type_set,
-            source_node_alias=source_node_alias,
-            edge_type_set=edge_type_set,
-            edge_alias=edge_alias,
-            target_node_type_set=target_node_type_set,
-            target_node_alias=target_node_alias,
-            filter_expression=filter_expression,
-            return_attributes=return_attributes,
-            limit=limit,
-            output_type=output_type,
+        return self._cached_read(
+            (
+                "get_edges",
+                self._freeze(source_node_type_set),
+                source_node_alias,
+                self._freeze(edge_type_set),
+                edge_alias,
+                self._freeze(target_node_type_set),
+                target_node_alias,
+                filter_expression,
+                self._freeze(return_attributes),
+                limit,
+                output_type,
+            ),
+            lambda: self._query_manager.get_edges(
+                source_node_type_set=source_node_type_set,
+                source_node_alias=source_node_alias,
+                edge_type_set=edge_type_set,
+                edge_alias=edge_alias,
+                target_node_type_set=target_node_type_set,
+                target_node_alias=target_node_alias,
+                filter_expression=filter_expression,
+                return_attributes=return_attributes,
+                limit=limit,
+                output_type=output_type,
+            ),
         )
 
     def get_neighbors(
@@ -669,18 +978,34 @@ class Graph:
         start_node_type = self._validate_node_type(start_node_type)
         edge_type_set = self._validate_edge_types_as_set(edge_types)
         target_node_type_set = self._validate_node_types_as_set(target_node_types)
-        return self._query_manager.get_neighbors(
-            start_nodes=new_start_nodes,
-            start_node_type=start_node_type,
-            start_node_alias=start_node_alias,
-            edge_type_set=edge_type_set,
-            edge_alias=edge_alias,
-            target_node_type_set=target_node_type_set,
-            target_node_alias=target_node_alias,
-            filter_expression=filter_expression,
-            return_attributes=return_attributes,
-            limit=limit,
-            output_type=output_type,
+        return self._cached_read(
+            (
+                "get_neighbors",
+                self._freeze(new_start_nodes),
+                start_node_type,
+                start_node_alias,
+                self._freeze(edge_type_set),
+                edge_alias,
+                self._freeze(target_node_type_set),
+                target_node_alias,
+                filter_expression,
+                self._freeze(return_attributes),
+                limit,
+                output_type,
+            ),
+            lambda: self._query_manager.get_neighbors(
+                start_nodes=new_start_nodes,
+                start_node_type=start_node_type,
+                start_node_alias=start_node_alias,
+                edge_type_set=edge_type_set,
+                edge_alias=edge_alias,
+                target_node_type_set=target_node_type_set,
+                target_node_alias=target_node_alias,
+                filter_expression=filter_expression,
+                return_attributes=return_attributes,
+                limit=limit,
+                output_type=output_type,
+            ),
         )
 
     def bfs(
@@ -739,7 +1064,22 @@ class Graph:
             The result of the upsert operation or None if an error occurs.
         """
         node_type = self._validate_node_type(node_type)
-        return self._vector_manager.upsert(data, node_type)
+        result = self._vector_manager.upsert(data, node_type)
+        if result is not None:
+            primary_key = self._context.graph_schema.nodes[node_type].primary_key
+            records = data if isinstance(data, list) else [data]
+            self._notify_write_listeners(
+                "upsert",
+                node_type,
+                [
+                    (
+                        str(record[primary_key]),
+                        {k: v for k, v in record.items() if k != primary_key},
+                    )
+                    for record in records
+                ],
+            )
+        return result
 
     def fetch_node(
         self,
@@ -795,6 +1135,8 @@ class Graph:
         limit: int = 10,
         return_attributes: Optional[str | List[str]] = None,
         candidate_ids: Optional[Set[str]] = None,
+        filter_expression: Optional[str] = None,
+        node_alias: str = "s",
     ) -> List[Dict]:
         """
         Search for similar nodes based on a query vector.
@@ -806,6 +1148,9 @@ class Graph:
             limit: Number of nearest neighbors to return.
             return_attributes: Attributes to return.
             candidate_ids: Limit search to these node IDs.
+            filter_expression: Filter expression evaluated on the server to select
+                candidate nodes before the vector search.
+            node_alias: Alias for the node. Used in filter_expression.
 
         Returns:
             List of similar nodes and their details.
@@ -818,6 +1163,92 @@ class Graph:
             limit=limit,
             return_attributes=return_attributes,
             candidate_ids=candidate_ids,
+            filter_expression=filter_expression,
+            node_alias=node_alias,
+        )
+
+    def search_batch(
+        self,
+        data: List[List[float]],
+        vector_attribute_name: str,
+        node_type: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[List[Dict]]:
+        """
+        Search for similar nodes for multiple query vectors in a single request.
+
+        Args:
+            data: Query vectors, all with the same dimension.
+            vector_attribute_name: The vector attribute name.
+            node_type: The node type to search.
+            limit: Number of nearest neighbors to return per query vector.
+
+        Returns:
+            For each query vector, a list of similar node IDs and their distances.
+        """
+        node_type = self._validate_node_type(node_type)
+        return self._vector_manager.search_batch(
+            data=data,
+            vector_attribute_name=vector_attribute_name,
+            node_type=node_type,
+            limit=limit,
+        )
+
+    def search_in_neighborhood(
+        self,
+        start_nodes: str | int | List[str] | List[int],
+        data: List[float],
+        vector_attribute_name: str,
+        start_node_type: Optional[str] = None,
+        node_type: Optional[str] = None,
+        edge_types: Optional[str | List[str]] = None,
+        max_hops: int = 1,
+        limit: int = 10,
+        return_attributes: Optional[str | List[str]] = None,
+        filter_expression: Optional[str] = None,
+        node_alias: str = "s",
+    ) -> List[Dict]:
+        """
+        Search for similar nodes within a number of hops of the start nodes.
+
+        The traversal and the vector search run in a single query, so no
+        intermediate node IDs are sent back to the client.
+
+        Args:
+            start_nodes: Starting node or nodes.
+            data: Query vector.
+            vector_attribute_name: The vector attribute name.
+            start_node_type: Type of starting nodes.
+            node_type: The node type to search.
+            edge_types: Edge types to traverse. If None, traverse all edge types.
+            max_hops: Maximum number of hops from the start nodes.
+            limit: Number of nearest neighbors to return.
+            return_attributes: Attributes to return.
+            filter_expression: Filter expression applied to the reached nodes.
+            node_alias: Alias for the reached node. Used in filter_expression.
+
+        Returns:
+            List of similar nodes and their details.
+        """
+        if isinstance(start_nodes, str | int):
+            new_start_nodes = self._to_str_node_id(start_nodes)
+        else:
+            new_start_nodes = self._to_str_node_ids(start_nodes)
+        start_node_type = self._validate_node_type(start_node_type)
+        node_type = self._validate_node_type(node_type)
+        edge_type_set = self._validate_edge_types_as_set(edge_types)
+        return self._vector_manager.search_in_neighborhood(
+            start_nodes=new_start_nodes,
+            start_node_type=start_node_type,
+            data=data,
+            vector_attribute_name=vector_attribute_name,
+            node_type=node_type,
+            edge_type_set=edge_type_set,
+            max_hops=max_hops,
+            limit=limit,
+            return_attributes=return_attributes,
+            filter_expression=filter_expression,
+            node_alias=node_alias,
         )
 
     def search_multi_vector_attributes(
@@ -889,6 +1320,101 @@ class Graph:
             return_attributes=return_attributes,
         )
 
+    # ------------------------------ Read Cache ------------------------------
+    def enable_read_cache(
+        self, max_entries: int = 1024, ttl: Optional[float] = 60.0
+    ) -> ReadCache:
+        """
+        Cache the results of `get_nodes`, `get_edges`, `get_neighbors`,
+        `get_node_data` and `degree`.
+
+        Results are keyed by the normalized read specification and cleared by any
+        write made through this graph. Writes made by other clients are only seen
+        once results expire, so choose the TTL accordingly.
+
+        Args:
+            max_entries: Maximum number of cached results.
+            ttl: Seconds a result stays valid. None means results never expire.
+
+        Returns:
+            The cache, whose `metrics` report hits, misses and memory use.
+        """
+        self.read_cache = ReadCache(max_entries=max_entries, ttl=ttl)
+        return self.read_cache
+
+    def disable_read_cache(self) -> None:
+        """
+        Stop caching read results and drop the cache.
+        """
+        self.read_cache = None
+
+    def _cached_read(self, key: Tuple, load: Callable[[], Any]) -> Any:
+        if self.read_cache is None:
+            return load()
+        # Managers return empty results on swallowed errors; those fallbacks must
+        # not be served from the cache until it expires
+        tigergraph_api = self._context.tigergraph_api
+        errors = tigergraph_api.swallowed_error_total
+        return self.read_cache.get_or_load(
+            key,
+            load,
+            cacheable=lambda: tigergraph_api.swallowed_error_total == errors,
+        )
+
+    def _invalidate_read_cache(self) -> None:
+        # Called once a write has been sent, so later reads see its effect
+        self._context.record_write()
+        if self.read_cache is not None:
+            self.read_cache.clear()
+
+    @staticmethod
+    def _freeze(value: Any) -> Any:
+        # Make list and set arguments hashable; set order does not matter
+        if isinstance(value, (set, frozenset)):
+            return tuple(sorted(value, key=str))
+        if isinstance(value, list):
+            return tuple(value)
+        return value
+
+    # ------------------------------ Write Listeners ------------------------------
+    def add_write_listener(self, listener: WriteListener) -> None:
+        """
+        Register a callback notified after nodes are written through this graph.
+
+        The callback receives the operation ("upsert", "remove", "clear" or
+        "invalidate"), the node type, and a list of (node_id, attributes) tuples.
+        "invalidate" means nodes changed without their IDs being known, as with
+        `load_data` or `remove_nodes_where`; its list is empty and a node type of
+        None means any type. The node type is also None for "clear".
+
+        Args:
+            listener: The callback to register.
+        """
+        self._write_listeners.append(listener)
+
+    def remove_write_listener(self, listener: WriteListener) -> None:
+        """
+        Unregister a callback added with `add_write_listener`.
+
+        Args:
+            listener: The callback to remove.
+        """
+        if listener in self._write_listeners:
+            self._write_listeners.remove(listener)
+
+    def _notify_write_listeners(
+        self,
+        operation: Literal["upsert", "remove", "clear", "invalidate"],
+        node_type: Optional[str],
+        nodes: List[Tuple[str, Dict]],
+    ) -> None:
+        self._invalidate_read_cache()
+        for listener in self._write_listeners:
+            try:
+                listener(operation, node_type, nodes)
+            except Exception as e:
+                logger.error(f"Error in write listener {listener}: {e}")
+
     # ------------------------------ Utilities ------------------------------
     def _validate_node_type(self, node_type: Optional[str] = None) -> str:
         """
@@ -1103,8 +1629,10 @@ class Graph:
 
     @staticmethod
     def _normalize_edges_for_adding(
-        ebunch_to_add: Sequence[Tuple[str | int, str | int]]
-        | Sequence[Tuple[str | int, str | int, Dict[str, Any]]],
+        ebunch_to_add: (
+            Sequence[Tuple[str | int, str | int]]
+            | Sequence[Tuple[str | int, str | int, Dict[str, Any]]]
+        ),
         **common_attr: Any,
     ) -> Optional[List[Tuple[str, str, Dict[str, Any]]]]:
         """
@@ -8,6 +8,7 @@
 from typing import Dict, Optional
 from pathlib import Path
 import logging
+import threading
 
 from tigergraphx.config import (
     TigerGraphConnectionConfig,
@@ -29,3 +30,14 @@ class GraphContext:
         graph_schema = GraphSchema.ensure_config(graph_schema)
         self.graph_schema = graph_schema
         self.tigergraph_api = TigerGraphAPI(tigergraph_connection_config)
+        # Part of the key of coalesced reads, so that a read issued after a write
+        # never shares the result of an identical read started before it
+        self.write_generation = 0
+        self._write_lock = threading.Lock()
+
+    def record_write(self) -> None:
+        """
+        Record that data was written through the graph.
+        """
+        with self._write_lock:
+            self.write_generation += 1
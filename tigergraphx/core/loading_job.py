@@ -0,0 +1,346 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from .tigergraph_api import TigerGraphAPI
+
+logger = logging.getLogger(__name__)
+
+# Markers of a GSQL response to an abort that was not carried out
+_ABORT_FAILURE_MARKERS = ("error", "fail", "not exist", "not found", "cannot")
+
+# Counters of lines that were read but not loaded, if no total is reported
+_REJECTED_LINE_KEYS = (
+    "failedConditionLine",
+    "notEnoughToken",
+    "invalidJson",
+    "oversizeToken",
+)
+
+
+@dataclass
+class LoadingFileProgress:
+    """
+    Progress of one file of a loading job.
+
+    Attributes:
+        file_name: The path of the file.
+        lines_read: Number of lines read so far.
+        lines_loaded: Number of lines loaded into the graph.
+        lines_rejected: Number of lines rejected, e.g. for missing columns.
+    """
+
+    file_name: str
+    lines_read: int = 0
+    lines_loaded: int = 0
+    lines_rejected: int = 0
+
+
+@dataclass
+class LoadingJobStatus:
+    """
+    Status of a loading job run.
+
+    Attributes:
+        job_id: The ID of the run.
+        status: The status reported by TigerGraph, e.g. "RUNNING" or "FINISHED".
+        progress: Fraction of the input processed, from 0 to 1.
+        duration: Seconds the run has taken so far.
+        lines_per_second: Average number of lines read per second.
+        files: Progress of each file.
+        raw: The status as returned by TigerGraph.
+    """
+
+    job_id: str
+    status: str
+    progress: float = 0.0
+    duration: float = 0.0
+    lines_per_second: float = 0.0
+    files: List[LoadingFileProgress] = field(default_factory=list)
+    raw: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def done(self) -> bool:
+        """Return whether the run has ended, successfully or not."""
+        return self.status in LoadingJob.TERMINAL_STATUSES
+
+    @property
+    def succeeded(self) -> bool:
+        """Return whether the run finished successfully."""
+        return self.status == "FINISHED"
+
+    @property
+    def lines_read(self) -> int:
+        """Return the number of lines read across all files."""
+        return sum(file.lines_read for file in self.files)
+
+    @property
+    def lines_loaded(self) -> int:
+        """Return the number of lines loaded across all files."""
+        return sum(file.lines_loaded for file in self.files)
+
+    @property
+    def lines_rejected(self) -> int:
+        """Return the number of lines rejected across all files."""
+        return sum(file.lines_rejected for file in self.files)
+
+
+class LoadingJob:
+    """
+    Handle of a loading job running in the background.
+
+    The handle is returned by `Graph.load_data_async` once the job has started.
+    Its progress is polled from TigerGraph with `status()`, or until the job ends
+    with `wait()`. The loading job is dropped once it has ended. Several jobs may
+    run at once, and the files of a job are loaded concurrently.
+
+    Example:
+        ```python
+        job = G.load_data_async(loading_job_config)
+        status = job.wait(callback=lambda s: print(f"{s.progress:.0%}"))
+        print(status.lines_loaded, status.lines_rejected)
+        ```
+    """
+
+    TERMINAL_STATUSES = frozenset({"FINISHED", "FAILED", "ABORTED", "STOPPED"})
+
+    def __init__(
+        self,
+        tigergraph_api: TigerGraphAPI,
+        graph_name: str,
+        job_name: str,
+        job_id: str,
+        poll_interval: float = 1.0,
+        on_done: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Initialize the handle of a started loading job.
+
+        Args:
+            tigergraph_api: The API the job was started with.
+            graph_name: The name of the graph being loaded.
+            job_name: The name of the loading job, dropped once the job ends.
+            job_id: The ID of the loading job run.
+            poll_interval: Seconds between status polls in `wait()`.
+            on_done: Called once when the job has ended.
+        """
+        self._tigergraph_api = tigergraph_api
+        self.graph_name = graph_name
+        self.job_name = job_name
+        self.job_id = job_id
+        self.poll_interval = poll_interval
+        self.last_status: Optional[LoadingJobStatus] = None
+        self.cancelled = False
+        self._on_done = on_done
+        self._finished = False
+        self._lock = threading.Lock()
+
+    def status(self) -> LoadingJobStatus:
+        """
+        Poll the progress of the job.
+
+        Returns:
+            The current status of the job.
+        """
+        raw = self._tigergraph_api.get_loading_job_status(self.graph_name, self.job_id)
+        status = self._parse_status(self.job_id, raw)
+        self.last_status = status
+        if status.done:
+            self._finish()
+        return status
+
+    def done(self) -> bool:
+        """
+        Check whether the job has ended, polling its status if needed.
+
+        Returns:
+            True if the job has ended, False otherwise.
+        """
+        if self.last_status is not None and self.last_status.done:
+            return True
+        return self.status().done
+
+    def wait(
+        self,
+        timeout: Optional[float] = None,
+        callback: Optional[Callable[[LoadingJobStatus], None]] = None,
+    ) -> LoadingJobStatus:
+        """
+        Block until the job ends, polling its status every `poll_interval` seconds.
+
+        Args:
+            timeout: Maximum number of seconds to wait. None waits indefinitely.
+            callback: Called with each polled status.
+
+        Returns:
+            The final status of the job.
+
+        Raises:
+            TimeoutError: If the job is still running after `timeout` seconds.
+            RuntimeError: If the job did not finish successfully.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            status = self.status()
+            if callback is not None:
+                callback(status)
+            if status.done:
+                return self._check(status)
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Loading job '{self.job_id}' did not finish in {timeout}s."
+                )
+            time.sleep(self.poll_interval)
+
+    async def wait_async(
+        self,
+        timeout: Optional[float] = None,
+        callback: Optional[Callable[[LoadingJobStatus], None]] = None,
+    ) -> LoadingJobStatus:
+        """
+        Wait until the job ends without blocking the event loop.
+
+        Args:
+            timeout: Maximum number of seconds to wait. None waits indefinitely.
+            callback: Called with each polled status.
+
+        Returns:
+            The final status of the job.
+
+        Raises:
+            TimeoutError: If the job is still running after `timeout` seconds.
+            RuntimeError: If the job did not finish successfully.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            status = await asyncio.to_thread(self.status)
+            if callback is not None:
+                callback(status)
+            if status.done:
+                return self._check(status)
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Loading job '{self.job_id}' did not finish in {timeout}s."
+                )
+            await asyncio.sleep(self.poll_interval)
+
+    def cancel(self) -> bool:
+        """
+        Abort the job. Data loaded before the abort stays in the graph.
+
+        The status is polled once after the abort, so a job that had already ended
+        on the server is reported as such.
+
+        Returns:
+            True if the job was aborted or is being aborted, False if the abort
+            failed or the job had already ended.
+        """
+        if self._finished:
+            return False
+        logger.info(f"Aborting loading job: {self.job_id}...")
+        result = self._tigergraph_api.gsql(
+            f"USE GRAPH {self.graph_name}\nABORT LOADING JOB {self.job_id}"
+        )
+        logger.debug(f"GSQL response: {result}")
+        if any(marker in str(result).lower() for marker in _ABORT_FAILURE_MARKERS):
+            logger.warning(
+                f"Failed to abort loading job '{self.job_id}'. GSQL response: {result}"
+            )
+            return False
+        # Mark the job before polling, so an ABORTED status is not an error
+        self.cancelled = True
+        status = self.status()
+        if status.done and status.status != "ABORTED":
+            self.cancelled = False
+            logger.info(
+                f"Loading job {self.job_id} had already ended with status "
+                f"{status.status}."
+            )
+            return False
+        return True
+
+    def _check(self, status: LoadingJobStatus) -> LoadingJobStatus:
+        if not status.succeeded and not self.cancelled:
+            error_msg = (
+                f"Loading job '{self.job_id}' ended with status {status.status}. "
+                f"Status: {status.raw}"
+            )
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+        logger.info(
+            f"Loading job {self.job_id} loaded {status.lines_loaded} lines and "
+            f"rejected {status.lines_rejected} in {status.duration:.2f}s."
+        )
+        return status
+
+    def _finish(self) -> None:
+        # Drop the loading job once, whichever of the pollers sees it end first
+        with self._lock:
+            if self._finished:
+                return
+            self._finished = True
+        try:
+            result = self._tigergraph_api.gsql(
+                f"USE GRAPH {self.graph_name}\nDROP JOB {self.job_name}"
+            )
+            if "Successfully dropped jobs" not in result:
+                logger.warning(
+                    f"Failed to drop loading job '{self.job_name}'. "
+                    f"GSQL response: {result}"
+                )
+        except Exception as e:
+            logger.warning(f"Failed to drop loading job '{self.job_name}': {e}")
+        if self._on_done is not None:
+            self._on_done()
+
+    @classmethod
+    def _parse_status(cls, job_id: str, raw: Dict[str, Any]) -> LoadingJobStatus:
+        overall = raw.get("overall", raw)
+        files = [
+            cls._parse_file(task)
+            for worker in raw.get("workers", [])
+            for task in worker.get("tasks", [])
+        ]
+        if not files and "statistics" in overall:
+            files = [cls._parse_file({"filename": "", **overall})]
+        duration = float(overall.get("duration", 0) or 0) / 1000
+        lines_read = sum(file.lines_read for file in files)
+        lines_per_second = overall.get("averageSpeed")
+        if lines_per_second is None:
+            lines_per_second = lines_read / duration if duration else 0.0
+        return LoadingJobStatus(
+            job_id=raw.get("jobId", job_id),
+            status=str(raw.get("status", overall.get("status", "UNKNOWN"))).upper(),
+            progress=float(overall.get("progress", 0) or 0),
+            duration=duration,
+            lines_per_second=float(lines_per_second),
+            files=files,
+            raw=raw,
+        )
+
+    @staticmethod
+    def _parse_file(task: Dict[str, Any]) -> LoadingFileProgress:
+        statistics = task.get("statistics", {})
+        lines = statistics.get("fileLevel", statistics)
+        loaded = int(lines.get("validLine", 0))
+        if "rejectLine" in lines:
+            rejected = int(lines["rejectLine"])
+        else:
+            rejected = sum(int(lines.get(key, 0)) for key in _REJECTED_LINE_KEYS)
+        read = lines.get("lineNumber", lines.get("totalLine"))
+        return LoadingFileProgress(
+            file_name=str(task.get("filename", task.get("fileName", ""))),
+            lines_read=int(read) if read is not None else loaded + rejected,
+            lines_loaded=loaded,
+            lines_rejected=rejected,
+        )
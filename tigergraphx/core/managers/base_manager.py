@@ -5,11 +5,34 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
+from typing import Any
+
 from tigergraphx.core.graph_context import GraphContext
 
 
 class BaseManager:
     def __init__(self, context: GraphContext):
+        self._context = context
         self._tigergraph_api = context.tigergraph_api
         self._graph_schema = context.graph_schema
         self._graph_name = self._graph_schema.graph_name
+
+    def _record_swallowed_error(
+        self, operation: str, error: Exception, log: bool = True
+    ) -> None:
+        self._tigergraph_api.record_swallowed_error(operation, error, log=log)
+
+    def _read(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Call a read-only TigerGraphAPI method, sharing the result of an identical
+        call already in flight from another thread. Calls are only shared if no
+        write was recorded on the graph in between.
+        """
+        method = getattr(self._tigergraph_api, method_name)
+        single_flight = self._tigergraph_api.single_flight
+        if single_flight is None:
+            return method(*args, **kwargs)
+        return single_flight.do(
+            (self._context.write_generation, method_name, args, kwargs),
+            lambda: method(*args, **kwargs),
+        )
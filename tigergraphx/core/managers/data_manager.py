@@ -6,12 +6,15 @@
 # under the License. The software is provided "AS IS", without warranty.
 
 import logging
-from typing import Dict
+import re
+import uuid
+from typing import Callable, Dict, Optional
 from pathlib import Path
 
 from .base_manager import BaseManager
 
 from tigergraphx.core.graph_context import GraphContext
+from tigergraphx.core.loading_job import LoadingJob
 from tigergraphx.config import LoadingJobConfig
 
 
@@ -52,9 +55,101 @@ class DataManager(BaseManager):
         logger.info("Data load completed successfully.")
         return result
 
+    def load_data_async(
+        self,
+        loading_job_config: LoadingJobConfig | Dict | str | Path,
+        poll_interval: float = 1.0,
+        on_done: Optional[Callable[[], None]] = None,
+    ) -> LoadingJob:
+        loading_job_config = LoadingJobConfig.ensure_config(loading_job_config)
+        # A unique name lets the same loading job run several times at once
+        loading_job_name = (
+            f"{loading_job_config.loading_job_name}_{uuid.uuid4().hex[:8]}"
+        )
+        logger.info(f"Starting data load for job: {loading_job_name}...")
+        gsql_script = self._create_gsql_start_loading_job(
+            loading_job_config, loading_job_name
+        )
+
+        result = self._tigergraph_api.gsql(gsql_script)
+        if f"Using graph '{self._graph_name}'" not in result:
+            error_msg = f"Failed to set graph context for '{self._graph_name}'. GSQL response: {result}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+        if "Successfully created loading jobs:" not in result:
+            error_msg = f"Loading job creation failed. GSQL response: {result}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+        match = re.search(r"Jobid:\s*(\S+)", result)
+        if match is None:
+            self._tigergraph_api.gsql(
+                f"USE GRAPH {self._graph_name}\nDROP JOB {loading_job_name}"
+            )
+            error_msg = f"Failed to start loading job. GSQL response: {result}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+        logger.info(f"Loading job started: {match.group(1)}")
+        return LoadingJob(
+            tigergraph_api=self._tigergraph_api,
+            graph_name=self._graph_name,
+            job_name=loading_job_name,
+            job_id=match.group(1),
+            poll_interval=poll_interval,
+            on_done=on_done,
+        )
+
     def _create_gsql_load_data(
         self,
         loading_job_config: LoadingJobConfig,
+    ) -> str:
+        graph_schema = self._graph_schema
+        loading_job_name = loading_job_config.loading_job_name
+        create_loading_job = self._create_gsql_create_loading_job(
+            loading_job_config, loading_job_name
+        )
+        gsql_script = f"""
+# 1. Use graph
+USE GRAPH {graph_schema.graph_name}
+
+# 2. Create loading job
+{create_loading_job}
+
+# 3. Run loading job
+RUN LOADING JOB {loading_job_name}
+
+# 4. Drop loading job
+DROP JOB {loading_job_name}
+"""
+        logger.debug("Generated GSQL script: %s", gsql_script)
+        return gsql_script.strip()
+
+    def _create_gsql_start_loading_job(
+        self,
+        loading_job_config: LoadingJobConfig,
+        loading_job_name: str,
+    ) -> str:
+        graph_schema = self._graph_schema
+        create_loading_job = self._create_gsql_create_loading_job(
+            loading_job_config, loading_job_name
+        )
+        # -noprint returns once the job has started instead of when it ends
+        gsql_script = f"""
+# 1. Use graph
+USE GRAPH {graph_schema.graph_name}
+
+# 2. Create loading job
+{create_loading_job}
+
+# 3. Start loading job
+RUN LOADING JOB -noprint {loading_job_name}
+"""
+        logger.debug("Generated GSQL script: %s", gsql_script)
+        return gsql_script.strip()
+
+    def _create_gsql_create_loading_job(
+        self,
+        loading_job_config: LoadingJobConfig,
+        loading_job_name: str,
     ) -> str:
         graph_schema = self._graph_schema
         # Define file paths for each file in config with numbered file names
@@ -208,27 +303,12 @@ class DataManager(BaseManager):
         define_files_section = "  # Define files\n  " + "\n  ".join(define_files)
         load_section = "  # Load vertices and edges\n  " + "\n  ".join(load_statements)
 
-        # Create the final GSQL script with each section layered
-        loading_job_name = loading_job_config.loading_job_name
-        gsql_script = f"""
-# 1. Use graph
-USE GRAPH {graph_schema.graph_name}
-
-# 2. Create loading job
-CREATE LOADING JOB {loading_job_name} FOR GRAPH {graph_schema.graph_name} {{
+        # Create the loading job definition with each section layered
+        return f"""CREATE LOADING JOB {loading_job_name} FOR GRAPH {graph_schema.graph_name} {{
 {define_files_section}
 
 {load_section}
-}}
-
-# 3. Run loading job
-RUN LOADING JOB {loading_job_name}
-
-# 4. Drop loading job
-DROP JOB {loading_job_name}
-"""
-        logger.debug("Generated GSQL script: %s", gsql_script)
-        return gsql_script.strip()
+}}"""
 
     @staticmethod
     def _format_column_name(column_name: str | int | Dict | None) -> str:
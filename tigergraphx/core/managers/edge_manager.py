@@ -5,12 +5,14 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
+import itertools
 import logging
 from typing import Any, Dict, List, Optional, Tuple
 
 from .base_manager import BaseManager
 
 from tigergraphx.core.graph_context import GraphContext
+from tigergraphx.config import DataType
 
 
 logger = logging.getLogger(__name__)
@@ -80,6 +82,50 @@ class EdgeManager(BaseManager):
             logger.error(f"Error adding edges: {e}")
             return None
 
+    def remove_edges(
+        self,
+        edges: List[Tuple[str, str]],
+        src_node_type: str,
+        edge_type: str,
+        tgt_node_type: str,
+        chunk_size: int = 1000,
+    ) -> int:
+        """
+        Delete edges by (source, target) pair with one query per chunk of pairs.
+
+        All edges between a pair are deleted, including every edge of a multi-edge.
+        """
+        edge_schema = self._graph_schema.edges.get(edge_type)
+        is_directed = getattr(edge_schema, "is_directed_edge", True)
+        unique_edges: Dict[Tuple[str, str], None] = {}
+        for src_id, tgt_id in edges:
+            # An undirected edge would otherwise be deleted and counted twice
+            if not is_directed and (tgt_id, src_id) in unique_edges:
+                continue
+            unique_edges[(src_id, tgt_id)] = None
+        pairs = list(unique_edges)
+
+        gsql_script = self._create_gsql_remove_edges(
+            src_node_type, edge_type, tgt_node_type
+        )
+        deleted = 0
+        for start in range(0, len(pairs), chunk_size):
+            chunk = pairs[start : start + chunk_size]
+            try:
+                separator = self._choose_separator(chunk)
+                params = {
+                    "sources": list(dict.fromkeys(src for src, _ in chunk)),
+                    "pairs": [src + separator + tgt for src, tgt in chunk],
+                    "separator": separator,
+                }
+                result = self._tigergraph_api.run_interpreted_query(gsql_script, params)
+                if result and isinstance(result, list):
+                    deleted += int(result[0].get("deleted", 0))
+            except Exception as e:
+                logger.error(f"Error removing {len(chunk)} edges: {e}")
+                break
+        return deleted
+
     def has_edge(
         self,
         src_node_id: str,
@@ -89,7 +135,8 @@ class EdgeManager(BaseManager):
         tgt_node_type: str,
     ) -> bool:
         try:
-            result = self._tigergraph_api.retrieve_a_edge(
+            result = self._read(
+                "retrieve_a_edge",
                 graph_name=self._graph_name,
                 source_node_type=src_node_type,
                 source_node_id=src_node_id,
@@ -98,7 +145,8 @@ class EdgeManager(BaseManager):
                 target_node_id=tgt_node_id,
             )
             return bool(result)
-        except Exception:
+        except Exception as e:
+            self._record_swallowed_error("has_edge", e)
             return False
 
     def get_edge_data(
@@ -110,7 +158,8 @@ class EdgeManager(BaseManager):
         tgt_node_type: str,
     ) -> Dict | Dict[int | str, Dict] | None:
         try:
-            result = self._tigergraph_api.retrieve_a_edge(
+            result = self._read(
+                "retrieve_a_edge",
                 graph_name=self._graph_name,
                 source_node_type=src_node_type,
                 source_node_id=src_node_id,
@@ -119,19 +168,131 @@ class EdgeManager(BaseManager):
                 target_node_id=tgt_node_id,
             )
             if isinstance(result, list) and result:
-                # Ensure elements are dicts
-                valid_edges = [edge for edge in result if isinstance(edge, dict)]
-                if not valid_edges:
-                    return None
-                # Single edge case
-                if len(valid_edges) == 1:
-                    return valid_edges[0].get("attributes", None)
-                # Multi-edge case
-                multi_edge_data = {}
-                for index, edge in enumerate(valid_edges):
-                    edge_id = edge.get("discriminator", index)
-                    multi_edge_data[edge_id] = edge.get("attributes", {})
-                return multi_edge_data
+                return self._to_edge_data(result)
             return None  # Return None if result is not a valid list or empty
-        except Exception:
-            return None  # Suppress errors (could log for debugging)
+        except Exception as e:
+            self._record_swallowed_error("get_edge_data", e)
+            return None
+
+    def get_edges_data(
+        self,
+        edges: List[Tuple[str, str]],
+        src_node_type: str,
+        edge_type: str,
+        tgt_node_type: str,
+    ) -> Dict[Tuple[str, str], Dict | Dict[int | str, Dict]]:
+        """
+        Retrieve the attributes of multiple edges of one type in one query.
+
+        Edges that do not exist are left out of the result.
+        """
+        if not edges:
+            return {}
+        gsql_script = self._create_gsql_get_edges_data(
+            src_node_type, edge_type, tgt_node_type
+        )
+        try:
+            params = {
+                "sources": list(dict.fromkeys(src for src, _ in edges)),
+                "targets": list(dict.fromkeys(tgt for _, tgt in edges)),
+            }
+            result = self._read("run_interpreted_query", gsql_script, params)
+            if not result or not isinstance(result, list):
+                return {}
+            # The query matches every source with every target, so keep only the
+            # requested pairs. Undirected edges may come back in either direction.
+            requested = set(edges)
+            found: Dict[Tuple[str, str], List[Dict]] = {}
+            for edge in result[0].get("edges", []):
+                if not isinstance(edge, dict):
+                    continue
+                pair = (str(edge.get("from_id")), str(edge.get("to_id")))
+                if pair not in requested and not edge.get("directed", True):
+                    pair = (pair[1], pair[0])
+                if pair in requested:
+                    found.setdefault(pair, []).append(edge)
+            return {pair: self._to_edge_data(found[pair]) for pair in found}
+        except Exception as e:
+            self._record_swallowed_error("get_edges_data", e)
+            return {}
+
+    @staticmethod
+    def _to_edge_data(edges: List) -> Dict | Dict[int | str, Dict] | None:
+        # Ensure elements are dicts
+        valid_edges = [edge for edge in edges if isinstance(edge, dict)]
+        if not valid_edges:
+            return None
+        # Single edge case
+        if len(valid_edges) == 1:
+            return valid_edges[0].get("attributes", None)
+        # Multi-edge case
+        multi_edge_data = {}
+        for index, edge in enumerate(valid_edges):
+            edge_id = edge.get("discriminator", index)
+            multi_edge_data[edge_id] = edge.get("attributes", {})
+        return multi_edge_data
+
+    def _create_gsql_get_edges_data(
+        self, src_node_type: str, edge_type: str, tgt_node_type: str
+    ) -> str:
+        """
+        Core function to generate a GSQL query to get the edges between nodes
+        """
+        query = f"""
+INTERPRET QUERY(
+  SET<VERTEX<{src_node_type}>> sources,
+  SET<VERTEX<{tgt_node_type}>> targets
+) FOR GRAPH {self._graph_name} {{
+  SetAccum<EDGE> @@set_edge;
+  Nodes = {{sources}};
+  Nodes =
+    SELECT s
+    FROM Nodes:s -({edge_type}:e)- {tgt_node_type}:t
+    WHERE t IN targets
+    ACCUM @@set_edge += e
+  ;
+  PRINT @@set_edge AS edges;
+}}"""
+        return query.strip()
+
+    def _create_gsql_remove_edges(
+        self, src_node_type: str, edge_type: str, tgt_node_type: str
+    ) -> str:
+        """
+        Core function to generate a GSQL query to delete edges by node pair
+        """
+        src_key = self._create_gsql_id_expression("s", src_node_type)
+        tgt_key = self._create_gsql_id_expression("t", tgt_node_type)
+        query = f"""
+INTERPRET QUERY(
+  SET<VERTEX<{src_node_type}>> sources,
+  SET<STRING> pairs,
+  STRING separator
+) FOR GRAPH {self._graph_name} {{
+  SumAccum<INT> @@deleted;
+  Nodes = {{sources}};
+  Nodes =
+    SELECT s
+    FROM Nodes:s -({edge_type}:e)- {tgt_node_type}:t
+    WHERE pairs.contains({src_key} + separator + {tgt_key})
+    ACCUM @@deleted += 1, DELETE (e)
+  ;
+  PRINT @@deleted AS deleted;
+}}"""
+        return query.strip()
+
+    def _create_gsql_id_expression(self, alias: str, node_type: str) -> str:
+        node_schema = self._graph_schema.nodes[node_type]
+        primary_key = node_schema.primary_key
+        data_type = node_schema.attributes[primary_key].data_type
+        if data_type == DataType.STRING:
+            return f"{alias}.{primary_key}"
+        return f"to_string({alias}.{primary_key})"
+
+    @staticmethod
+    def _choose_separator(edges: List[Tuple[str, str]]) -> str:
+        # A character absent from every ID keeps "source + separator + target"
+        # keys unambiguous
+        used = set().union(*(set(src + tgt) for src, tgt in edges))
+        candidates = itertools.chain("|\t~^", (chr(c) for c in range(0xE000, 0xF900)))
+        return next(c for c in candidates if c not in used)
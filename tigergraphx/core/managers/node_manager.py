@@ -64,28 +64,103 @@ class NodeManager(BaseManager):
             logger.error(f"Error removing node {node_id}: {e}")
             return False
 
+    def remove_nodes(
+        self, node_ids: List[str], node_type: str, chunk_size: int = 1000
+    ) -> int:
+        """Delete nodes by ID with one query per chunk of IDs."""
+        gsql_script = self._create_gsql_remove_nodes(node_type)
+        deleted = 0
+        for start in range(0, len(node_ids), chunk_size):
+            chunk = node_ids[start : start + chunk_size]
+            try:
+                params = {"input": chunk}
+                result = self._tigergraph_api.run_interpreted_query(gsql_script, params)
+                deleted += self._get_count(result, "deleted")
+            except Exception as e:
+                logger.error(f"Error removing {len(chunk)} nodes: {e}")
+                break
+        return deleted
+
+    def remove_nodes_where(
+        self,
+        node_type: str,
+        filter_expression: str,
+        node_alias: str = "s",
+        chunk_size: int = 1000,
+    ) -> int:
+        """
+        Delete the nodes matching a filter with one query per chunk of nodes. Only
+        as many nodes as matched at the start are deleted, so the loop ends even if
+        the deletions do not take effect.
+        """
+        count_script = self._create_gsql_count_nodes_where(
+            node_type, filter_expression, node_alias
+        )
+        gsql_script = self._create_gsql_remove_nodes_where(
+            node_type, filter_expression, node_alias, chunk_size
+        )
+        deleted = 0
+        try:
+            result = self._tigergraph_api.run_interpreted_query(count_script)
+            matched = self._get_count(result, "matched")
+        except Exception as e:
+            logger.error(f"Error counting nodes where {filter_expression}: {e}")
+            return deleted
+        while deleted < matched:
+            try:
+                result = self._tigergraph_api.run_interpreted_query(gsql_script)
+                chunk_deleted = self._get_count(result, "deleted")
+            except Exception as e:
+                logger.error(f"Error removing nodes where {filter_expression}: {e}")
+                break
+            deleted += chunk_deleted
+            # A partial or empty chunk means no matching nodes are left
+            if chunk_deleted < chunk_size:
+                break
+        return deleted
+
     def has_node(self, node_id: str, node_type: str) -> bool:
         try:
-            result = self._tigergraph_api.retrieve_a_node(
-                self._graph_name, node_type, node_id
+            result = self._read(
+                "retrieve_a_node", self._graph_name, node_type, node_id
             )
             return bool(result)
-        except Exception:
+        except Exception as e:
+            self._record_swallowed_error("has_node", e)
             return False
 
     def get_node_data(self, node_id: str, node_type: str) -> Dict | None:
         """Retrieve node attributes by type and ID."""
         try:
-            result = self._tigergraph_api.retrieve_a_node(
-                self._graph_name, node_type, node_id
+            result = self._read(
+                "retrieve_a_node", self._graph_name, node_type, node_id
             )
             if isinstance(result, List) and result:
                 return result[0].get("attributes", None)
             else:
                 raise TypeError(f"Unsupported type for result: {type(result)}")
-        except (TypeError, Exception):
+        except (TypeError, Exception) as e:
+            self._record_swallowed_error("get_node_data", e)
             return None
 
+    def get_nodes_data(self, node_ids: List[str], node_type: str) -> Dict[str, Dict]:
+        """Retrieve the attributes of multiple nodes of one type in one query."""
+        if not node_ids:
+            return {}
+        gsql_script = self._create_gsql_get_nodes_data(node_type)
+        try:
+            params = {"input": node_ids}
+            result = self._read("run_interpreted_query", gsql_script, params)
+            if not result or not isinstance(result, list):
+                return {}
+            return {
+                str(node["v_id"]): node.get("attributes", {})
+                for node in result[0].get("Nodes", [])
+            }
+        except Exception as e:
+            self._record_swallowed_error("get_nodes_data", e)
+            return {}
+
     def get_node_edges(
         self,
         node_id: str,
@@ -95,7 +170,7 @@ class NodeManager(BaseManager):
         gsql_script = self._create_gsql_get_node_edges(node_type, edge_types)
         try:
             params = {"input": node_id}
-            result = self._tigergraph_api.run_interpreted_query(gsql_script, params)
+            result = self._read("run_interpreted_query", gsql_script, params)
             if not result or not isinstance(result, list):
                 return []
             edges = result[0].get("edges", [])
@@ -153,3 +228,86 @@ INTERPRET QUERY(VERTEX<{node_type}> input) FOR GRAPH {self._graph_name} {{
   PRINT @@set_edge AS edges;
 }}"""
         return query.strip()
+
+    def _create_gsql_get_nodes_data(self, node_type: str) -> str:
+        """
+        Core function to generate a GSQL query to get the attributes of nodes
+        """
+        query = f"""
+INTERPRET QUERY(SET<VERTEX<{node_type}>> input) FOR GRAPH {self._graph_name} {{
+  Nodes = {{input}};
+  PRINT Nodes;
+}}"""
+        return query.strip()
+
+    def _create_gsql_remove_nodes(self, node_type: str) -> str:
+        """
+        Core function to generate a GSQL query to delete nodes by ID
+        """
+        query = f"""
+INTERPRET QUERY(SET<VERTEX<{node_type}>> input) FOR GRAPH {self._graph_name} {{
+  Nodes = {{input}};
+  Nodes =
+    SELECT s
+    FROM Nodes:s
+    POST-ACCUM DELETE (s)
+  ;
+  PRINT Nodes.size() AS deleted;
+}}"""
+        return query.strip()
+
+    def _create_gsql_count_nodes_where(
+        self,
+        node_type: str,
+        filter_expression: str,
+        node_alias: str,
+    ) -> str:
+        """
+        Core function to generate a GSQL query to count the nodes matching a filter
+        """
+        query = f"""
+INTERPRET QUERY() FOR GRAPH {self._graph_name} {{
+  Nodes = {{{node_type}.*}};
+  Nodes =
+    SELECT {node_alias}
+    FROM Nodes:{node_alias}
+    WHERE {filter_expression}
+  ;
+  PRINT Nodes.size() AS matched;
+}}"""
+        return query.strip()
+
+    def _create_gsql_remove_nodes_where(
+        self,
+        node_type: str,
+        filter_expression: str,
+        node_alias: str,
+        chunk_size: int,
+    ) -> str:
+        """
+        Core function to generate a GSQL query to delete a chunk of the nodes
+        matching a filter
+        """
+        query = f"""
+INTERPRET QUERY() FOR GRAPH {self._graph_name} {{
+  Nodes = {{{node_type}.*}};
+  Nodes =
+    SELECT {node_alias}
+    FROM Nodes:{node_alias}
+    WHERE {filter_expression}
+    LIMIT {chunk_size}
+  ;
+  Nodes =
+    SELECT s
+    FROM Nodes:s
+    POST-ACCUM DELETE (s)
+  ;
+  PRINT Nodes.size() AS deleted;
+}}"""
+        return query.strip()
+
+    @staticmethod
+    def _get_count(result: Any, key: str) -> int:
+        if not result or not isinstance(result, list):
+            return 0
+        return int(result[0].get(key, 0))
@@ -71,7 +71,7 @@ class QueryManager(BaseManager):
 
     def is_query_installed(self, query_name: str) -> bool:
         try:
-            query_info = self._tigergraph_api.get_query_info(self._graph_name)
+            query_info = self._read("get_query_info", self._graph_name)
             for query in query_info:
                 if (
                     query.get("name") == query_name
@@ -115,7 +115,7 @@ class QueryManager(BaseManager):
         """
         gsql_script = self._create_gsql_get_nodes(spec)
         try:
-            result = self._tigergraph_api.run_interpreted_query(gsql_script)
+            result = self._read("run_interpreted_query", gsql_script)
             if not result or not isinstance(result, list):
                 return self._initialize_empty_result(output_type)
             nodes = result[0].get("Nodes")
@@ -172,6 +172,7 @@ class QueryManager(BaseManager):
                 return pd.DataFrame(df[reordered_columns + remaining_columns])
         except Exception as e:
             logger.error(f"Error retrieving nodes for type {spec.node_type}: {e}")
+            self._record_swallowed_error("get_nodes", e, log=False)
         return self._initialize_empty_result(output_type)
 
     def get_edges(
@@ -205,7 +206,7 @@ class QueryManager(BaseManager):
     ) -> pd.DataFrame | List[Dict[str, Any]]:
         gsql_script = self._create_gsql_get_edges(spec)
         try:
-            result = self._tigergraph_api.run_interpreted_query(gsql_script)
+            result = self._read("run_interpreted_query", gsql_script)
             if not result or not isinstance(result, list):
                 return self._initialize_empty_result(output_type)
             rows = result[0].get("T")
@@ -243,6 +244,7 @@ class QueryManager(BaseManager):
                 return pd.DataFrame(df[ordered_cols + remaining_cols])
         except Exception as e:
             logger.error(f"Error retrieving edges: {e}")
+            self._record_swallowed_error("get_edges", e, log=False)
         return self._initialize_empty_result(output_type)
 
     def get_neighbors(
@@ -287,7 +289,7 @@ class QueryManager(BaseManager):
         """
         gsql_script, params = self._create_gsql_get_neighbors(spec)
         try:
-            result = self._tigergraph_api.run_interpreted_query(gsql_script, params)
+            result = self._read("run_interpreted_query", gsql_script, params)
             if not result or not isinstance(result, list):
                 return self._initialize_empty_result(output_type)
             neighbors = result[0].get("Neighbors")
@@ -339,6 +341,7 @@ class QueryManager(BaseManager):
             logger.error(
                 f"Error retrieving neighbors for node(s) {spec.start_nodes}: {e}"
             )
+            self._record_swallowed_error("get_neighbors", e, log=False)
         return self._initialize_empty_result(output_type)
 
     def bfs(
@@ -301,6 +301,37 @@ CREATE OR REPLACE QUERY api_search_{node_type}_{vector_attribute_name} (
   PRINT @@map_node_distance AS map_node_distance;
   PRINT Nodes;
 }}
+""".strip()
+                    )
+                    query_statements.append(
+                        f"""
+CREATE OR REPLACE QUERY api_search_batch_{node_type}_{vector_attribute_name} (
+  UINT k=10,
+  UINT dimension,
+  LIST<float> query_vectors
+) SYNTAX v3 {{
+  ListAccum<Float> @@query_vector;
+  MapAccum<Vertex, Float> @@map_node_distance;
+  MapAccum<Int, MapAccum<Vertex, Float>> @@map_query_node_distance;
+  INT num_queries = query_vectors.size() / dimension;
+
+  FOREACH i IN RANGE[0, num_queries - 1] DO
+    @@query_vector.clear();
+    FOREACH j IN RANGE[i * dimension, (i + 1) * dimension - 1] DO
+      @@query_vector += query_vectors.get(j);
+    END;
+    @@map_node_distance.clear();
+    Nodes = vectorSearch(
+      {{{node_type}.{vector_attribute_name}}},
+      @@query_vector,
+      k,
+      {{ distance_map: @@map_node_distance}}
+    );
+    @@map_query_node_distance += (i -> @@map_node_distance);
+  END;
+
+  PRINT @@map_query_node_distance AS map_query_node_distance;
+}}
 """.strip()
                     )
 
@@ -6,7 +6,7 @@
 # under the License. The software is provided "AS IS", without warranty.
 
 import logging
-from typing import Optional, Set
+from typing import Dict, List, Optional, Set
 
 from .base_manager import BaseManager
 
@@ -29,19 +29,44 @@ class StatisticsManager(BaseManager):
         gsql_script = self._create_gsql_degree(node_type, edge_type_set)
         try:
             params = {"input": node_id}
-            result = self._tigergraph_api.run_interpreted_query(gsql_script, params)
+            result = self._read("run_interpreted_query", gsql_script, params)
             if not result or not isinstance(result, list):
                 return 0
             return result[0].get("degree", 0)
         except Exception as e:
             logger.error(f"Error retrieving degree of node {node_id}: {e}")
+            self._record_swallowed_error("degree", e, log=False)
         return 0
 
+    def degrees(
+        self,
+        node_ids: List[str],
+        node_type: str,
+        edge_type_set: Optional[Set[str]] = None,
+    ) -> Dict[str, int]:
+        """Return the degrees of multiple nodes of one type in one query."""
+        if not node_ids:
+            return {}
+        gsql_script = self._create_gsql_degrees(node_type, edge_type_set)
+        try:
+            params = {"input": node_ids}
+            result = self._read("run_interpreted_query", gsql_script, params)
+            degrees = {}
+            if result and isinstance(result, list):
+                for node in result[0].get("Nodes", []):
+                    attributes = node.get("attributes", {})
+                    degrees[str(node["v_id"])] = attributes.get("degree", 0)
+            # Nodes without matching edges are not selected by the query
+            return {node_id: degrees.get(node_id, 0) for node_id in node_ids}
+        except Exception as e:
+            logger.error(f"Error retrieving degrees of {len(node_ids)} nodes: {e}")
+        return {node_id: 0 for node_id in node_ids}
+
     def number_of_nodes(self, node_type: Optional[str] = None) -> int:
         """Return the number of nodes for the given node type(s)."""
         gsql_script = self._create_gsql_number_of_nodes(node_type)
         try:
-            result = self._tigergraph_api.run_interpreted_query(gsql_script)
+            result = self._read("run_interpreted_query", gsql_script)
             # Perform checks
             if not isinstance(result, list):
                 raise ValueError(
@@ -68,7 +93,7 @@ class StatisticsManager(BaseManager):
         """Return the number of edges for the given edge type(s)."""
         gsql_script = self._create_gsql_number_of_edges(edge_type)
         try:
-            result = self._tigergraph_api.run_interpreted_query(gsql_script)
+            result = self._read("run_interpreted_query", gsql_script)
             # Perform checks
             if not isinstance(result, list):
                 raise ValueError(
@@ -99,21 +124,7 @@ class StatisticsManager(BaseManager):
         """
         Core function to generate a GSQL query to get the degree of a node
         """
-        if not edge_type_set:
-            from_clause = "FROM Nodes:s -()- :t"
-        else:
-            if (
-                isinstance(edge_type_set, set) and len(edge_type_set) == 1
-            ) or isinstance(edge_type_set, str):
-                edge_type = (
-                    edge_type_set
-                    if isinstance(edge_type_set, str)
-                    else next(iter(edge_type_set))
-                )
-                from_clause = f"FROM Nodes:s -({edge_type})- :t"
-            else:
-                edge_types_str = "|".join(edge_type_set)
-                from_clause = f"FROM Nodes:s -({edge_types_str})- :t"
+        from_clause = self._create_degree_from_clause(edge_type_set)
 
         # Generate the query
         query = f"""
@@ -129,6 +140,46 @@ INTERPRET QUERY(VERTEX<{node_type}> input) FOR GRAPH {self._graph_name} {{
 }}"""
         return query.strip()
 
+    def _create_gsql_degrees(
+        self,
+        node_type: str,
+        edge_type_set: Optional[Set[str]] = None,
+    ) -> str:
+        """
+        Core function to generate a GSQL query to get the degrees of nodes
+        """
+        from_clause = self._create_degree_from_clause(edge_type_set)
+
+        # Generate the query
+        query = f"""
+INTERPRET QUERY(SET<VERTEX<{node_type}>> input) FOR GRAPH {self._graph_name} {{
+  SumAccum<INT> @degree;
+  Nodes = {{input}};
+  Nodes =
+    SELECT s
+    {from_clause}
+    ACCUM  s.@degree += 1
+  ;
+  PRINT Nodes[Nodes.@degree AS degree];
+}}"""
+        return query.strip()
+
+    @staticmethod
+    def _create_degree_from_clause(edge_type_set: Optional[Set[str]] = None) -> str:
+        if not edge_type_set:
+            return "FROM Nodes:s -()- :t"
+        if (
+            isinstance(edge_type_set, set) and len(edge_type_set) == 1
+        ) or isinstance(edge_type_set, str):
+            edge_type = (
+                edge_type_set
+                if isinstance(edge_type_set, str)
+                else next(iter(edge_type_set))
+            )
+            return f"FROM Nodes:s -({edge_type})- :t"
+        edge_types_str = "|".join(edge_type_set)
+        return f"FROM Nodes:s -({edge_types_str})- :t"
+
     def _create_gsql_number_of_nodes(self, node_type: Optional[str] = None) -> str:
         # Generate the query
         if node_type is None or node_type == "":
@@ -6,7 +6,7 @@
 # under the License. The software is provided "AS IS", without warranty.
 
 import logging
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from .base_manager import BaseManager
 
@@ -19,6 +19,8 @@ logger = logging.getLogger(__name__)
 class VectorManager(BaseManager):
     def __init__(self, context: GraphContext):
         super().__init__(context)
+        # Installed queries missing on graphs whose schema predates them
+        self._missing_queries: Set[str] = set()
 
     def upsert(
         self,
@@ -87,8 +89,12 @@ class VectorManager(BaseManager):
         self._ensure_minimum_version("4.2.0")
         try:
             params = {"input": [(node_id, node_type) for node_id in node_ids]}
-            result = self._tigergraph_api.run_installed_query_get(
-                self._graph_name, "api_fetch", params
+            result = self._read(
+                "run_installed_query_get",
+                self._graph_name,
+                "api_fetch",
+                params,
+                idempotent=True,
             )
 
             if not result or not isinstance(result, list):
@@ -135,19 +141,37 @@ class VectorManager(BaseManager):
         limit: int = 10,
         return_attributes: Optional[str | List[str]] = None,
         candidate_ids: Optional[Set[str]] = None,
+        filter_expression: Optional[str] = None,
+        node_alias: str = "s",
     ) -> List[Dict]:
         self._ensure_minimum_version("4.2.0")
         try:
-            query_name = f"api_search_{node_type}_{vector_attribute_name}"
-            set_candidate = []
-            if candidate_ids:
-                set_candidate = [
-                    {"id": candidate_id, "type": node_type}
-                    for candidate_id in candidate_ids
-                ]
-            params = {"k": limit, "query_vector": data, "set_candidate": set_candidate}
-
-            result = self._execute_search_query(query_name, params)
+            if filter_expression:
+                # Candidate selection and vector search run in a single query
+                gsql_script, params = self._create_gsql_search(
+                    vector_attribute_name=vector_attribute_name,
+                    node_type=node_type,
+                    limit=limit,
+                    data=data,
+                    candidate_ids=candidate_ids,
+                    filter_expression=filter_expression,
+                    node_alias=node_alias,
+                )
+                result = self._execute_interpreted_search_query(gsql_script, params)
+            else:
+                query_name = f"api_search_{node_type}_{vector_attribute_name}"
+                set_candidate = []
+                if candidate_ids:
+                    set_candidate = [
+                        {"id": candidate_id, "type": node_type}
+                        for candidate_id in candidate_ids
+                    ]
+                params = {
+                    "k": limit,
+                    "query_vector": data,
+                    "set_candidate": set_candidate,
+                }
+                result = self._execute_search_query(query_name, params)
             if result is None:
                 return []
 
@@ -160,6 +184,93 @@ class VectorManager(BaseManager):
             )
             return []
 
+    def search_batch(
+        self,
+        data: List[List[float]],
+        vector_attribute_name: str,
+        node_type: str,
+        limit: int = 10,
+    ) -> List[List[Dict]]:
+        """
+        Search for similar nodes for multiple query vectors in a single request.
+        Graphs whose schema was created without the batch search query fall back to
+        one search per vector.
+        """
+        self._ensure_minimum_version("4.2.0")
+        if not data:
+            return []
+        dimension = len(data[0])
+        if any(len(vector) != dimension for vector in data):
+            logger.error("All query vectors must have the same dimension.")
+            return [[] for _ in data]
+        query_name = f"api_search_batch_{node_type}_{vector_attribute_name}"
+        if query_name not in self._missing_queries:
+            params = {
+                "k": limit,
+                "dimension": dimension,
+                "query_vectors": [value for vector in data for value in vector],
+            }
+            try:
+                result = self._read(
+                    "run_installed_query_post",
+                    self._graph_name,
+                    query_name,
+                    params,
+                    idempotent=True,
+                )
+                return self._process_batch_search_results(result, len(data), limit)
+            except Exception as e:
+                logger.error(
+                    f"Error performing batch vector search for vector attribute "
+                    f"{vector_attribute_name} of node type {node_type}: {e}"
+                )
+                if not self._is_query_installed(query_name):
+                    logger.warning(
+                        f"Query {query_name} is not installed; searching for each "
+                        "vector separately."
+                    )
+                    self._missing_queries.add(query_name)
+        batch_results = []
+        for vector in data:
+            nodes = self.search(
+                vector, vector_attribute_name, node_type, limit, return_attributes=[]
+            )
+            nodes.sort(key=lambda x: (x["distance"] is None, x["distance"] or 0.0))
+            batch_results.append(nodes)
+        return batch_results
+
+    def _process_batch_search_results(
+        self, result: Any, num_queries: int, limit: int
+    ) -> List[List[Dict]]:
+        """
+        Splits the result of a batch search into the sorted results of each query.
+        """
+        if not result or "map_query_node_distance" not in result[0]:
+            raise ValueError("'map_query_node_distance' key is missing in the result.")
+        map_query_node_distance = result[0]["map_query_node_distance"]
+        batch_results = []
+        for i in range(num_queries):
+            node_distances = map_query_node_distance.get(str(i), {})
+            sorted_nodes = sorted(node_distances.items(), key=lambda x: x[1])
+            batch_results.append(
+                [
+                    {"id": node_id, "distance": distance}
+                    for node_id, distance in sorted_nodes[:limit]
+                ]
+            )
+        return batch_results
+
+    def _is_query_installed(self, query_name: str) -> bool:
+        try:
+            query_info = self._read("get_query_info", self._graph_name)
+        except Exception as e:
+            logger.error(f"Error checking if query {query_name} is installed: {e}")
+            return True
+        return any(
+            query.get("name") == query_name and query.get("installed")
+            for query in query_info
+        )
+
     def search_multi_vector_attributes(
         self,
         data: List[float],
@@ -248,6 +359,49 @@ class VectorManager(BaseManager):
         filtered_results = [result for result in results if result.get("id") != node_id]
         return filtered_results[:limit]
 
+    def search_in_neighborhood(
+        self,
+        start_nodes: str | List[str],
+        start_node_type: str,
+        data: List[float],
+        vector_attribute_name: str,
+        node_type: str,
+        edge_type_set: Optional[Set[str]] = None,
+        max_hops: int = 1,
+        limit: int = 10,
+        return_attributes: Optional[str | List[str]] = None,
+        filter_expression: Optional[str] = None,
+        node_alias: str = "s",
+    ) -> List[Dict]:
+        """
+        Search for the top-k similar nodes within `max_hops` of the start nodes.
+        """
+        self._ensure_minimum_version("4.2.0")
+        try:
+            gsql_script, params = self._create_gsql_search_in_neighborhood(
+                start_nodes=start_nodes,
+                start_node_type=start_node_type,
+                data=data,
+                vector_attribute_name=vector_attribute_name,
+                node_type=node_type,
+                edge_type_set=edge_type_set,
+                max_hops=max_hops,
+                limit=limit,
+                filter_expression=filter_expression,
+                node_alias=node_alias,
+            )
+            result = self._execute_interpreted_search_query(gsql_script, params)
+            if result is None:
+                return []
+
+            return self._process_search_results(result, return_attributes)
+        except Exception as e:
+            logger.error(
+                f"Error performing neighborhood vector search for vector attribute "
+                f"{vector_attribute_name} of node type {node_type}: {e}"
+            )
+            return []
+
     def _execute_search_query(
         self,
         query_name: str,
@@ -258,13 +412,42 @@ class VectorManager(BaseManager):
         """
         self._ensure_minimum_version("4.2.0")
         try:
-            result = self._tigergraph_api.run_installed_query_post(
-                self._graph_name, query_name, params
+            result = self._read(
+                "run_installed_query_post",
+                self._graph_name,
+                query_name,
+                params,
+                idempotent=True,
             )
         except Exception as e:
             logger.error(f"Error executing query {query_name}: {e}")
             return None
 
+        return self._validate_search_result(result)
+
+    def _execute_interpreted_search_query(
+        self,
+        gsql_script: str,
+        params: Dict,
+    ) -> Optional[List[Dict]]:
+        """
+        Executes an interpreted search query and performs initial error checks.
+        """
+        self._ensure_minimum_version("4.2.0")
+        try:
+            result = self._read("run_interpreted_query", gsql_script, params)
+        except Exception as e:
+            logger.error(f"Error executing interpreted search query: {e}")
+            return None
+
+        return self._validate_search_result(result)
+
+    def _validate_search_result(
+        self, result: Optional[List[Dict]]
+    ) -> Optional[List[Dict]]:
+        """
+        Checks that a search result contains the distance map and the nodes.
+        """
         # Perform basic error checks
         if not result:
             logger.error("Query result is empty or None.")
@@ -280,6 +463,141 @@ class VectorManager(BaseManager):
 
         return result
 
+    def _create_gsql_search(
+        self,
+        vector_attribute_name: str,
+        node_type: str,
+        limit: int,
+        data: List[float],
+        candidate_ids: Optional[Set[str]] = None,
+        filter_expression: Optional[str] = None,
+        node_alias: str = "s",
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Generate a GSQL query that selects candidates by a filter expression and runs
+        `vectorSearch` over them. It mirrors the installed `api_search_*` query.
+        """
+        params: Dict[str, Any] = {"k": limit, "query_vector": data}
+        if candidate_ids:
+            params["set_candidate"] = list(candidate_ids)
+            seed_str = "{set_candidate}"
+            candidate_param_str = f",\n  SET<VERTEX<{node_type}>> set_candidate"
+        else:
+            seed_str = f"{{{node_type}.*}}"
+            candidate_param_str = ""
+
+        query = f"""
+INTERPRET QUERY(
+  UINT k=10,
+  LIST<FLOAT> query_vector{candidate_param_str}
+) FOR GRAPH {self._graph_name} SYNTAX v3 {{
+  MapAccum<Vertex, Float> @@map_node_distance;
+
+  Candidates = {seed_str};
+  Candidates =
+    SELECT {node_alias}
+    FROM Candidates:{node_alias}
+"""
+        if filter_expression:
+            query += f"    WHERE {filter_expression}\n"
+        query += f"""  ;
+  Nodes = Candidates;
+  IF Candidates.size() > 0 THEN
+    Nodes = vectorSearch(
+      {{{node_type}.{vector_attribute_name}}},
+      query_vector,
+      k,
+      {{ distance_map: @@map_node_distance, candidate_set: Candidates}}
+    );
+  END;
+
+  PRINT @@map_node_distance AS map_node_distance;
+  PRINT Nodes;
+}}"""
+        return (query.strip(), params)
+
+    def _create_gsql_search_in_neighborhood(
+        self,
+        start_nodes: str | List[str],
+        start_node_type: str,
+        data: List[float],
+        vector_attribute_name: str,
+        node_type: str,
+        edge_type_set: Optional[Set[str]] = None,
+        max_hops: int = 1,
+        limit: int = 10,
+        filter_expression: Optional[str] = None,
+        node_alias: str = "s",
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Generate a GSQL query that expands the start nodes up to `max_hops` and runs
+        `vectorSearch` over the reached nodes of the given type.
+        """
+        if max_hops < 1:
+            raise ValueError(f"max_hops must be at least 1, but got {max_hops}.")
+        params: Dict[str, Any] = {
+            "k": limit,
+            "query_vector": data,
+            "start_nodes": [start_nodes]
+            if isinstance(start_nodes, str)
+            else list(start_nodes),
+        }
+        edge_types_str = (
+            f"(({'|'.join(sorted(edge_type_set))}):e)"
+            if edge_type_set and len(edge_type_set) > 1
+            else f"({'|'.join(edge_type_set)}:e)"
+            if edge_type_set
+            else "(:e)"
+        )
+        where_conditions = [f'{node_alias}.type == "{node_type}"']
+        if filter_expression:
+            where_conditions.append(f"({filter_expression})")
+        where_clause = " AND ".join(where_conditions)
+
+        query = f"""
+INTERPRET QUERY(
+  UINT k=10,
+  LIST<FLOAT> query_vector,
+  SET<VERTEX<{start_node_type}>> start_nodes
+) FOR GRAPH {self._graph_name} SYNTAX v3 {{
+  MapAccum<Vertex, Float> @@map_node_distance;
+  SetAccum<VERTEX> @@set_reached;
+  OrAccum @visited;
+
+  Frontier = {{start_nodes}};
+  Frontier =
+    SELECT s
+    FROM Frontier:s
+    POST-ACCUM s.@visited += TRUE;
+  WHILE Frontier.size() > 0 LIMIT {max_hops} DO
+    Frontier =
+      SELECT t
+      FROM Frontier:s -{edge_types_str}- :t
+      WHERE t.@visited == FALSE
+      POST-ACCUM t.@visited += TRUE, @@set_reached += t;
+  END;
+
+  Candidates = {{@@set_reached}};
+  Candidates =
+    SELECT {node_alias}
+    FROM Candidates:{node_alias}
+    WHERE {where_clause}
+  ;
+  Nodes = Candidates;
+  IF Candidates.size() > 0 THEN
+    Nodes = vectorSearch(
+      {{{node_type}.{vector_attribute_name}}},
+      query_vector,
+      k,
+      {{ distance_map: @@map_node_distance, candidate_set: Candidates}}
+    );
+  END;
+
+  PRINT @@map_node_distance AS map_node_distance;
+  PRINT Nodes;
+}}"""
+        return (query.strip(), params)
+
     def _process_search_results(
         self,
         result: List[Dict],
@@ -0,0 +1,226 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import asyncio
+import copy
+import logging
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+
+from .graph import Graph
+
+logger = logging.getLogger(__name__)
+
+
+class PointReadBatcher:
+    """
+    Batches concurrent point reads of a graph into single queries, in the style of
+    a DataLoader.
+
+    Lookups awaited from many coroutines are collected for `batch_window` seconds,
+    or until `max_batch_size` distinct keys are waiting, and then sent as one query
+    per kind of lookup and type. Each caller receives its own result. Identical
+    lookups in the same batch are fetched once.
+
+    Example:
+        ```python
+        batcher = PointReadBatcher(graph)
+        exists, degree = await asyncio.gather(
+            batcher.has_node("Alice"), batcher.degree("Bob")
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        graph: Graph,
+        batch_window: float = 0.002,
+        max_batch_size: int = 100,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            graph: The graph to read from.
+            batch_window: Seconds to wait for more lookups after the first one.
+            max_batch_size: Number of distinct keys that sends a batch immediately.
+        """
+        if max_batch_size <= 0:
+            raise ValueError("Parameter 'max_batch_size' must be greater than 0.")
+        self.graph = graph
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.batches = 0
+        self.loads = 0
+        self._pending: Dict[Tuple, Dict[Hashable, List[asyncio.Future]]] = {}
+        self._timers: Dict[Tuple, asyncio.TimerHandle] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def has_node(
+        self, node_id: str | int, node_type: Optional[str] = None
+    ) -> bool:
+        """
+        Check if a node exists in the graph.
+
+        Args:
+            node_id: The identifier of the node.
+            node_type: The type of the node.
+
+        Returns:
+            True if the node exists, False otherwise.
+        """
+        return await self.get_node_data(node_id, node_type) is not None
+
+    async def get_node_data(
+        self, node_id: str | int, node_type: Optional[str] = None
+    ) -> Dict | None:
+        """
+        Get data for a specific node.
+
+        Args:
+            node_id: The identifier of the node.
+            node_type: The type of the node.
+
+        Returns:
+            The node data or None if not found.
+        """
+        return await self._load(("node", node_type), str(node_id))
+
+    async def degree(
+        self,
+        node_id: str | int,
+        node_type: Optional[str] = None,
+        edge_types: Optional[List[str] | str] = None,
+    ) -> int:
+        """
+        Get the out-degree of a node based on the specified edge types.
+
+        Args:
+            node_id: Node identifier.
+            node_type: Node type.
+            edge_types: List of edge types to consider. If None, use all edge types.
+
+        Returns:
+            The out-degree of the node.
+        """
+        if isinstance(edge_types, list):
+            edge_types = tuple(sorted(edge_types))
+        return await self._load(("degree", node_type, edge_types), str(node_id))
+
+    async def has_edge(
+        self,
+        src_node_id: str | int,
+        tgt_node_id: str | int,
+        src_node_type: Optional[str] = None,
+        edge_type: Optional[str] = None,
+        tgt_node_type: Optional[str] = None,
+    ) -> bool:
+        """
+        Check if an edge exists in the graph.
+
+        Args:
+            src_node_id: Source node identifier.
+            tgt_node_id: Target node identifier.
+            src_node_type: Source node type.
+            edge_type: Edge type.
+            tgt_node_type: Target node type.
+
+        Returns:
+            True if the edge exists, False otherwise.
+        """
+        edge_data = await self.get_edge_data(
+            src_node_id, tgt_node_id, src_node_type, edge_type, tgt_node_type
+        )
+        return edge_data is not None
+
+    async def get_edge_data(
+        self,
+        src_node_id: str | int,
+        tgt_node_id: str | int,
+        src_node_type: Optional[str] = None,
+        edge_type: Optional[str] = None,
+        tgt_node_type: Optional[str] = None,
+    ) -> Dict | Dict[int | str, Dict] | None:
+        """
+        Get data for a specific edge.
+
+        Args:
+            src_node_id: Source node identifier.
+            tgt_node_id: Target node identifier.
+            src_node_type: Source node type.
+            edge_type: Edge type.
+            tgt_node_type: Target node type.
+
+        Returns:
+            The edge data or None if not found.
+        """
+        return await self._load(
+            ("edge", src_node_type, edge_type, tgt_node_type),
+            (str(src_node_id), str(tgt_node_id)),
+        )
+
+    async def _load(self, group: Tuple, key: Hashable) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._pending.setdefault(group, {})
+        batch.setdefault(key, []).append(future)
+        self.loads += 1
+        if len(batch) >= self.max_batch_size:
+            self._dispatch(group)
+        elif group not in self._timers:
+            self._timers[group] = loop.call_later(
+                self.batch_window, self._dispatch, group
+            )
+        return await future
+
+    def _dispatch(self, group: Tuple) -> None:
+        timer = self._timers.pop(group, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(group, None)
+        if not batch:
+            return
+        self.batches += 1
+        task = asyncio.ensure_future(self._run(group, batch))
+        # Keep a reference so the task is not garbage collected while running
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(
+        self, group: Tuple, batch: Dict[Hashable, List[asyncio.Future]]
+    ) -> None:
+        keys = list(batch)
+        try:
+            results, default = await asyncio.to_thread(self._fetch, group, keys)
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        for key, futures in batch.items():
+            result = results.get(key, default)
+            for index, future in enumerate(futures):
+                if not future.done():
+                    # Callers of the same key each receive their own copy
+                    future.set_result(result if index == 0 else copy.deepcopy(result))
+
+    def _fetch(self, group: Tuple, keys: List) -> Tuple[Dict, Any]:
+        kind = group[0]
+        logger.debug(f"Fetching a batch of {len(keys)} {kind} lookups.")
+        if kind == "node":
+            _, node_type = group
+            return self.graph.get_nodes_data(keys, node_type), None
+        if kind == "degree":
+            _, node_type, edge_types = group
+            if isinstance(edge_types, tuple):
+                edge_types = list(edge_types)
+            return self.graph.degrees(keys, node_type, edge_types), 0
+        _, src_node_type, edge_type, tgt_node_type = group
+        return (
+            self.graph.get_edges_data(keys, src_node_type, edge_type, tgt_node_type),
+            None,
+        )
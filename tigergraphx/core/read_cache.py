@@ -0,0 +1,158 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import copy
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import pandas as pd
+
+
+class ReadCache:
+    """
+    Size-bounded LRU cache with TTL for the results of graph reads.
+
+    Cached values are copied on the way in and out, so callers may modify the
+    results they receive. Memory use is estimated when a value is stored.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = 60.0):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached results.
+            ttl: Seconds a result stays valid. None means results never expire.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, Tuple[Any, Optional[float], int]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._memory_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        # Incremented on every clear, so reads that raced a write are not stored
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """
+        Return counters describing the cache's effect so far.
+
+        Returns:
+            Hits, misses, evictions, invalidations, the number of entries and their
+            estimated memory use in bytes.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "entries": len(self._entries),
+                "memory_bytes": self._memory_bytes,
+            }
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        load: Callable[[], Any],
+        cacheable: Optional[Callable[[], bool]] = None,
+    ) -> Any:
+        """
+        Return the cached result for a key, loading and caching it on a miss.
+
+        Args:
+            key: The normalized read specification.
+            load: Performs the read.
+            cacheable: Called after a load; if it returns False, the result is
+                returned without being cached, e.g. because it is an error fallback.
+
+        Returns:
+            A copy of the result.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at, _ = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return self._copy(value)
+                self._remove(key)
+            self._misses += 1
+            generation = self._generation
+
+        value = load()
+        if cacheable is None or cacheable():
+            self._store(key, value, generation)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a result, evicting the least recently used results if needed.
+
+        Args:
+            key: The normalized read specification.
+            value: The result to cache.
+        """
+        self._store(key, value, None)
+
+    def clear(self) -> None:
+        """Remove all cached results, e.g. after a write."""
+        with self._lock:
+            if self._entries:
+                self._invalidations += 1
+            self._entries.clear()
+            self._memory_bytes = 0
+            self._generation += 1
+
+    def _store(self, key: Hashable, value: Any, generation: Optional[int]) -> None:
+        value = self._copy(value)
+        size = self._estimate_size(value)
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, expires_at, size)
+            self._memory_bytes += size
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, size = self._entries.pop(key)
+        self._memory_bytes -= size
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        if isinstance(value, pd.DataFrame):
+            return value.copy()
+        return copy.deepcopy(value)
+
+    @classmethod
+    def _estimate_size(cls, value: Any) -> int:
+        if isinstance(value, pd.DataFrame):
+            return int(value.memory_usage(index=True, deep=True).sum())
+        if isinstance(value, dict):
+            return sys.getsizeof(value) + sum(
+                cls._estimate_size(k) + cls._estimate_size(v) for k, v in value.items()
+            )
+        if isinstance(value, (list, tuple, set)):
+            return sys.getsizeof(value) + sum(cls._estimate_size(v) for v in value)
+        return sys.getsizeof(value)
@@ -14,6 +14,7 @@ from .data_source_api import DataSourceAPI, DataSourceType
 from .node_api import NodeAPI
 from .edge_api import EdgeAPI
 from .query_api import QueryAPI 
+from .loading_job_api import LoadingJobAPI
 from .upsert_api import UpsertAPI
 
 __all__ = [
@@ -27,5 +28,6 @@ __all__ = [
     "NodeAPI",
     "EdgeAPI",
     "QueryAPI",
+    "LoadingJobAPI",
     "UpsertAPI",
 ]
@@ -18,6 +18,14 @@ class AdminAPI(BaseAPI):
             raise TypeError(f"Expected str, but got {type(result).__name__}: {result}")
         return result
 
+    def check_health(self, host: str) -> bool:
+        # Send a single ping, bypassing retries and load balancing
+        try:
+            self._send_request(endpoint_name="ping", host=host)
+            return True
+        except Exception:
+            return False
+
     def get_version(self) -> str:
         try:
             result = self._request(endpoint_name="get_version")
@@ -23,27 +23,38 @@ from requests.exceptions import (
 import logging
 
 from ..endpoint_handler.endpoint_registry import EndpointRegistry
+from ..host_pool import HostPool
 
 from tigergraphx.config import TigerGraphConnectionConfig
+from tigergraphx.utils import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
 
 class BaseAPI:
+    # Name of the circuit breaker shared by load balanced requests
+    _POOL_CIRCUIT = "host_pool"
+
     def __init__(
         self,
         config: TigerGraphConnectionConfig,
         endpoint_registry: EndpointRegistry,
         session: Session,
         version: Literal["3.x", "4.x"] = "4.x",
+        retry_policy: Optional[RetryPolicy] = None,
+        host_pool: Optional[HostPool] = None,
     ):
         """
         Initializes the BaseAPI with a shared session and endpoint registry.
+        Requests are retried according to `retry_policy` if one is given, and
+        REST++ requests are spread across `host_pool` if one is given.
         """
         self.config = config
         self.endpoint_registry = endpoint_registry
         self.session = session
         self.version: Literal["3.x", "4.x"] = version
+        self.retry_policy = retry_policy
+        self.host_pool = host_pool
 
     def _request(
         self,
@@ -51,18 +62,122 @@ class BaseAPI:
         params: Optional[Dict] = None,
         data: Optional[Dict | str] = None,
         json: Optional[Dict] = None,
+        host: Optional[str] = None,
+        idempotent: Optional[bool] = None,
+        **path_kwargs,
+    ) -> Dict | List | str:
+        """
+        Sends an HTTP request using resolved endpoint details. REST++ requests are
+        spread across the host pool, while other requests go to the configured host.
+        Idempotent endpoints are retried on transient failures according to the
+        retry policy, while other endpoints are sent once; `idempotent` overrides the
+        endpoint's setting for one call. Load balanced requests choose a host on every
+        attempt, so retries move away from a failing host, and share the circuit
+        breaker of the pool; other requests go through the circuit breaker of their
+        host. Raises exceptions on failure.
+        """
+        if self.retry_policy is None and self.host_pool is None:
+            return self._send_request(
+                endpoint_name, params, data, json, host=host, **path_kwargs
+            )
+        try:
+            endpoint = self.endpoint_registry.get_endpoint(
+                endpoint_name, self.version, **path_kwargs
+            )
+        except ValueError:
+            # Let _send_request report the invalid endpoint
+            endpoint = None
+        if host is None and not self._is_load_balanced(endpoint):
+            host = str(self.config.host)
+        if self.retry_policy is None:
+            return self._send_to_host(
+                host, endpoint_name, params, data, json, **path_kwargs
+            )
+        if idempotent is None:
+            idempotent = endpoint is not None and endpoint.get("idempotent", False)
+        max_attempts = self.config.max_retries + 1 if idempotent else 1
+        # Ejected hosts are skipped by the pool, so its circuit only opens when
+        # requests keep failing whichever host they go to
+        circuit = self._POOL_CIRCUIT if host is None else host
+        for attempt in self.retry_policy.retrying(circuit, max_attempts):
+            with attempt:
+                return self._send_to_host(
+                    host, endpoint_name, params, data, json, **path_kwargs
+                )
+        raise RuntimeError(f"Request to {endpoint_name} was not attempted.")
+
+    def _is_load_balanced(self, endpoint: Optional[Dict[str, Any]]) -> bool:
+        """
+        Checks whether a request is spread across the host pool. Only REST++
+        endpoints, which every cluster node serves, are load balanced; GSQL and DDL
+        requests stay on one host.
+        """
+        return (
+            self.host_pool is not None
+            and endpoint is not None
+            and endpoint["path"].startswith("/restpp/")
+        )
+
+    def _select_host(self) -> str:
+        """
+        Chooses a host from the pool for one attempt of a load balanced request.
+        """
+        if self.host_pool is None:
+            return str(self.config.host)
+        return self.host_pool.select()
+
+    def _send_to_host(
+        self,
+        host: Optional[str],
+        endpoint_name: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict | str] = None,
+        json: Optional[Dict] = None,
+        **path_kwargs,
+    ) -> Dict | List | str:
+        """
+        Sends a single HTTP request to a pinned host, or to a host chosen from the
+        pool. Only the outcomes of pool requests are reported to the pool, where
+        transient failures count against the host.
+        """
+        if host is not None or self.host_pool is None:
+            return self._send_request(
+                endpoint_name, params, data, json, host=host, **path_kwargs
+            )
+        host = self._select_host()
+        with self.host_pool.track(host):
+            try:
+                result = self._send_request(
+                    endpoint_name, params, data, json, host=host, **path_kwargs
+                )
+            except Exception as e:
+                if self.retry_policy is None or self.retry_policy.is_retryable(e):
+                    self.host_pool.record_failure(host)
+                else:
+                    self.host_pool.record_success(host)
+                raise
+        self.host_pool.record_success(host)
+        return result
+
+    def _send_request(
+        self,
+        endpoint_name: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict | str] = None,
+        json: Optional[Dict] = None,
+        host: Optional[str] = None,
         **path_kwargs,
     ) -> Dict | List | str:
         """
-        Sends an HTTP request using resolved endpoint details.
-        Raises exceptions on failure.
+        Sends a single HTTP request using resolved endpoint details, to the
+        configured host unless another host is given. Raises exceptions on failure.
         """
         try:
             # Resolve endpoint details
             endpoint = self.endpoint_registry.get_endpoint(
                 endpoint_name, self.version, **path_kwargs
             )
-            base_url = f"{str(self.config.host).rstrip('/')}"
+            base_url = f"{str(host or self.config.host).rstrip('/')}"
             url = (
                 f"{base_url}:{getattr(self.config, endpoint['port'])}{endpoint['path']}"
             )
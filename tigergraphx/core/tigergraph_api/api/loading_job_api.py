@@ -0,0 +1,28 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Dict
+
+from .base_api import BaseAPI
+
+
+class LoadingJobAPI(BaseAPI):
+    def get_loading_job_status(self, graph_name: str, job_id: str) -> Dict:
+        result = self._request(
+            endpoint_name="get_loading_job_status",
+            graph_name=graph_name,
+            job_id=job_id,
+        )
+        # The status is returned as a list holding one entry per job
+        if isinstance(result, list):
+            result = next(
+                (item for item in result if item.get("jobId") == job_id),
+                result[0] if result else None,
+            )
+        if not isinstance(result, dict):
+            raise TypeError(f"Expected dict, but got {type(result).__name__}: {result}")
+        return result
@@ -59,12 +59,17 @@ class QueryAPI(BaseAPI):
         return result
 
     def run_installed_query_get(
-        self, graph_name: str, query_name: str, params: Optional[Dict[str, Any]] = None
+        self,
+        graph_name: str,
+        query_name: str,
+        params: Optional[Dict[str, Any]] = None,
+        idempotent: bool = False,
     ) -> List:
         parsed_params = self._parse_query_parameters(params) if params else None
         result = self._request(
             endpoint_name="run_installed_query_get",
             params=parsed_params,
+            idempotent=idempotent,
             graph_name=graph_name,
             query_name=query_name,
         )
@@ -73,11 +78,16 @@ class QueryAPI(BaseAPI):
         return result
 
     def run_installed_query_post(
-        self, graph_name: str, query_name: str, json: Optional[Dict[str, Any]] = None
+        self,
+        graph_name: str,
+        query_name: str,
+        json: Optional[Dict[str, Any]] = None,
+        idempotent: bool = False,
     ) -> List:
         result = self._request(
             endpoint_name="run_installed_query_post",
             json=json,
+            idempotent=idempotent,
             graph_name=graph_name,
             query_name=query_name,
         )
@@ -43,6 +43,7 @@ class EndpointRegistry:
         default_method = defaults.get("method", "GET")
         default_port = defaults.get("port", "gsql_port")
         default_content_type = defaults.get("content_type", "application/json")
+        default_idempotent = defaults.get("idempotent", False)
 
         for name, details in self.raw_config["endpoints"].items():
             # Retrieve path
@@ -78,6 +79,7 @@ class EndpointRegistry:
                 "methods": methods,
                 "ports": ports,
                 "content_types": content_types,
+                "idempotent": bool(details.get("idempotent", default_idempotent)),
             }
 
         return endpoints
@@ -127,4 +129,10 @@ class EndpointRegistry:
             )
         content_type = endpoint["content_types"][version]
 
-        return {"path": path, "method": method, "port": port, "content_type": content_type}
+        return {
+            "path": path,
+            "method": method,
+            "port": port,
+            "content_type": content_type,
+            "idempotent": endpoint["idempotent"],
+        }
@@ -0,0 +1,238 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Literal, Optional
+
+logger = logging.getLogger(__name__)
+
+LoadBalancing = Literal["round_robin", "least_outstanding", "latency"]
+
+
+class HostState:
+    """Load balancing state of one host."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.outstanding = 0
+        self.latency: Optional[float] = None
+        self.failures = 0
+        self.ejected_until: Optional[float] = None
+        self.probing = False
+
+
+class HostPool:
+    """
+    Selects cluster hosts for requests that any node can serve.
+
+    Hosts are chosen in turn, by fewest requests in flight, or by lowest recent
+    latency. A host is ejected after `ejection_threshold` consecutive failures and
+    skipped for `ejection_duration` seconds. After that, the next selection starts a
+    background ping with `health_check`, and the host is restored once the ping
+    succeeds. Selections never wait for the ping.
+    """
+
+    # Weight of the newest sample in the moving average of latencies
+    _LATENCY_ALPHA = 0.3
+
+    def __init__(
+        self,
+        hosts: List[str],
+        load_balancing: LoadBalancing = "round_robin",
+        ejection_threshold: int = 3,
+        ejection_duration: float = 30.0,
+        health_check: Optional[Callable[[str], bool]] = None,
+    ):
+        """
+        Initialize the pool with all hosts healthy.
+
+        Args:
+            hosts: Base URLs of the hosts.
+            load_balancing: Strategy for choosing among healthy hosts.
+            ejection_threshold: Consecutive failures that eject a host.
+            ejection_duration: Seconds an ejected host is skipped.
+            health_check: Returns whether a host is healthy, e.g. by pinging it.
+                None restores ejected hosts without checking them.
+        """
+        if not hosts:
+            raise ValueError("At least one host is required.")
+        self.load_balancing = load_balancing
+        self.ejection_threshold = ejection_threshold
+        self.ejection_duration = ejection_duration
+        self.health_check = health_check
+        self._hosts = [HostState(url) for url in dict.fromkeys(hosts)]
+        self._states: Dict[str, HostState] = {h.url: h for h in self._hosts}
+        self._next = 0
+        self._lock = threading.Lock()
+
+    @property
+    def hosts(self) -> List[str]:
+        """Return the URLs of all hosts."""
+        return [h.url for h in self._hosts]
+
+    @property
+    def healthy_hosts(self) -> List[str]:
+        """Return the URLs of hosts that are not ejected."""
+        now = time.monotonic()
+        with self._lock:
+            return [h.url for h in self._hosts if not self._is_ejected(h, now)]
+
+    def select(self) -> str:
+        """
+        Choose a host for the next request.
+
+        Returns:
+            The URL of a healthy host. If all hosts are ejected, the one whose
+            ejection ends first is returned, so requests still fail visibly.
+        """
+        self._probe_expired_hosts()
+        now = time.monotonic()
+        with self._lock:
+            candidates = [h for h in self._hosts if not self._is_ejected(h, now)]
+            if not candidates:
+                return min(self._hosts, key=lambda h: h.ejected_until or 0.0).url
+            # Rotate the start so ties are broken in turn
+            start = self._next % len(candidates)
+            self._next += 1
+            candidates = candidates[start:] + candidates[:start]
+            if self.load_balancing == "least_outstanding":
+                return min(candidates, key=lambda h: h.outstanding).url
+            if self.load_balancing == "latency":
+                # Hosts without samples are tried first so every host gets measured
+                return min(candidates, key=lambda h: h.latency or 0.0).url
+            return candidates[0].url
+
+    @contextmanager
+    def track(self, url: str) -> Iterator[None]:
+        """
+        Count a request to a host as outstanding while the block runs, and record
+        its latency when it succeeds.
+
+        Args:
+            url: The URL of the host.
+        """
+        state = self._states.get(url)
+        if state is None:
+            yield
+            return
+        with self._lock:
+            state.outstanding += 1
+        start = time.monotonic()
+        try:
+            yield
+            latency = time.monotonic() - start
+            with self._lock:
+                state.latency = (
+                    latency
+                    if state.latency is None
+                    else self._LATENCY_ALPHA * latency
+                    + (1 - self._LATENCY_ALPHA) * state.latency
+                )
+        finally:
+            with self._lock:
+                state.outstanding -= 1
+
+    def record_success(self, url: str) -> None:
+        """
+        Record a successful request, resetting the host's failure count.
+
+        Args:
+            url: The URL of the host.
+        """
+        state = self._states.get(url)
+        if state is None:
+            return
+        with self._lock:
+            state.failures = 0
+
+    def record_failure(self, url: str) -> None:
+        """
+        Record a failed request, ejecting the host at the threshold.
+
+        Args:
+            url: The URL of the host.
+        """
+        state = self._states.get(url)
+        if state is None:
+            return
+        with self._lock:
+            state.failures += 1
+            if state.failures >= self.ejection_threshold:
+                self._eject(state)
+
+    def check_health(self) -> Dict[str, bool]:
+        """
+        Run the health check against every host, ejecting failing hosts and
+        restoring healthy ones.
+
+        Returns:
+            Whether each host is healthy, keyed by URL.
+        """
+        return {h.url: self._probe(h) for h in self._hosts}
+
+    def _probe_expired_hosts(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                h
+                for h in self._hosts
+                if h.ejected_until is not None
+                and h.ejected_until <= now
+                and not h.probing
+            ]
+            for h in expired:
+                h.probing = True
+        for h in expired:
+            if self.health_check is None:
+                self._run_probe(h)
+            else:
+                threading.Thread(
+                    target=self._run_probe,
+                    args=(h,),
+                    name=f"host-probe-{h.url}",
+                    daemon=True,
+                ).start()
+
+    def _run_probe(self, state: HostState) -> None:
+        try:
+            self._probe(state)
+        finally:
+            with self._lock:
+                state.probing = False
+
+    def _probe(self, state: HostState) -> bool:
+        healthy = True
+        if self.health_check is not None:
+            try:
+                healthy = self.health_check(state.url)
+            except Exception as e:
+                logger.debug(f"Health check of {state.url} failed: {e}")
+                healthy = False
+        with self._lock:
+            if healthy:
+                if state.ejected_until is not None:
+                    logger.info(f"Host {state.url} is healthy again.")
+                state.failures = 0
+                state.ejected_until = None
+            else:
+                self._eject(state)
+        return healthy
+
+    def _eject(self, state: HostState) -> None:
+        if state.ejected_until is None:
+            logger.warning(f"Ejecting host {state.url} for {self.ejection_duration}s.")
+        state.ejected_until = time.monotonic() + self.ejection_duration
+
+    @staticmethod
+    def _is_ejected(state: HostState, now: float) -> bool:
+        # A host stays ejected while it is being probed
+        return state.ejected_until is not None and (
+            state.ejected_until > now or state.probing
+        )
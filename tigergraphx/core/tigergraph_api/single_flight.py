@@ -0,0 +1,114 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import copy
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """A call in flight and the number of callers waiting for it."""
+
+    def __init__(self):
+        self.future: Future = Future()
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls into one.
+
+    The first caller for a key runs the call; callers arriving with the same key
+    before it finishes wait for it and share its outcome. Once the call finishes
+    the key is forgotten, so later callers run it again. Nothing is cached.
+
+    Shared results are deep-copied for each caller, so callers may modify them.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(self, key: Any, fn: Callable[[], T]) -> T:
+        """
+        Run a call, or wait for the identical call already in flight.
+
+        Args:
+            key: Identifies the call. Lists, dicts and sets are made hashable; calls
+                with unhashable keys are not coalesced.
+            fn: Performs the call.
+
+        Returns:
+            The result of the call.
+        """
+        key = self._make_key(key)
+        if key is None:
+            return fn()
+        call, leader = self._join(key)
+        if leader:
+            self._execute(key, call, fn)
+        return self._result(call, leader)
+
+    def _join(self, key: Hashable) -> Tuple[_Call, bool]:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.coalesced += 1
+                return call, False
+            call = _Call()
+            self._calls[key] = call
+            return call, True
+
+    def _execute(self, key: Hashable, call: _Call, fn: Callable[[], Any]) -> None:
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key)
+            call.future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+        else:
+            self._finish(key)
+            call.future.set_result(result)
+
+    def _finish(self, key: Hashable) -> None:
+        # Callers arriving from now on start a new call
+        with self._lock:
+            self._calls.pop(key, None)
+
+    @staticmethod
+    def _result(call: _Call, leader: bool) -> Any:
+        result = call.future.result()
+        # The leader keeps the original unless others share it
+        if leader and call.waiters == 0:
+            return result
+        return copy.deepcopy(result)
+
+    @classmethod
+    def _make_key(cls, key: Any) -> Optional[Hashable]:
+        try:
+            frozen = cls._freeze(key)
+            hash(frozen)
+        except TypeError:
+            return None
+        return frozen
+
+    @classmethod
+    def _freeze(cls, value: Any) -> Any:
+        if isinstance(value, dict):
+            items = sorted(value.items(), key=lambda item: str(item[0]))
+            return (dict, tuple((k, cls._freeze(v)) for k, v in items))
+        if isinstance(value, (list, tuple)):
+            return (type(value), tuple(cls._freeze(v) for v in value))
+        if isinstance(value, (set, frozenset)):
+            return (frozenset, frozenset(cls._freeze(v) for v in value))
+        return value
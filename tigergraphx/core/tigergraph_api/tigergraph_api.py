@@ -5,12 +5,17 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
+import logging
+import threading
+from collections import Counter
 from typing import Any, Dict, List, Literal, Optional
 from pathlib import Path
 from requests import Session
 from requests.auth import AuthBase, HTTPBasicAuth
 
 from .endpoint_handler.endpoint_registry import EndpointRegistry
+from .host_pool import HostPool
+from .single_flight import SingleFlight
 from .api import (
     AdminAPI,
     GSQLAPI,
@@ -20,11 +25,15 @@ from .api import (
     NodeAPI,
     EdgeAPI,
     QueryAPI,
+    LoadingJobAPI,
     UpsertAPI,
 )
 from .api.data_source_api import DataSourceType
 
 from tigergraphx.config import TigerGraphConnectionConfig
+from tigergraphx.utils import RetryPolicy
+
+logger = logging.getLogger(__name__)
 
 
 class BearerAuth(AuthBase):
@@ -77,6 +86,34 @@ class TigerGraphAPI:
         # Create a shared session
         self.session = self._initialize_session()
 
+        # Retry idempotent requests, with one circuit breaker per host
+        self.retry_policy = RetryPolicy(
+            max_attempts=self.config.max_retries + 1,
+            max_wait=self.config.retry_backoff_max,
+            failure_threshold=self.config.circuit_breaker_threshold,
+            reset_timeout=self.config.circuit_breaker_reset_timeout,
+        )
+        # Updated from worker threads, such as those of concurrent reads
+        self.swallowed_error_counts: Counter[str] = Counter()
+        self.swallowed_error_total = 0
+        self._swallowed_error_lock = threading.Lock()
+
+        # Spread REST++ requests across cluster nodes if hosts are given
+        self.host_pool: Optional[HostPool] = None
+        if self.config.hosts:
+            self.host_pool = HostPool(
+                hosts=[str(host) for host in self.config.hosts],
+                load_balancing=self.config.load_balancing,
+                ejection_threshold=self.config.host_ejection_threshold,
+                ejection_duration=self.config.host_ejection_duration,
+                health_check=lambda host: self._admin_api.check_health(host),
+            )
+
+        # Share identical concurrent reads made through the graph managers
+        self.single_flight: Optional[SingleFlight] = (
+            SingleFlight() if self.config.coalesce_reads else None
+        )
+
         # Get the version of TigerGraph
         self.full_version, self.version = self._fetch_and_validate_version()
 
@@ -87,31 +124,84 @@ class TigerGraphAPI:
 
         # Initialize API classes
         self._admin_api = AdminAPI(
-            self.config, self.endpoint_registry, self.session, self.version
+            self.config,
+            self.endpoint_registry,
+            self.session,
+            self.version,
+            retry_policy=self.retry_policy,
+            host_pool=self.host_pool,
         )
         self._gsql_api = GSQLAPI(
-            self.config, self.endpoint_registry, self.session, self.version
+            self.config,
+            self.endpoint_registry,
+            self.session,
+            self.version,
+            retry_policy=self.retry_policy,
+            host_pool=self.host_pool,
         )
         self._security_api = SecurityAPI(
-            self.config, self.endpoint_registry, self.session, self.version
+            self.config,
+            self.endpoint_registry,
+            self.session,
+            self.version,
+            retry_policy=self.retry_policy,
+            host_pool=self.host_pool,
         )
         self._data_source_api = DataSourceAPI(
-            self.config, self.endpoint_registry, self.session, self.version
+            self.config,
+            self.endpoint_registry,
+            self.session,
+            self.version,
+            retry_policy=self.retry_policy,
+            host_pool=self.host_pool,
         )
         self._schema_api = SchemaAPI(
-            self.config, self.endpoint_registry, self.session, self.version
+            self.config,
+            self.endpoint_registry,
+            self.session,
+            self.version,
+            retry_policy=self.retry_policy,
+            host_pool=self.host_pool,
         )
         self._node_api = NodeAPI(
-            self.config, self.endpoint_registry, self.session, self.version
+            self.config,
+            self.endpoint_registry,
+            self.session,
+            self.version,
+            retry_policy=self.retry_policy,
+            host_pool=self.host_pool,
         )
         self._edge_api = EdgeAPI(
-            self.config, self.endpoint_registry, self.session, self.version
+            self.config,
+            self.endpoint_registry,
+            self.session,
+            self.version,
+            retry_policy=self.retry_policy,
+            host_pool=self.host_pool,
         )
         self._query_api = QueryAPI(
-            self.config, self.endpoint_registry, self.session, self.version
+            self.config,
+            self.endpoint_registry,
+            self.session,
+            self.version,
+            retry_policy=self.retry_policy,
+            host_pool=self.host_pool,
+        )
+        self._loading_job_api = LoadingJobAPI(
+            self.config,
+            self.endpoint_registry,
+            self.session,
+            self.version,
+            retry_policy=self.retry_policy,
+            host_pool=self.host_pool,
         )
         self._upsert_api = UpsertAPI(
-            self.config, self.endpoint_registry, self.session, self.version
+            self.config,
+            self.endpoint_registry,
+            self.session,
+            self.version,
+            retry_policy=self.retry_policy,
+            host_pool=self.host_pool,
         )
 
     # ------------------------------ Admin ------------------------------
@@ -133,6 +223,19 @@ class TigerGraphAPI:
         """
         return self._admin_api.get_version()
 
+    def check_health(self) -> Dict[str, bool]:
+        """
+        Ping every host, ejecting failing hosts from load balancing and restoring
+        healthy ones.
+
+        Returns:
+            Whether each host is healthy, keyed by URL.
+        """
+        if self.host_pool is None:
+            host = str(self.config.host)
+            return {host: self._admin_api.check_health(host)}
+        return self.host_pool.check_health()
+
     # ------------------------------ GSQL ------------------------------
     def gsql(self, command: str) -> str:
         """
@@ -163,7 +266,9 @@ class TigerGraphAPI:
         Returns:
             The generated authentication token as a string.
         """
-        return self._security_api.create_token(secret_alias, graph_name, lifetime_seconds)
+        return self._security_api.create_token(
+            secret_alias, graph_name, lifetime_seconds
+        )
 
     def drop_token(
         self,
@@ -480,7 +585,11 @@ class TigerGraphAPI:
         return self._query_api.run_interpreted_query(gsql_query, params)
 
     def run_installed_query_get(
-        self, graph_name: str, query_name: str, params: Optional[Dict[str, Any]] = None
+        self,
+        graph_name: str,
+        query_name: str,
+        params: Optional[Dict[str, Any]] = None,
+        idempotent: bool = False,
     ) -> List:
         """
         Run an installed query using HTTP GET.
@@ -489,14 +598,22 @@ class TigerGraphAPI:
             graph_name: The name of the graph.
             query_name: The name of the installed query.
             params: Optional parameters for the query.
+            idempotent: Whether the query only reads, so it may be retried after
+                transient failures. Queries that write are sent once.
 
         Returns:
             Query result as a list.
         """
-        return self._query_api.run_installed_query_get(graph_name, query_name, params)
+        return self._query_api.run_installed_query_get(
+            graph_name, query_name, params, idempotent=idempotent
+        )
 
     def run_installed_query_post(
-        self, graph_name: str, query_name: str, params: Optional[Dict[str, Any]] = None
+        self,
+        graph_name: str,
+        query_name: str,
+        params: Optional[Dict[str, Any]] = None,
+        idempotent: bool = False,
     ) -> List:
         """
         Run an installed query using HTTP POST.
@@ -505,11 +622,15 @@ class TigerGraphAPI:
             graph_name: The name of the graph.
             query_name: The name of the installed query.
             params: Optional parameters for the query.
+            idempotent: Whether the query only reads, so it may be retried after
+                transient failures. Queries that write are sent once.
 
         Returns:
             Query result as a list.
         """
-        return self._query_api.run_installed_query_post(graph_name, query_name, params)
+        return self._query_api.run_installed_query_post(
+            graph_name, query_name, params, idempotent=idempotent
+        )
 
     def get_query_info(self, graph_name: str) -> List:
         """
@@ -525,6 +646,20 @@ class TigerGraphAPI:
         """
         return self._query_api.get_query_info(graph_name)
 
+    # ------------------------------ Loading Job ------------------------------
+    def get_loading_job_status(self, graph_name: str, job_id: str) -> Dict:
+        """
+        Retrieve the progress of a loading job run.
+
+        Args:
+            graph_name: The name of the graph.
+            job_id: The ID of the loading job run.
+
+        Returns:
+            The status of the run, including per-file loading statistics.
+        """
+        return self._loading_job_api.get_loading_job_status(graph_name, job_id)
+
     # ------------------------------ Upsert ------------------------------
     def upsert_graph_data(self, graph_name: str, payload: Dict[str, Any]) -> List:
         """
@@ -539,6 +674,32 @@ class TigerGraphAPI:
         """
         return self._upsert_api.upsert_graph_data(graph_name, payload)
 
+    # ------------------------------ Errors ------------------------------
+    def record_swallowed_error(
+        self, operation: str, error: Exception, log: bool = True
+    ) -> None:
+        """
+        Count and log an error that a caller handles without raising it.
+
+        Transient errors, such as timeouts and 5xx responses, are logged as warnings
+        because they hide failed requests. Other errors, such as missing nodes, are
+        expected results and only logged at debug level.
+
+        Args:
+            operation: Name of the operation that failed.
+            error: The handled error.
+            log: Whether to log the error, False if the caller already has.
+        """
+        with self._swallowed_error_lock:
+            self.swallowed_error_counts[operation] += 1
+            self.swallowed_error_total += 1
+        if not log:
+            return
+        if self.retry_policy.is_retryable(error):
+            logger.warning(f"Transient error ignored in {operation}: {error}")
+        else:
+            logger.debug(f"Error ignored in {operation}: {error}")
+
     def _initialize_session(self) -> Session:
         """
         Create a shared requests.Session with retries and default headers.
@@ -577,7 +738,13 @@ class TigerGraphAPI:
         Raises:
             ValueError: If the version is not supported.
         """
-        admin_api = AdminAPI(self.config, self.endpoint_registry, self.session, "4.x")
+        admin_api = AdminAPI(
+            self.config,
+            self.endpoint_registry,
+            self.session,
+            "4.x",
+            retry_policy=self.retry_policy,
+        )
         full_version = admin_api.get_version()
 
         if full_version.startswith("4."):
@@ -19,6 +19,7 @@ from tigergraphx.config import (
 from tigergraphx.llm import (
     OpenAIManager,
     OpenAIChat,
+    BaseResponseCache,
 )
 from tigergraphx.vector_search import (
     OpenAIEmbedding,
@@ -28,11 +29,15 @@ from tigergraphx.vector_search import (
 
 
 def create_openai_components(
-    config: Settings | Path | str | Dict, graph: Optional[Graph] = None
+    config: Settings | Path | str | Dict,
+    graph: Optional[Graph] = None,
+    response_cache: Optional[BaseResponseCache] = None,
 ) -> tuple[OpenAIChat, TigerVectorSearchEngine]:
     """
     Creates an OpenAIChat instance and a TigerVectorSearchEngine
     from a shared configuration. Reuses the same OpenAIManager instance for both components.
+    An optional response cache is passed to the OpenAIChat instance; otherwise the
+    chat configuration decides whether responses are cached.
     """
     # Ensure configuration is a Settings instance
     settings = Settings.ensure_config(config)
@@ -58,6 +63,7 @@ def create_openai_components(
     openai_chat = OpenAIChat(
         llm_manager=llm_manager,
         config=settings.chat,
+        cache=response_cache,
     )
 
     embedding = OpenAIEmbedding(llm_manager, settings.embedding)
@@ -6,6 +6,7 @@
 # under the License. The software is provided "AS IS", without warranty.
 
 from .base_context_builder import BaseContextBuilder
+from .map_reduce import MapReduceExecutor, MapReduceResult
 from .evaluation import (
     BaseRAGEvaluator,
     RagasEvaluator,
@@ -15,4 +16,6 @@ __all__ = [
     "BaseRAGEvaluator",
     "RagasEvaluator",
     "BaseContextBuilder",
+    "MapReduceExecutor",
+    "MapReduceResult",
 ]
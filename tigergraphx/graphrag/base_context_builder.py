@@ -25,6 +25,9 @@ class BaseContextBuilder(ABC):
         token_encoder: Token encoder for text tokenization.
     """
 
+    # Rows converted and tokenized at a time by batch_and_convert_to_text
+    _ROW_CHUNK_SIZE = 1024
+
     def __init__(
         self,
         graph: Graph,
@@ -62,45 +65,80 @@ class BaseContextBuilder(ABC):
         section_name: str,
         single_batch: bool = False,
         max_tokens: int = 12000,
+        estimate_by_bytes: bool = True,
     ) -> str | List[str]:
         """
         Convert graph data to a formatted string or list of strings in batches based on token count.
 
+        Rows are converted and tokenized in chunks, so a single batch stops reading
+        rows once the budget is exhausted. With `estimate_by_bytes`, rows are only
+        tokenized near the budget: a text never has more tokens than UTF-8 bytes, so
+        rows whose bytes fit in the remaining budget are accepted without encoding.
+        The batches are the same either way.
+
         Args:
             graph_data: The graph data to convert.
             section_name: The section name for the header.
             single_batch: Whether to process data in a single batch. Defaults to False.
             max_tokens: Maximum number of tokens per batch. Defaults to 12000.
+            estimate_by_bytes: Whether to skip tokenizing rows whose byte length
+                fits in the remaining budget. Defaults to True.
 
         Returns:
             The formatted graph data as a string or list of strings.
         """
         header = f"-----{section_name}-----\n" + "|".join(graph_data.columns) + "\n"
-        content_rows = [
-            "|".join(str(value) for value in row) for row in graph_data.values
-        ]
-
         header_tokens = self._num_tokens(header, self.token_encoder)
-        batches = []
-        current_batch = header
-        current_tokens = header_tokens
-
-        for row in content_rows:
-            row_tokens = self._num_tokens(row, self.token_encoder)
-
-            if current_tokens + row_tokens > max_tokens:
-                batches.append(current_batch.strip())
-                if single_batch:
-                    return batches[0]
 
-                current_batch = header + row + "\n"
-                current_tokens = header_tokens + row_tokens
-            else:
-                current_batch += row + "\n"
-                current_tokens += row_tokens
-
-        if current_batch.strip():
-            batches.append(current_batch.strip())
+        batches: List[str] = []
+        current_rows: List[str] = []
+        current_tokens = header_tokens
+        # Trailing rows of the current batch accepted by their byte length only
+        uncounted_rows = 0
+        uncounted_bytes = 0
+
+        values = graph_data.values
+        for start in range(0, len(values), self._ROW_CHUNK_SIZE):
+            rows = [
+                "|".join(str(value) for value in row)
+                for row in values[start : start + self._ROW_CHUNK_SIZE]
+            ]
+            row_tokens: List[int] = []
+            counted_from: Optional[int] = None
+
+            for i, row in enumerate(rows):
+                if counted_from is None and estimate_by_bytes:
+                    row_bytes = len(row.encode("utf-8"))
+                    if current_tokens + uncounted_bytes + row_bytes <= max_tokens:
+                        current_rows.append(row)
+                        uncounted_rows += 1
+                        uncounted_bytes += row_bytes
+                        continue
+
+                # Near the budget: count the pending rows and the rest exactly
+                if uncounted_rows:
+                    current_tokens += sum(
+                        self._num_tokens_batch(current_rows[-uncounted_rows:])
+                    )
+                    uncounted_rows = 0
+                    uncounted_bytes = 0
+                if counted_from is None:
+                    row_tokens = self._num_tokens_batch(rows[i:])
+                    counted_from = i
+                num_tokens = row_tokens[i - counted_from]
+
+                if current_tokens + num_tokens > max_tokens:
+                    batches.append(self._join_batch(header, current_rows))
+                    if single_batch:
+                        return batches[0]
+
+                    current_rows = [row]
+                    current_tokens = header_tokens + num_tokens
+                else:
+                    current_rows.append(row)
+                    current_tokens += num_tokens
+
+        batches.append(self._join_batch(header, current_rows))
 
         return batches[0] if single_batch else batches
 
@@ -139,6 +177,32 @@ class BaseContextBuilder(ABC):
             return search_results
         return []
 
+    def _num_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Return the number of tokens in each of the given texts.
+
+        Args:
+            texts: The texts to tokenize.
+
+        Returns:
+            The number of tokens in each text.
+        """
+        return [len(tokens) for tokens in self.token_encoder.encode_batch(texts)]
+
+    @staticmethod
+    def _join_batch(header: str, rows: List[str]) -> str:
+        """
+        Join a header and rows into the text of one batch.
+
+        Args:
+            header: The section header.
+            rows: The formatted rows.
+
+        Returns:
+            The batch text.
+        """
+        return (header + "".join(row + "\n" for row in rows)).strip()
+
     @staticmethod
     def _num_tokens(text: str, token_encoder: tiktoken.Encoding | None = None) -> int:
         """
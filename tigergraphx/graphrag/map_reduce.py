@@ -0,0 +1,265 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+import tiktoken
+
+logger = logging.getLogger(__name__)
+
+Point = Dict[str, Any]
+
+
+@dataclass
+class MapReduceResult:
+    """
+    Result of a map-reduce run.
+
+    Attributes:
+        points: The reduced points, sorted by descending score.
+        timings: Seconds spent in the "map" and "reduce" stages and in "total".
+        mapped_items: Number of items sent to the map function.
+        skipped_items: Number of items skipped after the early cutoff.
+        reduce_levels: Number of tree reduction levels that were needed.
+    """
+
+    points: List[Point]
+    timings: Dict[str, float] = field(default_factory=dict)
+    mapped_items: int = 0
+    skipped_items: int = 0
+    reduce_levels: int = 0
+
+
+class MapReduceExecutor:
+    """
+    Runs the map-reduce stages of a global query with bounded concurrency.
+
+    The map stage turns each context chunk into scored points, for example
+    `{"description": ..., "score": ...}`, running at most `max_concurrency` map
+    calls at once. Once `enough_points` points scoring at least `min_score` are
+    collected, the remaining chunks are skipped.
+
+    The reduce stage keeps the formatted points within `token_budget`. If they
+    exceed it, the points are split into groups that fit, and each group is
+    condensed by the reduce function into fewer points. This repeats level by
+    level until the points fit.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        token_budget: Optional[int] = None,
+        enough_points: Optional[int] = None,
+        min_score: float = 0,
+        max_reduce_levels: int = 3,
+        token_encoder: Optional[tiktoken.Encoding] = None,
+        format_point: Optional[Callable[[Point], str]] = None,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            max_concurrency: Maximum number of map or reduce calls in flight.
+            token_budget: Maximum number of tokens of the formatted points. None
+                disables tree reduction.
+            enough_points: Number of points scoring at least `min_score` after which
+                the remaining chunks are skipped. None maps every chunk.
+            min_score: Score a point needs to count towards `enough_points`.
+            max_reduce_levels: Maximum number of tree reduction levels. Points that
+                still exceed the budget are truncated by score.
+            token_encoder: Token encoder for the budget. Defaults to "cl100k_base".
+            format_point: Formats a point as one line of text. Defaults to
+                "{description} (Score: {score})".
+        """
+        if max_concurrency <= 0:
+            raise ValueError("Parameter 'max_concurrency' must be greater than 0.")
+        self.max_concurrency = max_concurrency
+        self.token_budget = token_budget
+        self.enough_points = enough_points
+        self.min_score = min_score
+        self.max_reduce_levels = max_reduce_levels
+        self.format_point = format_point or self._default_format_point
+        self._token_encoder = token_encoder
+
+    @property
+    def token_encoder(self) -> tiktoken.Encoding:
+        """Return the token encoder, loading the default one on first use."""
+        if self._token_encoder is None:
+            self._token_encoder = tiktoken.get_encoding("cl100k_base")
+        return self._token_encoder
+
+    async def run(
+        self,
+        items: Sequence[Any],
+        map_fn: Callable[[Any], Awaitable[List[Point]]],
+        reduce_fn: Optional[Callable[[str], Awaitable[List[Point]]]] = None,
+    ) -> MapReduceResult:
+        """
+        Map every item to points, then reduce the points to the token budget.
+
+        Args:
+            items: The items to map, processed in order.
+            map_fn: Returns the scored points of one item.
+            reduce_fn: Condenses the formatted text of a group of points into fewer
+                points. Without it, points over the budget are truncated by score.
+
+        Returns:
+            The reduced points with per-stage timings.
+        """
+        start = time.perf_counter()
+        points, mapped_items = await self._map(items, map_fn)
+        map_done = time.perf_counter()
+        points, reduce_levels = await self._reduce(points, reduce_fn)
+        end = time.perf_counter()
+
+        result = MapReduceResult(
+            points=points,
+            timings={
+                "map": map_done - start,
+                "reduce": end - map_done,
+                "total": end - start,
+            },
+            mapped_items=mapped_items,
+            skipped_items=len(items) - mapped_items,
+            reduce_levels=reduce_levels,
+        )
+        logger.info(
+            f"Map-reduce mapped {result.mapped_items} of {len(items)} items in "
+            f"{result.timings['map']:.2f}s and reduced {len(points)} points in "
+            f"{reduce_levels} levels in {result.timings['reduce']:.2f}s."
+        )
+        return result
+
+    def format_points(self, points: List[Point]) -> str:
+        """
+        Format points as text, one point per line.
+
+        Args:
+            points: The points to format.
+
+        Returns:
+            The formatted points.
+        """
+        return "\n".join(self.format_point(point) for point in points)
+
+    async def _map(
+        self,
+        items: Sequence[Any],
+        map_fn: Callable[[Any], Awaitable[List[Point]]],
+    ) -> tuple[List[Point], int]:
+        points: List[Point] = []
+        good_points = 0
+        next_index = 0
+        pending: set[asyncio.Task] = set()
+
+        def enough() -> bool:
+            return self.enough_points is not None and good_points >= self.enough_points
+
+        # Start items as others finish, so at most max_concurrency are in flight
+        while pending or (next_index < len(items) and not enough()):
+            while (
+                next_index < len(items)
+                and len(pending) < self.max_concurrency
+                and not enough()
+            ):
+                pending.add(asyncio.ensure_future(map_fn(items[next_index])))
+                next_index += 1
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                try:
+                    mapped = task.result() or []
+                except BaseException:
+                    for other in pending:
+                        other.cancel()
+                    raise
+                points.extend(mapped)
+                good_points += sum(
+                    1 for point in mapped if self._score(point) >= self.min_score
+                )
+        return self._sorted(points), next_index
+
+    async def _reduce(
+        self,
+        points: List[Point],
+        reduce_fn: Optional[Callable[[str], Awaitable[List[Point]]]],
+    ) -> tuple[List[Point], int]:
+        if self.token_budget is None:
+            return points, 0
+        levels = 0
+        while self._num_tokens(points) > self.token_budget:
+            if reduce_fn is None or levels >= self.max_reduce_levels:
+                return self._truncate(points), levels
+            groups = self._split(points)
+            if len(groups) <= 1:
+                # A single point over the budget cannot be reduced further
+                return self._truncate(points), levels
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def reduce_group(group: List[Point]) -> List[Point]:
+                async with semaphore:
+                    return await reduce_fn(self.format_points(group)) or []
+
+            reduced = await asyncio.gather(*(reduce_group(g) for g in groups))
+            points = self._sorted([point for group in reduced for point in group])
+            levels += 1
+        return points, levels
+
+    def _split(self, points: List[Point]) -> List[List[Point]]:
+        """Split points, in score order, into groups within the token budget."""
+        assert self.token_budget is not None
+        groups: List[List[Point]] = []
+        group: List[Point] = []
+        group_tokens = 0
+        for point, tokens in zip(points, self._point_tokens(points)):
+            if group and group_tokens + tokens > self.token_budget:
+                groups.append(group)
+                group, group_tokens = [], 0
+            group.append(point)
+            group_tokens += tokens
+        if group:
+            groups.append(group)
+        return groups
+
+    def _truncate(self, points: List[Point]) -> List[Point]:
+        """Keep the highest-scoring points that fit in the token budget."""
+        assert self.token_budget is not None
+        kept: List[Point] = []
+        total = 0
+        for point, tokens in zip(points, self._point_tokens(points)):
+            if total + tokens > self.token_budget:
+                break
+            kept.append(point)
+            total += tokens
+        return kept
+
+    def _num_tokens(self, points: List[Point]) -> int:
+        return sum(self._point_tokens(points))
+
+    def _point_tokens(self, points: List[Point]) -> List[int]:
+        # Each point takes one line, so count its newline as well
+        lines = [self.format_point(point) + "\n" for point in points]
+        return [len(tokens) for tokens in self.token_encoder.encode_batch(lines)]
+
+    @classmethod
+    def _sorted(cls, points: List[Point]) -> List[Point]:
+        return sorted(points, key=cls._score, reverse=True)
+
+    @staticmethod
+    def _score(point: Point) -> float:
+        try:
+            return float(point.get("score", 0))
+        except (TypeError, ValueError):
+            return 0.0
+
+    @staticmethod
+    def _default_format_point(point: Point) -> str:
+        return f"{point.get('description', '')} (Score: {point.get('score', 0)})"
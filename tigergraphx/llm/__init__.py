@@ -6,15 +6,23 @@
 # under the License. The software is provided "AS IS", without warranty.
 
 from .base_llm_manager import BaseLLMManager
+from .rate_limiter import RateLimiter
 from .openai_manager import OpenAIManager
 from .chat import (
     BaseChat,
     OpenAIChat,
+    BaseResponseCache,
+    InMemoryResponseCache,
+    DiskResponseCache,
 )
 
 __all__ = [
     "BaseLLMManager",
+    "RateLimiter",
     "OpenAIManager",
     "BaseChat",
     "OpenAIChat",
+    "BaseResponseCache",
+    "InMemoryResponseCache",
+    "DiskResponseCache",
 ]
@@ -7,8 +7,16 @@
 
 from .base_chat import BaseChat
 from .openai_chat import OpenAIChat
+from .response_cache import (
+    BaseResponseCache,
+    InMemoryResponseCache,
+    DiskResponseCache,
+)
 
 __all__ = [
     "BaseChat",
     "OpenAIChat",
+    "BaseResponseCache",
+    "InMemoryResponseCache",
+    "DiskResponseCache",
 ]
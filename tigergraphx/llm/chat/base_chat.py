@@ -6,7 +6,7 @@
 # under the License. The software is provided "AS IS", without warranty.
 
 from abc import ABC, abstractmethod
-from typing import List, Any
+from typing import AsyncIterator, List, Any
 
 from tigergraphx.config import BaseChatConfig
 
@@ -35,3 +35,20 @@ class BaseChat(ABC):
             The generated response.
         """
         pass
+
+    async def chat_stream(self, messages: List[Any]) -> AsyncIterator[str]:
+        """
+        Asynchronously process the messages and yield the response as it is generated.
+
+        The default implementation yields the complete response from `chat` as a
+        single delta; subclasses may override it to stream tokens.
+
+        Args:
+            messages: A list of messages to process.
+
+        Yields:
+            Successive pieces of the generated response.
+        """
+        response = await self.chat(messages)
+        if response:
+            yield response
@@ -6,18 +6,23 @@
 # under the License. The software is provided "AS IS", without warranty.
 
 import logging
+from contextlib import AsyncExitStack
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, AsyncIterator, List, Dict, Optional
 from tenacity import RetryError
 from openai.types.chat import ChatCompletionMessageParam
 
 from .base_chat import BaseChat
+from .response_cache import (
+    BaseResponseCache,
+    InMemoryResponseCache,
+    DiskResponseCache,
+)
 
 from tigergraphx.config import OpenAIChatConfig
 from tigergraphx.llm import OpenAIManager
 from tigergraphx.utils import RetryMixin
 
-
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +35,7 @@ class OpenAIChat(BaseChat, RetryMixin):
         self,
         llm_manager: OpenAIManager,
         config: OpenAIChatConfig | Dict | str | Path,
+        cache: Optional[BaseResponseCache] = None,
     ):
         """
         Initialize the OpenAIChat with the provided LLM manager and configuration.
@@ -37,18 +43,40 @@ class OpenAIChat(BaseChat, RetryMixin):
         Args:
             llm_manager: Manager for OpenAI LLM interactions.
             config: Configuration for OpenAI chat.
+            cache: Cache for chat responses. Defaults to one created from
+                `config.cache_type` when that is set.
         """
         config = OpenAIChatConfig.ensure_config(config)
         super().__init__(config)
         self.llm = llm_manager.get_llm()
-        self.retryer = self.initialize_retryer(self.config.max_retries, max_wait=10)
+        self.rate_limiter = llm_manager.get_rate_limiter()
+        self.retryer = self.initialize_retryer(
+            self.config.max_retries,
+            max_wait=10,
+            retry_policy=llm_manager.get_retry_policy(),
+            endpoint="chat.completions",
+        )
+        if cache is None and self.config.cache_type == "memory":
+            cache = InMemoryResponseCache(
+                max_entries=self.config.cache_max_entries, ttl=self.config.cache_ttl
+            )
+        elif cache is None and self.config.cache_type == "disk":
+            cache = DiskResponseCache(
+                self.config.cache_file,
+                max_entries=self.config.cache_max_entries,
+                ttl=self.config.cache_ttl,
+            )
+        self.cache = cache
 
-    async def chat(self, messages: List[ChatCompletionMessageParam]) -> str:
+    async def chat(
+        self, messages: List[ChatCompletionMessageParam], **params: Any
+    ) -> str:
         """
         Asynchronously process the messages and return the generated response.
 
         Args:
             messages: List of messages for chat completion.
+            **params: Other request options, such as `temperature`.
 
         Returns:
             The generated response.
@@ -57,16 +85,141 @@ class OpenAIChat(BaseChat, RetryMixin):
             RetryError: If retry attempts are exhausted.
             Exception: For any unexpected errors during processing.
         """
+        cache_key = self._cache_key(messages, params)
+        if self.cache is not None and cache_key is not None:
+            cached_response = self.cache.get(cache_key)
+            if cached_response is not None:
+                return cached_response
+
+        tokens = sum(
+            self.rate_limiter.estimate_tokens(str(message.get("content") or ""))
+            for message in messages
+        )
         try:
             async for attempt in self.retryer:
                 with attempt:
-                    response = await self.llm.chat.completions.create(
-                        messages=messages,
-                        model=self.config.model,
-                    )
-                    return response.choices[0].message.content or ""
+                    async with self.rate_limiter.limit(tokens):
+                        response = await self.llm.chat.completions.create(
+                            messages=messages,
+                            model=self.config.model,
+                            **params,
+                        )
+                    content = response.choices[0].message.content or ""
+                    if self.cache is not None and cache_key is not None and content:
+                        self.cache.set(cache_key, content)
+                    return content
         except RetryError as e:
             logger.error(f"RetryError in chat for messages: {messages} | {e}")
             raise
 
         return ""
+
+    async def chat_stream(
+        self, messages: List[ChatCompletionMessageParam], **params: Any
+    ) -> AsyncIterator[str]:
+        """
+        Asynchronously process the messages and yield response deltas as they arrive.
+
+        Failures are retried only until the first delta is received; errors after
+        that are raised to the caller, since part of the response has been yielded.
+        The request holds its rate limiter slot until the stream is exhausted or
+        the caller stops consuming it.
+
+        Args:
+            messages: List of messages for chat completion.
+            **params: Other request options, such as `temperature`.
+
+        Yields:
+            Successive pieces of the generated response.
+
+        Raises:
+            RetryError: If retry attempts are exhausted before the first delta.
+            Exception: For any error after the first delta.
+        """
+        cache_key = self._cache_key(messages, params)
+        if self.cache is not None and cache_key is not None:
+            cached_response = self.cache.get(cache_key)
+            if cached_response is not None:
+                yield cached_response
+                return
+
+        tokens = sum(
+            self.rate_limiter.estimate_tokens(str(message.get("content") or ""))
+            for message in messages
+        )
+        chunks: Optional[AsyncIterator] = None
+        first_delta: Optional[str] = None
+        # Keeps the rate limiter slot and the stream of the successful attempt
+        held = AsyncExitStack()
+        try:
+            async for attempt in self.retryer:
+                with attempt:
+                    async with AsyncExitStack() as attempt_stack:
+                        await attempt_stack.enter_async_context(
+                            self.rate_limiter.limit(tokens)
+                        )
+                        stream = await self.llm.chat.completions.create(
+                            messages=messages,
+                            model=self.config.model,
+                            stream=True,
+                            **params,
+                        )
+                        attempt_stack.push_async_callback(stream.aclose)
+                        # Wait for the first delta inside the retry scope
+                        chunks = stream.__aiter__()
+                        first_delta = await self._next_delta(chunks)
+                        held = attempt_stack.pop_all()
+        except RetryError as e:
+            logger.error(f"RetryError in chat_stream for messages: {messages} | {e}")
+            raise
+
+        deltas = []
+        # Closes the stream and releases the slot, also if the caller stops early
+        async with held:
+            delta = first_delta
+            while chunks is not None and delta is not None:
+                deltas.append(delta)
+                yield delta
+                delta = await self._next_delta(chunks)
+
+        content = "".join(deltas)
+        if self.cache is not None and cache_key is not None and content:
+            self.cache.set(cache_key, content)
+
+    def _cache_key(
+        self, messages: List[ChatCompletionMessageParam], params: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Return the response cache key of a request.
+
+        Only requests with temperature 0 or a seed are cached, since sampled
+        responses are expected to vary between calls.
+
+        Args:
+            messages: List of messages for chat completion.
+            params: Other request options.
+
+        Returns:
+            The cache key, or None if the response should not be cached.
+        """
+        if self.cache is None:
+            return None
+        if params.get("temperature") != 0 and params.get("seed") is None:
+            return None
+        return self.cache.make_key(self.config.model, messages, params)
+
+    @staticmethod
+    async def _next_delta(chunks: AsyncIterator) -> Optional[str]:
+        """
+        Return the next non-empty content delta of a completion stream.
+
+        Args:
+            chunks: Iterator over the chunks of a streamed completion.
+
+        Returns:
+            The content delta, or None when the stream is exhausted.
+        """
+        async for chunk in chunks:
+            if chunk.choices and chunk.choices[0].delta.content:
+                return chunk.choices[0].delta.content
+        return None
@@ -0,0 +1,165 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import hashlib
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from tigergraphx.utils import SQLiteLRUStore
+
+
+class BaseResponseCache(ABC):
+    """Base class for caches of chat responses."""
+
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses. None means unbounded.
+            ttl: Seconds a response stays valid. None means responses never expire.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(model: str, messages: List[Any], params: Dict[str, Any]) -> str:
+        """
+        Build a deterministic cache key for a chat request.
+
+        Args:
+            model: The chat model name.
+            messages: The messages sent to the model.
+            params: Other request parameters that affect the response.
+
+        Returns:
+            The hex digest identifying the request.
+        """
+        payload = json.dumps(
+            {"model": model, "messages": messages, "params": params},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """
+        Return the cached response for a key.
+
+        Args:
+            key: Cache key built with `make_key`.
+
+        Returns:
+            The cached response, or None if it is missing or expired.
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, response: str) -> None:
+        """
+        Store a response, evicting the least recently used entries if needed.
+
+        Args:
+            key: Cache key built with `make_key`.
+            response: The response to cache.
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        pass
+
+    def _expires_at(self) -> Optional[float]:
+        return None if self.ttl is None else time.time() + self.ttl
+
+
+class InMemoryResponseCache(BaseResponseCache):
+    """Process-local LRU cache of chat responses."""
+
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses. None means unbounded.
+            ttl: Seconds a response stays valid. None means responses never expire.
+        """
+        super().__init__(max_entries, ttl)
+        self._entries: OrderedDict[str, Tuple[str, Optional[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            response, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: str) -> None:
+        with self._lock:
+            self._entries[key] = (response, self._expires_at())
+            self._entries.move_to_end(key)
+            if self.max_entries is not None:
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskResponseCache(BaseResponseCache):
+    """Persistent LRU cache of chat responses backed by SQLite."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ):
+        """
+        Open or create the cache.
+
+        Args:
+            path: Path to the SQLite database file.
+            max_entries: Maximum number of cached responses. None means unbounded.
+            ttl: Seconds a response stays valid. None means responses never expire.
+        """
+        super().__init__(max_entries, ttl)
+        self.path = path
+        self._store = SQLiteLRUStore(path, "responses", max_entries=max_entries)
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def get(self, key: str) -> Optional[str]:
+        return self._store.get_many([key]).get(key)
+
+    def set(self, key: str, response: str) -> None:
+        self._store.put_many([(key, response)], expires_at=self._expires_at())
+
+    def clear(self) -> None:
+        self._store.clear()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._store.close()
@@ -10,7 +10,9 @@ from pathlib import Path
 from openai import AsyncOpenAI
 
 from .base_llm_manager import BaseLLMManager
+from .rate_limiter import RateLimiter
 from ..config import OpenAIConfig
+from ..utils import RetryBudget, RetryPolicy
 
 
 class OpenAIManager(BaseLLMManager):
@@ -44,7 +46,21 @@ class OpenAIManager(BaseLLMManager):
             base_url=self.config.base_url,
             organization=self.config.organization,
             timeout=self.config.request_timeout,
-            max_retries=self.config.max_retries,
+            # Retries are made by the retry policy below; SDK retries would stack
+            max_retries=0,
+        )
+
+        # Shared by every chat and embedding component created from this manager
+        self._rate_limiter = RateLimiter(
+            requests_per_minute=self.config.requests_per_minute,
+            tokens_per_minute=self.config.tokens_per_minute,
+            max_concurrent_requests=self.config.max_concurrent_requests,
+            encoding_name=self.config.encoding_name,
+        )
+        self._retry_policy = RetryPolicy(
+            max_attempts=self.config.max_retries + 1,
+            max_wait=10,
+            budget=RetryBudget(),
         )
 
     def get_llm(self) -> AsyncOpenAI:
@@ -55,3 +71,22 @@ class OpenAIManager(BaseLLMManager):
             The initialized OpenAI instance.
         """
         return self._llm
+
+    def get_rate_limiter(self) -> RateLimiter:
+        """
+        Retrieve the rate limiter shared by components using this manager.
+
+        Returns:
+            The shared rate limiter.
+        """
+        return self._rate_limiter
+
+    def get_retry_policy(self) -> RetryPolicy:
+        """
+        Retrieve the retry policy shared by components using this manager, with a
+        shared retry budget and per-endpoint circuit breakers.
+
+        Returns:
+            The shared retry policy.
+        """
+        return self._retry_policy
@@ -0,0 +1,204 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+import tiktoken
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """A token bucket that refills continuously up to a per-minute capacity."""
+
+    def __init__(self, per_minute: int):
+        """
+        Initialize a full bucket.
+
+        Args:
+            per_minute: Capacity of the bucket and its refill amount per minute.
+        """
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.available = self.capacity
+        self._updated_at = time.monotonic()
+
+    def time_until_available(self, amount: float) -> float:
+        """
+        Return how long to wait until `amount` can be taken. Amounts above the
+        capacity are capped, so they wait for a full bucket instead of forever.
+
+        Args:
+            amount: The amount to take.
+
+        Returns:
+            Seconds to wait, 0 if the amount is available now.
+        """
+        self._refill()
+        deficit = min(amount, self.capacity) - self.available
+        return max(0.0, deficit / self.rate)
+
+    def take(self, amount: float) -> None:
+        """
+        Take an amount from the bucket, which may go negative for oversized amounts.
+
+        Args:
+            amount: The amount to take.
+        """
+        self._refill()
+        self.available -= amount
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.available = min(
+            self.capacity, self.available + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+
+class RateLimiter:
+    """
+    Client-side limiter for requests per minute, tokens per minute and requests in
+    flight, shared by all components created from one LLM manager.
+
+    Callers wait until their request fits instead of failing with rate limit errors.
+    The time spent waiting is exposed through `metrics`.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_concurrent_requests: Optional[int] = None,
+        encoding_name: str = "cl100k_base",
+    ):
+        """
+        Initialize the rate limiter. Limits set to None are not enforced.
+
+        Args:
+            requests_per_minute: Maximum number of requests per minute.
+            tokens_per_minute: Maximum number of tokens per minute.
+            max_concurrent_requests: Maximum number of requests in flight.
+            encoding_name: Token encoding used to estimate request costs.
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrent_requests = max_concurrent_requests
+        self.encoding_name = encoding_name
+        self._request_bucket = (
+            TokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self._token_bucket = (
+            TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        )
+        self._token_encoder: Optional[tiktoken.Encoding] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._requests = 0
+        self._waited_requests = 0
+        self._total_wait_seconds = 0.0
+
+    @property
+    def metrics(self) -> Dict[str, float]:
+        """
+        Return counters describing the limiter's effect so far.
+
+        Returns:
+            The number of requests, how many of them waited, and the total seconds
+            spent waiting.
+        """
+        return {
+            "requests": self._requests,
+            "waited_requests": self._waited_requests,
+            "total_wait_seconds": self._total_wait_seconds,
+        }
+
+    def estimate_tokens(self, text: str) -> int:
+        """
+        Estimate the token cost of a text. Returns 0 without encoding when no token
+        limit is configured.
+
+        Args:
+            text: The text to estimate.
+
+        Returns:
+            The number of tokens in the text.
+        """
+        if self._token_bucket is None:
+            return 0
+        if self._token_encoder is None:
+            self._token_encoder = tiktoken.get_encoding(self.encoding_name)
+        return len(self._token_encoder.encode(text))
+
+    @asynccontextmanager
+    async def limit(self, tokens: int = 0) -> AsyncIterator[None]:
+        """
+        Wait until a request of the given token cost may be sent, and hold an
+        in-flight slot while the block runs.
+
+        Args:
+            tokens: Estimated token cost of the request.
+        """
+        lock, semaphore = self._get_primitives()
+        start = time.monotonic()
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            # Waiters queue on the lock, so the buckets are drained in FIFO order
+            async with lock:
+                while True:
+                    delay = max(
+                        (
+                            self._request_bucket.time_until_available(1)
+                            if self._request_bucket
+                            else 0.0
+                        ),
+                        (
+                            self._token_bucket.time_until_available(tokens)
+                            if self._token_bucket
+                            else 0.0
+                        ),
+                    )
+                    if delay <= 0:
+                        break
+                    await asyncio.sleep(delay)
+                if self._request_bucket:
+                    self._request_bucket.take(1)
+                if self._token_bucket:
+                    self._token_bucket.take(tokens)
+            self._record_wait(time.monotonic() - start)
+            yield
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    def _get_primitives(
+        self,
+    ) -> tuple[asyncio.Lock, Optional[asyncio.Semaphore]]:
+        # asyncio primitives are bound to one event loop; recreate them for a new one
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._semaphore = (
+                asyncio.Semaphore(self.max_concurrent_requests)
+                if self.max_concurrent_requests
+                else None
+            )
+        return self._lock, self._semaphore
+
+    def _record_wait(self, seconds: float) -> None:
+        self._requests += 1
+        # Ignore scheduling noise when deciding whether a request was throttled
+        if seconds > 0.001:
+            self._waited_requests += 1
+            self._total_wait_seconds += seconds
+            logger.debug(f"Rate limiter delayed a request by {seconds:.3f}s")
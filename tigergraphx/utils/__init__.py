@@ -8,10 +8,22 @@
 from .decorators import safe_call
 from .logger import setup_logging
 from .retry_mixin import RetryMixin
+from .retry_policy import (
+    RetryPolicy,
+    RetryBudget,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from .sqlite_lru_store import SQLiteLRUStore
 
 
 __all__ = [
     "safe_call",
     "setup_logging",
     "RetryMixin",
+    "RetryPolicy",
+    "RetryBudget",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "SQLiteLRUStore",
 ]
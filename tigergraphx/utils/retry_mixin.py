@@ -5,12 +5,10 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
-from tenacity import (
-    AsyncRetrying,
-    stop_after_attempt,
-    wait_exponential_jitter,
-    retry_if_exception_type,
-)
+from typing import Optional
+from tenacity import AsyncRetrying
+
+from .retry_policy import RetryPolicy
 
 
 class RetryMixin:
@@ -18,20 +16,31 @@ class RetryMixin:
     Mixin for initializing a retry mechanism with configurable parameters.
     """
 
-    def initialize_retryer(self, max_retries: int, max_wait: int) -> AsyncRetrying:
+    def initialize_retryer(
+        self,
+        max_retries: int,
+        max_wait: int,
+        retry_policy: Optional[RetryPolicy] = None,
+        endpoint: str = "default",
+    ) -> AsyncRetrying:
         """
         Initialize the retry mechanism with exponential backoff and jitter.
 
+        Only errors classified as retryable by the policy are retried; fatal errors
+        such as bad requests or authentication failures are raised immediately.
+
         Args:
             max_retries: Maximum number of retry attempts.
             max_wait: Maximum wait time between retries in seconds.
+            retry_policy: Shared retry policy, e.g. to share a retry budget and
+                circuit breakers. Defaults to a policy without either.
+            endpoint: Name of the endpoint, selecting its circuit breaker.
 
         Returns:
             AsyncRetrying: Configured retrying instance with specified parameters.
         """
-        return AsyncRetrying(
-            stop=stop_after_attempt(max_retries),
-            wait=wait_exponential_jitter(max=max_wait),
-            reraise=True,
-            retry=retry_if_exception_type(Exception),
+        if retry_policy is None:
+            retry_policy = RetryPolicy(max_wait=max_wait, failure_threshold=None)
+        return retry_policy.async_retrying(
+            endpoint, max_attempts=max_retries, max_wait=max_wait
         )
@@ -0,0 +1,402 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Deque, Dict, Optional
+import requests
+import openai
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    Retrying,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a request is rejected because the endpoint's circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one endpoint.
+
+    After `failure_threshold` consecutive failures the circuit opens and requests
+    fail fast. Once `reset_timeout` seconds have passed, a single trial request is
+    let through; its success closes the circuit and its failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize a closed circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit.
+            reset_timeout: Seconds the circuit stays open before a trial request.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_progress = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """
+        Return the circuit state: "closed", "open" or "half_open".
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                return "half_open"
+            return "open"
+
+    def allow_request(self) -> bool:
+        """
+        Return whether a request may be sent now.
+
+        Returns:
+            True if the circuit is closed, or if it is half open and no other trial
+            request is in progress.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            if self._trial_in_progress:
+                return False
+            self._trial_in_progress = True
+            return True
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_progress = False
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_progress or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_in_progress = False
+
+    def record_ignored(self) -> None:
+        """
+        Record a request whose outcome says nothing about the endpoint's health,
+        such as a cancellation or a client error, freeing the trial slot.
+        """
+        with self._lock:
+            self._trial_in_progress = False
+
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of recent requests, so retries cannot multiply the
+    load on a struggling service.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries: int = 10,
+        window: float = 10.0,
+    ):
+        """
+        Initialize the retry budget.
+
+        Args:
+            ratio: Allowed retries as a fraction of requests within the window.
+            min_retries: Retries always allowed within the window.
+            window: Length of the sliding window in seconds.
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        """Record a first attempt of a request."""
+        with self._lock:
+            self._requests.append(time.monotonic())
+
+    def try_acquire_retry(self) -> bool:
+        """
+        Spend one retry from the budget if available.
+
+        Returns:
+            True if the retry may proceed.
+        """
+        with self._lock:
+            now = time.monotonic()
+            for events in (self._requests, self._retries):
+                while events and now - events[0] > self.window:
+                    events.popleft()
+            allowed = max(self.min_retries, self.ratio * len(self._requests))
+            if len(self._retries) >= allowed:
+                return False
+            self._retries.append(now)
+            return True
+
+
+class RetryPolicy:
+    """
+    Decides which failures are retried and how long to wait before retrying.
+
+    Errors are classified as retryable (connection failures, timeouts, and HTTP
+    408/425/429/5xx responses) or fatal (everything else, such as bad requests
+    and authentication failures), which are raised immediately. `Retry-After`
+    headers take precedence over exponential backoff. An optional retry budget and
+    per-endpoint circuit breakers bound the retry load.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        max_wait: float = 10.0,
+        max_retry_after: float = 60.0,
+        budget: Optional[RetryBudget] = None,
+        failure_threshold: Optional[int] = 5,
+        reset_timeout: float = 30.0,
+        is_retryable: Optional[Callable[[BaseException], bool]] = None,
+    ):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_attempts: Default number of attempts, including the first one.
+            max_wait: Maximum backoff between attempts in seconds.
+            max_retry_after: Upper bound applied to `Retry-After` delays.
+            budget: Retry budget shared by all endpoints. None means unlimited.
+            failure_threshold: Consecutive failures that open an endpoint's circuit.
+                None disables circuit breaking.
+            reset_timeout: Seconds a circuit stays open before a trial request.
+            is_retryable: Custom error classifier replacing the default one.
+        """
+        self.max_attempts = max_attempts
+        self.max_wait = max_wait
+        self.max_retry_after = max_retry_after
+        self.budget = budget
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._is_retryable = is_retryable
+        self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """
+        Classify an error as retryable or fatal.
+
+        Args:
+            error: The raised error. Its `__cause__` chain is inspected as well.
+
+        Returns:
+            True if the failed request may succeed when retried.
+        """
+        if self._is_retryable is not None:
+            return self._is_retryable(error)
+        if isinstance(error, CircuitOpenError):
+            return False
+        for exc in _iter_causes(error):
+            status_code = _get_status_code(exc)
+            if status_code is not None:
+                return status_code in RETRYABLE_STATUS_CODES
+            if isinstance(
+                exc,
+                (
+                    ConnectionError,
+                    TimeoutError,
+                    asyncio.TimeoutError,
+                    requests.ConnectionError,
+                    requests.Timeout,
+                    requests.exceptions.ChunkedEncodingError,
+                    openai.APIConnectionError,
+                ),
+            ):
+                return True
+        return False
+
+    def get_retry_after(self, error: BaseException) -> Optional[float]:
+        """
+        Return the delay requested by the server through `Retry-After` headers.
+
+        Args:
+            error: The raised error. Its `__cause__` chain is inspected as well.
+
+        Returns:
+            The delay in seconds, capped at `max_retry_after`, or None if absent.
+        """
+        for exc in _iter_causes(error):
+            headers = getattr(getattr(exc, "response", None), "headers", None)
+            if not headers:
+                continue
+            delay = None
+            if headers.get("retry-after-ms"):
+                try:
+                    delay = float(headers["retry-after-ms"]) / 1000
+                except ValueError:
+                    pass
+            if delay is None and headers.get("retry-after"):
+                value = headers["retry-after"]
+                try:
+                    delay = float(value)
+                except ValueError:
+                    try:
+                        delay = parsedate_to_datetime(value).timestamp() - time.time()
+                    except (TypeError, ValueError):
+                        pass
+            if delay is not None:
+                return min(max(delay, 0.0), self.max_retry_after)
+        return None
+
+    def get_circuit_breaker(self, endpoint: str) -> Optional[CircuitBreaker]:
+        """
+        Return the circuit breaker of an endpoint, creating it on first use.
+
+        Args:
+            endpoint: Name identifying the endpoint.
+
+        Returns:
+            The endpoint's circuit breaker, or None if circuit breaking is disabled.
+        """
+        if self.failure_threshold is None:
+            return None
+        with self._lock:
+            if endpoint not in self._circuit_breakers:
+                self._circuit_breakers[endpoint] = CircuitBreaker(
+                    self.failure_threshold, self.reset_timeout
+                )
+            return self._circuit_breakers[endpoint]
+
+    def retrying(
+        self,
+        endpoint: str = "default",
+        max_attempts: Optional[int] = None,
+        max_wait: Optional[float] = None,
+    ) -> Retrying:
+        """
+        Build a synchronous tenacity retryer applying this policy.
+
+        Args:
+            endpoint: Name of the endpoint, selecting its circuit breaker.
+            max_attempts: Number of attempts, overriding the policy default.
+            max_wait: Maximum backoff in seconds, overriding the policy default.
+
+        Returns:
+            The configured retryer.
+        """
+        return Retrying(**self._retrying_kwargs(endpoint, max_attempts, max_wait))
+
+    def async_retrying(
+        self,
+        endpoint: str = "default",
+        max_attempts: Optional[int] = None,
+        max_wait: Optional[float] = None,
+    ) -> AsyncRetrying:
+        """
+        Build an asynchronous tenacity retryer applying this policy.
+
+        Args:
+            endpoint: Name of the endpoint, selecting its circuit breaker.
+            max_attempts: Number of attempts, overriding the policy default.
+            max_wait: Maximum backoff in seconds, overriding the policy default.
+
+        Returns:
+            The configured retryer.
+        """
+        return AsyncRetrying(
+            **self._retrying_kwargs(endpoint, max_attempts, max_wait)
+        )
+
+    def _retrying_kwargs(
+        self, endpoint: str, max_attempts: Optional[int], max_wait: Optional[float]
+    ) -> Dict[str, Any]:
+        backoff = wait_exponential_jitter(
+            max=self.max_wait if max_wait is None else max_wait
+        )
+
+        def before(retry_state: RetryCallState) -> None:
+            if retry_state.attempt_number == 1 and self.budget is not None:
+                self.budget.record_request()
+            breaker = self.get_circuit_breaker(endpoint)
+            if breaker is not None and not breaker.allow_request():
+                raise CircuitOpenError(
+                    f"Circuit for endpoint '{endpoint}' is open; failing fast."
+                )
+
+        def should_retry(retry_state: RetryCallState) -> bool:
+            outcome = retry_state.outcome
+            if outcome is None:
+                return False
+            error = outcome.exception()
+            breaker = self.get_circuit_breaker(endpoint)
+            if error is None:
+                if breaker is not None:
+                    breaker.record_success()
+                return False
+            retryable = self.is_retryable(error)
+            # Only failures of the service count against its circuit
+            if breaker is not None:
+                if retryable:
+                    breaker.record_failure()
+                else:
+                    breaker.record_ignored()
+            if not retryable:
+                return False
+            if self.budget is not None and not self.budget.try_acquire_retry():
+                logger.warning(f"Retry budget exhausted; not retrying {endpoint}.")
+                return False
+            return True
+
+        def wait(retry_state: RetryCallState) -> float:
+            outcome = retry_state.outcome
+            error = outcome.exception() if outcome is not None else None
+            retry_after = self.get_retry_after(error) if error is not None else None
+            return retry_after if retry_after is not None else backoff(retry_state)
+
+        return {
+            "stop": stop_after_attempt(max_attempts or self.max_attempts),
+            "wait": wait,
+            "retry": should_retry,
+            "before": before,
+            "reraise": True,
+        }
+
+
+def _iter_causes(error: BaseException):
+    seen = set()
+    exc: Optional[BaseException] = error
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        yield exc
+        exc = exc.__cause__
+
+
+def _get_status_code(error: BaseException) -> Optional[int]:
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code
+    response = getattr(error, "response", None)
+    status_code = getattr(response, "status_code", None)
+    return status_code if isinstance(status_code, int) else None
@@ -0,0 +1,135 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+
+class SQLiteLRUStore:
+    """
+    Thread-safe key-value table in SQLite with least recently used eviction.
+
+    Entries may carry an expiry time, after which they are treated as missing and
+    deleted on lookup. When `max_entries` is set, the least recently used entries
+    are evicted after each write.
+    """
+
+    # Stay below SQLite's default limit on host parameters per statement
+    _MAX_PARAMS = 500
+
+    def __init__(self, path: str | Path, table: str, max_entries: Optional[int] = None):
+        """
+        Open or create the store.
+
+        Args:
+            path: Path to the SQLite database file, or ":memory:".
+            table: Name of the table holding the entries.
+            max_entries: Maximum number of entries. None means unbounded.
+        """
+        self.path = path
+        self.table = table
+        self.max_entries = max_entries
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "key TEXT PRIMARY KEY, value NOT NULL, "
+                "expires_at REAL, last_access REAL NOT NULL)"
+            )
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_last_access "
+                f"ON {table} (last_access)"
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()
+        return row[0]
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """
+        Look up several entries, refreshing their recency.
+
+        Args:
+            keys: Keys of the entries.
+
+        Returns:
+            The values of the entries found, by key. Expired entries are deleted
+            and left out.
+        """
+        found: Dict[str, Any] = {}
+        expired = []
+        now = time.time()
+        unique_keys = list(dict.fromkeys(keys))
+        with self._lock, self._conn:
+            for i in range(0, len(unique_keys), self._MAX_PARAMS):
+                batch = unique_keys[i : i + self._MAX_PARAMS]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, value, expires_at FROM {self.table} "
+                    f"WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                for key, value, expires_at in rows:
+                    if expires_at is not None and expires_at <= now:
+                        expired.append((key,))
+                    else:
+                        found[key] = value
+            if expired:
+                self._conn.executemany(
+                    f"DELETE FROM {self.table} WHERE key = ?", expired
+                )
+            if found:
+                self._conn.executemany(
+                    f"UPDATE {self.table} SET last_access = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+        return found
+
+    def put_many(
+        self, items: Sequence[Tuple[str, Any]], expires_at: Optional[float] = None
+    ) -> None:
+        """
+        Store several entries, then evict the least recently used entries if the
+        store exceeds `max_entries`.
+
+        Args:
+            items: Pairs of key and value.
+            expires_at: Time after which the entries expire. None means never.
+        """
+        if not items:
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} "
+                "(key, value, expires_at, last_access) VALUES (?, ?, ?, ?)",
+                [(key, value, expires_at, now) for key, value in items],
+            )
+            if self.max_entries is not None:
+                self._conn.execute(
+                    f"DELETE FROM {self.table} WHERE key IN ("
+                    f"SELECT key FROM {self.table} ORDER BY last_access DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.table}")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
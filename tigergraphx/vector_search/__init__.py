@@ -5,10 +5,11 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
-from .embedding import BaseEmbedding, OpenAIEmbedding
+from .embedding import BaseEmbedding, OpenAIEmbedding, EmbeddingCache
 from .vector_db import (
     BaseVectorDB,
     NanoVectorDBManager,
+    MmapVectorDBManager,
     TigerVectorManager,
 )
 from .search import (
@@ -20,9 +21,11 @@ from .search import (
 __all__ = [
     "BaseEmbedding",
     "OpenAIEmbedding",
+    "EmbeddingCache",
     "BaseVectorDB",
     "TigerVectorManager",
     "NanoVectorDBManager",
+    "MmapVectorDBManager",
     "BaseSearchEngine",
     "TigerVectorSearchEngine",
     "NanoVectorDBSearchEngine",
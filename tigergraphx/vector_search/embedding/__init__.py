@@ -7,8 +7,10 @@
 
 from .base_embedding import BaseEmbedding
 from .openai_embedding import OpenAIEmbedding
+from .embedding_cache import EmbeddingCache
 
 __all__ = [
     "BaseEmbedding",
     "OpenAIEmbedding",
+    "EmbeddingCache",
 ]
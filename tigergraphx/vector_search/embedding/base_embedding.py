@@ -7,6 +7,7 @@
 
 from abc import ABC, abstractmethod
 from typing import List
+import asyncio
 
 from tigergraphx.config import BaseEmbeddingConfig
 
@@ -35,3 +36,20 @@ class BaseEmbedding(ABC):
             A list of floats representing the text embedding.
         """
         pass
+
+    async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Asynchronously generate embeddings for multiple texts.
+
+        The default implementation embeds each text concurrently; subclasses may
+        override it to send batched requests.
+
+        Args:
+            texts: Input texts to generate embeddings.
+
+        Returns:
+            A list of embeddings, in the same order as the input texts.
+        """
+        return list(
+            await asyncio.gather(*[self.generate_embedding(text) for text in texts])
+        )
@@ -0,0 +1,94 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import hashlib
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+
+from tigergraphx.utils import SQLiteLRUStore
+
+
+class EmbeddingCache:
+    """
+    Persistent, content-addressed embedding cache backed by SQLite.
+
+    Embeddings are stored as float32 blobs keyed by a hash of the model, the token
+    encoding and the text chunk. When `max_entries` is set, the least recently used
+    entries are evicted after each write.
+    """
+
+    def __init__(self, path: str | Path, max_entries: Optional[int] = None):
+        """
+        Open or create the cache.
+
+        Args:
+            path: Path to the SQLite database file, or ":memory:".
+            max_entries: Maximum number of cached embeddings. None means unbounded.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self._store = SQLiteLRUStore(path, "embeddings", max_entries=max_entries)
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    @staticmethod
+    def make_key(model: str, encoding_name: str, text: str) -> str:
+        """
+        Build the cache key for a text chunk.
+
+        Args:
+            model: The embedding model name.
+            encoding_name: The token encoding name.
+            text: The text chunk.
+
+        Returns:
+            The hex digest identifying the chunk's embedding.
+        """
+        return hashlib.sha256(
+            "\0".join([model, encoding_name, text]).encode("utf-8")
+        ).hexdigest()
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[List[float]]]:
+        """
+        Look up several embeddings, refreshing their recency.
+
+        Args:
+            keys: Cache keys built with `make_key`.
+
+        Returns:
+            The embeddings in key order, with None for misses.
+        """
+        found = {
+            key: np.frombuffer(vector, dtype=np.float32).tolist()
+            for key, vector in self._store.get_many(keys).items()
+        }
+        return [found.get(key) for key in keys]
+
+    def put_many(self, items: Sequence[Tuple[str, Sequence[float]]]) -> None:
+        """
+        Store several embeddings, then evict the least recently used entries if the
+        cache exceeds `max_entries`.
+
+        Args:
+            items: Pairs of cache key and embedding.
+        """
+        self._store.put_many(
+            [
+                (key, np.asarray(embedding, dtype=np.float32).tobytes())
+                for key, embedding in items
+            ]
+        )
+
+    def clear(self) -> None:
+        """Remove all cached embeddings."""
+        self._store.clear()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._store.close()
@@ -6,14 +6,14 @@
 # under the License. The software is provided "AS IS", without warranty.
 
 import logging
-from typing import List, Dict, Tuple, Generator
+from typing import List, Dict, Optional, Tuple, Generator
 from pathlib import Path
 import numpy as np
 import asyncio
 import tiktoken
-from tenacity import RetryError
 
 from .base_embedding import BaseEmbedding
+from .embedding_cache import EmbeddingCache
 
 from tigergraphx.config import OpenAIEmbeddingConfig
 from tigergraphx.llm import OpenAIManager
@@ -31,6 +31,7 @@ class OpenAIEmbedding(BaseEmbedding, RetryMixin):
         self,
         llm_manager: OpenAIManager,
         config: OpenAIEmbeddingConfig | Dict | str | Path,
+        cache: Optional[EmbeddingCache] = None,
     ):
         """
         Initialize the OpenAI Embedding wrapper.
@@ -38,12 +39,25 @@ class OpenAIEmbedding(BaseEmbedding, RetryMixin):
         Args:
             llm_manager: Manager for OpenAI LLM interactions.
             config: Configuration for the embedding model.
+            cache: Cache for chunk embeddings. Defaults to one opened from
+                `config.cache_file` when that is set.
         """
         config = OpenAIEmbeddingConfig.ensure_config(config)
         super().__init__(config)
         self.llm = llm_manager.get_llm()
+        self.rate_limiter = llm_manager.get_rate_limiter()
         self.token_encoder = tiktoken.get_encoding(config.encoding_name)
-        self.retryer = self.initialize_retryer(self.config.max_retries, max_wait=10)
+        self.retryer = self.initialize_retryer(
+            self.config.max_retries,
+            max_wait=10,
+            retry_policy=llm_manager.get_retry_policy(),
+            endpoint="embeddings",
+        )
+        if cache is None and self.config.cache_file is not None:
+            cache = EmbeddingCache(
+                self.config.cache_file, max_entries=self.config.cache_max_entries
+            )
+        self.cache = cache
 
     async def generate_embedding(self, text: str) -> List[float]:
         """
@@ -55,10 +69,19 @@ class OpenAIEmbedding(BaseEmbedding, RetryMixin):
         Returns:
             The normalized embedding vector.
         """
-        token_chunks = list(self._tokenize(text))
-        embedding_results = await asyncio.gather(
-            *[self._generate_with_retry(chunk) for chunk in token_chunks]
+        token_chunks = [chunk for chunk, _ in (await self._achunk_many([text]))[0]]
+        cached = await self._get_cached(token_chunks)
+        missing = [chunk for chunk, emb in zip(token_chunks, cached) if emb is None]
+        generated = await asyncio.gather(
+            *[self._generate_with_retry(chunk) for chunk in missing]
         )
+        await self._put_cached(missing, [emb for emb, _ in generated])
+
+        generated_iter = iter(generated)
+        embedding_results = [
+            (emb, len(chunk)) if emb is not None else next(generated_iter)
+            for chunk, emb in zip(token_chunks, cached)
+        ]
 
         embeddings, lengths = (
             zip(*[(emb, length) for emb, length in embedding_results if emb])
@@ -73,6 +96,111 @@ class OpenAIEmbedding(BaseEmbedding, RetryMixin):
         normalized_embedding = combined_embedding / np.linalg.norm(combined_embedding)
         return normalized_embedding.tolist()
 
+    async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for multiple texts with batched API requests.
+
+        The token chunks of all texts are packed into requests of up to
+        `max_inputs_per_request` inputs and `max_tokens_per_request` tokens, which
+        are sent with at most `max_concurrent_requests` in flight. Each text's
+        embedding is the normalized weighted average of its chunk embeddings, as in
+        `generate_embedding`.
+
+        Args:
+            texts: The input texts to generate embeddings for.
+
+        Returns:
+            The normalized embedding vectors, in the same order as the input texts.
+            Texts whose chunks all failed get an empty list.
+        """
+        # Flatten to (text index, chunk, token count), serving cached chunks first
+        chunks = [
+            (text_index, chunk, num_tokens)
+            for text_index, text_chunks in enumerate(await self._achunk_many(texts))
+            for chunk, num_tokens in text_chunks
+        ]
+        text_chunks: List[List[Tuple[List[float], int]]] = [[] for _ in texts]
+        cached = await self._get_cached([chunk for _, chunk, _ in chunks])
+        for (text_index, chunk, _), embedding in zip(chunks, cached):
+            if embedding is not None:
+                text_chunks[text_index].append((embedding, len(chunk)))
+        missing = [chunk for chunk, emb in zip(chunks, cached) if emb is None]
+
+        # Pack the remaining chunks into requests
+        requests: List[List[Tuple[int, str, int]]] = []
+        request_tokens = 0
+        for chunk in missing:
+            if (
+                not requests
+                or len(requests[-1]) >= self.config.max_inputs_per_request
+                or request_tokens + chunk[2] > self.config.max_tokens_per_request
+            ):
+                requests.append([])
+                request_tokens = 0
+            requests[-1].append(chunk)
+            request_tokens += chunk[2]
+
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
+
+        async def run(request: List[Tuple[int, str, int]]) -> List[List[float]]:
+            async with semaphore:
+                return await self._generate_batch_with_retry(
+                    [chunk for _, chunk, _ in request],
+                    num_tokens=sum(num_tokens for _, _, num_tokens in request),
+                )
+
+        request_results = await asyncio.gather(*[run(request) for request in requests])
+
+        # Reassemble the chunk embeddings per text
+        for request, embeddings in zip(requests, request_results):
+            await self._put_cached([chunk for _, chunk, _ in request], embeddings)
+            for (text_index, chunk, _), embedding in zip(request, embeddings):
+                if embedding:
+                    text_chunks[text_index].append((embedding, len(chunk)))
+
+        results = []
+        for embedding_results in text_chunks:
+            if not embedding_results:
+                results.append([])
+                continue
+            embeddings, lengths = zip(*embedding_results)
+            combined_embedding = np.average(embeddings, axis=0, weights=lengths)
+            results.append(
+                (combined_embedding / np.linalg.norm(combined_embedding)).tolist()
+            )
+        return results
+
+    async def _generate_batch_with_retry(
+        self, texts: List[str], num_tokens: int = 0
+    ) -> List[List[float]]:
+        """
+        Fetch embeddings for several chunks in one request with retry.
+
+        Args:
+            texts: Text chunks to generate embeddings for.
+            num_tokens: Total token count of the chunks, used for rate limiting.
+
+        Returns:
+            The embedding vectors in input order, or empty lists if the request
+            failed, so that other requests of the same call are kept.
+        """
+        try:
+            async for attempt in self.retryer:
+                with attempt:
+                    async with self.rate_limiter.limit(num_tokens):
+                        response = await self.llm.embeddings.create(
+                            input=texts,
+                            model=self.config.model,
+                        )
+                    data = sorted(response.data, key=lambda item: item.index)
+                    return [item.embedding or [] for item in data]
+        except Exception as e:
+            logger.error(
+                f"Error in _generate_batch_with_retry for {len(texts)} chunks | {e}"
+            )
+
+        return [[] for _ in texts]
+
     async def _generate_with_retry(self, text: str) -> Tuple[List[float], int]:
         """
         Fetch embedding for a chunk with retry, returning empty list on failure.
@@ -83,23 +211,65 @@ class OpenAIEmbedding(BaseEmbedding, RetryMixin):
         Returns:
             The embedding vector and the length of the chunk.
         """
+        num_tokens = self.rate_limiter.estimate_tokens(text)
         try:
             async for attempt in self.retryer:
                 with attempt:
-                    embedding = (
-                        await self.llm.embeddings.create(
+                    async with self.rate_limiter.limit(num_tokens):
+                        response = await self.llm.embeddings.create(
                             input=text,
                             model=self.config.model,
                         )
-                    ).data[0].embedding or []
+                    embedding = response.data[0].embedding or []
                     return embedding, len(text)
-        except RetryError as e:
+        except Exception as e:
             logger.error(
-                f"RetryError in _generate_with_retry for text chunk: {text[:50]}... | {e}"
+                f"Error in _generate_with_retry for text chunk: {text[:50]}... | {e}"
             )
 
         return [], 0
 
+    async def _get_cached(self, chunks: List[str]) -> List[Optional[List[float]]]:
+        """
+        Look up chunk embeddings in the cache, off the event loop.
+
+        Args:
+            chunks: Text chunks to look up.
+
+        Returns:
+            The cached embeddings, with None for misses or when caching is disabled.
+        """
+        if self.cache is None or not chunks:
+            return [None] * len(chunks)
+        return await asyncio.to_thread(
+            self.cache.get_many, [self._cache_key(chunk) for chunk in chunks]
+        )
+
+    async def _put_cached(
+        self, chunks: List[str], embeddings: List[List[float]]
+    ) -> None:
+        """
+        Store chunk embeddings in the cache off the event loop, skipping failed ones.
+
+        Args:
+            chunks: Text chunks that were embedded.
+            embeddings: The embeddings of the chunks.
+        """
+        if self.cache is None:
+            return
+        items = [
+            (self._cache_key(chunk), embedding)
+            for chunk, embedding in zip(chunks, embeddings)
+            if embedding
+        ]
+        if items:
+            await asyncio.to_thread(self.cache.put_many, items)
+
+    def _cache_key(self, chunk: str) -> str:
+        return EmbeddingCache.make_key(
+            self.config.model, self.config.encoding_name, chunk
+        )
+
     def _tokenize(self, text: str) -> List[str]:
         """
         Tokenize text into chunks based on token length.
@@ -110,9 +280,68 @@ class OpenAIEmbedding(BaseEmbedding, RetryMixin):
         Returns:
             List of tokenized text chunks.
         """
-        tokens = self.token_encoder.encode(text)
+        return [chunk for chunk, _ in self._chunk(text)]
+
+    def _chunk(self, text: str) -> List[Tuple[str, int]]:
+        """
+        Split text into chunks based on token length.
+
+        Args:
+            text: The input text to split.
+
+        Returns:
+            List of text chunks with their token counts. Texts that take the fast
+            path report their UTF-8 byte length, an upper bound on the token count.
+        """
+        if self._fits_in_one_chunk(text):
+            return [(text, len(text.encode("utf-8")))] if text else []
+        return self._split_tokens(self.token_encoder.encode(text))
+
+    async def _achunk_many(self, texts: List[str]) -> List[List[Tuple[str, int]]]:
+        """
+        Split several texts into chunks without blocking the event loop.
+
+        Texts that fit in one chunk are sent as they are. The others are encoded
+        together with `encode_batch` in a worker thread.
+
+        Args:
+            texts: The input texts to split.
+
+        Returns:
+            The chunks with their token counts for each text.
+        """
+        results = [
+            self._chunk(text) if self._fits_in_one_chunk(text) else [] for text in texts
+        ]
+        long_indices = [
+            i for i, text in enumerate(texts) if not self._fits_in_one_chunk(text)
+        ]
+        if long_indices:
+            long_chunks = await asyncio.to_thread(
+                self._chunk_long_texts, [texts[i] for i in long_indices]
+            )
+            for i, chunks in zip(long_indices, long_chunks):
+                results[i] = chunks
+        return results
+
+    def _chunk_long_texts(self, texts: List[str]) -> List[List[Tuple[str, int]]]:
+        return [
+            self._split_tokens(tokens)
+            for tokens in self.token_encoder.encode_batch(texts)
+        ]
+
+    def _fits_in_one_chunk(self, text: str) -> bool:
+        # Every token covers at least one byte, so the byte length bounds the token
+        # count; checking characters first avoids encoding obviously long texts
+        return (
+            len(text) <= self.config.max_tokens
+            and len(text.encode("utf-8")) <= self.config.max_tokens
+        )
+
+    def _split_tokens(self, tokens: List[int]) -> List[Tuple[str, int]]:
         return [
-            self.token_encoder.decode(chunk) for chunk in self._batch_tokens(tokens)
+            (self.token_encoder.decode(chunk), len(chunk))
+            for chunk in self._batch_tokens(tokens)
         ]
 
     def _batch_tokens(self, tokens: List[int]) -> Generator[List[int], None, None]:
@@ -7,6 +7,7 @@
 
 from abc import ABC
 from typing import Any, List
+import numpy as np
 
 from tigergraphx.vector_search import BaseVectorDB, BaseEmbedding
 
@@ -40,3 +41,33 @@ class BaseSearchEngine(ABC):
         embedding = await self.embedding_model.generate_embedding(text)
         results = self.vector_db.query(query_embedding=embedding, k=k, **kwargs)
         return results
+
+    async def search_batch(
+        self, texts: List[str], k: int = 10, **kwargs: Any
+    ) -> List[List[str]]:
+        """
+        Convert multiple texts to embeddings in one batch and search for each.
+
+        Args:
+            texts: The input texts to search.
+            k: The number of top results to return per text.
+            **kwargs: Additional arguments for the vector database query.
+
+        Returns:
+            A list of result IDs for each text, in input order. Texts whose
+            embedding could not be generated get an empty list.
+        """
+        embeddings = await self.embedding_model.generate_embeddings(texts)
+        valid_indices = [i for i, embedding in enumerate(embeddings) if embedding]
+        results: List[List[str]] = [[] for _ in texts]
+        if not valid_indices:
+            return results
+
+        batch_results = self.vector_db.query_batch(
+            query_embeddings=np.array([embeddings[i] for i in valid_indices]),
+            k=k,
+            **kwargs,
+        )
+        for i, result in zip(valid_indices, batch_results):
+            results[i] = result
+        return results
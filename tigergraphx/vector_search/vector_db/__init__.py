@@ -8,9 +8,11 @@
 from .base_vector_db import BaseVectorDB
 from .tigervector_manager import TigerVectorManager
 from .nano_vectordb_manager import NanoVectorDBManager
+from .mmap_vectordb_manager import MmapVectorDBManager
 
 __all__ = [
     "BaseVectorDB",
     "TigerVectorManager",
     "NanoVectorDBManager",
+    "MmapVectorDBManager",
 ]
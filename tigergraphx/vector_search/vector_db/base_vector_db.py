@@ -7,6 +7,7 @@
 
 from abc import ABC, abstractmethod
 from typing import List
+import numpy as np
 import pandas as pd
 
 from tigergraphx.config import BaseVectorDBConfig
@@ -51,3 +52,28 @@ class BaseVectorDB(ABC):
             List of result IDs.
         """
         pass
+
+    def query_batch(
+        self,
+        query_embeddings: np.ndarray | List[List[float]],
+        k: int = 10,
+    ) -> List[List[str]]:
+        """
+        Perform a similarity search for multiple embeddings.
+
+        The default implementation calls `query` once per embedding; subclasses
+        override it with a batched implementation.
+
+        Args:
+            query_embeddings: The vectors to search with, one per row.
+            k: Number of nearest neighbors to return per vector.
+
+        Returns:
+            List of result IDs for each vector, in input order.
+        """
+        return [
+            self.query(
+                query_embedding=np.asarray(query_embedding, dtype=float).tolist(), k=k
+            )
+            for query_embedding in query_embeddings
+        ]
@@ -0,0 +1,230 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import threading
+from typing import Dict, List, Literal, Sequence, Set, Tuple
+import numpy as np
+
+
+class IVFIndex:
+    """
+    In-memory inverted file (IVF) index for approximate nearest neighbor search.
+
+    Vectors are partitioned into `nlist` clusters with k-means; a query only scans
+    the `nprobe` clusters whose centroids are closest to it. An index trained on
+    fewer than `nlist` vectors is re-clustered each time it doubles in size, until
+    it has `nlist` clusters. The index may be updated and queried from several
+    threads.
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        metric: Literal["COSINE", "IP", "L2"] = "COSINE",
+        nlist: int = 100,
+        nprobe: int = 10,
+        kmeans_iterations: int = 10,
+        seed: int = 0,
+    ):
+        """
+        Initialize an empty IVF index.
+
+        Args:
+            dimension: Dimension of the indexed vectors.
+            metric: Distance metric, matching the TigerGraph vector attribute.
+            nlist: Number of clusters.
+            nprobe: Number of clusters scanned per query.
+            kmeans_iterations: Number of k-means iterations used by `build`.
+            seed: Random seed for centroid initialization.
+        """
+        self.dimension = dimension
+        self.metric = metric
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.kmeans_iterations = kmeans_iterations
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.RLock()
+        self._reset()
+
+    def __len__(self) -> int:
+        return len(self._id_to_row)
+
+    def build(self, ids: Sequence[str], vectors: np.ndarray) -> None:
+        """
+        Rebuild the index from scratch.
+
+        Args:
+            ids: Identifiers of the vectors.
+            vectors: Matrix with one vector per row.
+        """
+        vectors = self._prepare(vectors)
+        with self._lock:
+            self._reset()
+            if len(ids) == 0:
+                return
+            self._centroids = self._train_centroids(vectors)
+            self._lists = [set() for _ in range(len(self._centroids))]
+            self.upsert(ids, vectors)
+
+    def upsert(self, ids: Sequence[str], vectors: np.ndarray) -> None:
+        """
+        Insert or replace vectors.
+
+        Args:
+            ids: Identifiers of the vectors.
+            vectors: Matrix with one vector per row.
+        """
+        vectors = self._prepare(vectors)
+        if len(ids) == 0:
+            return
+        with self._lock:
+            if self._centroids is None:
+                # No trained centroids yet: keep everything in a single cluster
+                self._centroids = vectors[:1].copy()
+                self._lists = [set()]
+            assignments = self._nearest_centroids(vectors, 1)[:, 0]
+            for node_id, vector, cluster in zip(ids, vectors, assignments):
+                row = self._id_to_row.get(node_id)
+                if row is None:
+                    row = self._append_row(node_id)
+                else:
+                    self._lists[self._assignments[row]].discard(row)
+                self._vectors[row] = vector
+                self._assignments[row] = cluster
+                self._lists[cluster].add(row)
+            num_clusters = len(self._centroids)
+            if num_clusters < self.nlist and len(self) >= 2 * num_clusters:
+                self._recluster()
+
+    def remove(self, ids: Sequence[str]) -> None:
+        """
+        Remove vectors by ID. Unknown IDs are ignored.
+
+        Args:
+            ids: Identifiers of the vectors to remove.
+        """
+        with self._lock:
+            for node_id in ids:
+                row = self._id_to_row.pop(node_id, None)
+                if row is None:
+                    continue
+                self._lists[self._assignments[row]].discard(row)
+                self._row_ids[row] = None
+                self._free_rows.append(row)
+
+    def query(self, vector: Sequence[float], k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Return the approximate k nearest neighbors of a vector.
+
+        Args:
+            vector: The query vector.
+            k: Number of neighbors to return.
+
+        Returns:
+            List of (id, distance) tuples, sorted by ascending distance.
+        """
+        query = self._prepare(np.asarray(vector).reshape(1, -1))
+        with self._lock:
+            if len(self) == 0 or k <= 0 or self._centroids is None:
+                return []
+            nprobe = min(self.nprobe, len(self._centroids))
+            probes = self._nearest_centroids(query, nprobe)[0]
+            rows = [row for cluster in probes for row in self._lists[cluster]]
+            if not rows:
+                return []
+            # Copy the candidates so updates may proceed while distances are computed
+            row_ids = [self._row_ids[row] for row in rows]
+            vectors = self._vectors[np.array(rows)]
+        distances = self._distances(query, vectors)[0]
+        top_k = min(k, len(rows))
+        top = np.argpartition(distances, top_k - 1)[:top_k]
+        top = top[np.argsort(distances[top], kind="stable")]
+        return [(row_ids[i], float(distances[i])) for i in top]
+
+    def _recluster(self) -> None:
+        rows = np.array(list(self._id_to_row.values()))
+        vectors = self._vectors[rows]
+        self._centroids = self._train_centroids(vectors)
+        self._lists = [set() for _ in range(len(self._centroids))]
+        assignments = self._nearest_centroids(vectors, 1)[:, 0]
+        self._assignments[rows] = assignments
+        for row, cluster in zip(rows.tolist(), assignments.tolist()):
+            self._lists[cluster].add(row)
+
+    def _reset(self) -> None:
+        self._centroids: np.ndarray | None = None
+        self._lists: List[Set[int]] = []
+        self._vectors = np.empty((0, self.dimension), dtype=np.float32)
+        self._assignments = np.empty(0, dtype=np.int64)
+        self._row_ids: List[str | None] = []
+        self._id_to_row: Dict[str, int] = {}
+        self._free_rows: List[int] = []
+
+    def _prepare(self, vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dimension)
+        if self.metric == "COSINE":
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.where(norms == 0, 1, norms)
+        return vectors
+
+    def _append_row(self, node_id: str) -> int:
+        if self._free_rows:
+            row = self._free_rows.pop()
+            self._row_ids[row] = node_id
+        else:
+            row = len(self._row_ids)
+            if row >= len(self._vectors):
+                # Grow geometrically so repeated upserts stay amortized O(1)
+                capacity = max(16, 2 * len(self._vectors))
+                vectors = np.empty((capacity, self.dimension), dtype=np.float32)
+                vectors[: len(self._vectors)] = self._vectors
+                assignments = np.zeros(capacity, dtype=np.int64)
+                assignments[: len(self._assignments)] = self._assignments
+                self._vectors, self._assignments = vectors, assignments
+            self._row_ids.append(node_id)
+        self._id_to_row[node_id] = row
+        return row
+
+    def _distances(self, queries: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+        if self.metric == "L2":
+            squared = (
+                np.sum(queries**2, axis=1, keepdims=True)
+                - 2 * queries @ vectors.T
+                + np.sum(vectors**2, axis=1)
+            )
+            return np.sqrt(np.maximum(squared, 0))
+        similarities = queries @ vectors.T
+        if self.metric == "COSINE":
+            return 1 - similarities
+        return -similarities
+
+    def _nearest_centroids(self, vectors: np.ndarray, n: int) -> np.ndarray:
+        if self._centroids is None:
+            raise RuntimeError("The index has no centroids.")
+        distances = self._distances(vectors, self._centroids)
+        if n >= distances.shape[1]:
+            return np.argsort(distances, axis=1)
+        nearest = np.argpartition(distances, n - 1, axis=1)[:, :n]
+        order = np.argsort(np.take_along_axis(distances, nearest, axis=1), axis=1)
+        return np.take_along_axis(nearest, order, axis=1)
+
+    def _train_centroids(self, vectors: np.ndarray) -> np.ndarray:
+        nlist = max(1, min(self.nlist, len(vectors)))
+        # Train on a sample; 256 points per cluster is plenty for coarse quantization
+        sample_size = min(len(vectors), 256 * nlist)
+        sample = vectors[self._rng.choice(len(vectors), sample_size, replace=False)]
+        centroids = sample[:nlist].copy()
+        for _ in range(self.kmeans_iterations):
+            self._centroids = centroids
+            assignments = self._nearest_centroids(sample, 1)[:, 0]
+            for cluster in range(nlist):
+                members = sample[assignments == cluster]
+                if len(members) > 0:
+                    centroids[cluster] = members.mean(axis=0)
+            if self.metric == "COSINE":
+                centroids = self._prepare(centroids)
+        return centroids
@@ -0,0 +1,252 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List
+import numpy as np
+import pandas as pd
+
+from .base_vector_db import BaseVectorDB
+
+from tigergraphx.config import MmapVectorDBConfig
+
+
+class MmapVectorDBManager(BaseVectorDB):
+    """
+    A vector store that keeps embeddings in memory-mapped `.npy` matrices.
+
+    The storage directory holds the scanned matrix (`vectors.npy`), an ID sidecar
+    (`ids.json`) and, for quantized types, per-row int8 scales (`scales.npy`) and the
+    full-precision vectors used for re-scoring (`full.npy`). Opening a store only maps
+    the files, so pages are read on demand instead of parsing the whole store at
+    startup. Similarity is cosine, as in NanoVectorDB.
+    """
+
+    config: MmapVectorDBConfig
+
+    def __init__(
+        self,
+        config: MmapVectorDBConfig,
+    ):
+        """
+        Initialize the MmapVectorDBManager, opening an existing store if present.
+
+        Args:
+            config: Configuration for the memory-mapped vector store.
+        """
+        super().__init__(config)
+        self._dir = Path(config.storage_dir)
+        self._ids: List[str] = []
+        self._id_to_row: Dict[str, int] = {}
+        # Empty placeholders until the first insert creates the files
+        dim = config.embedding_dim
+        self._vectors: np.ndarray = np.empty((0, dim), dtype=config.dtype)
+        self._scales: np.ndarray = np.empty(0, dtype=np.float32)
+        self._full: np.ndarray = np.empty((0, dim), dtype=np.float32)
+        if (self._dir / "ids.json").exists():
+            self._open()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def insert_data(self, data: pd.DataFrame) -> None:
+        """
+        Insert or replace vectors. Columns other than `__id__` and `__vector__` are
+        not stored.
+
+        Args:
+            data: DataFrame with data to insert.
+        """
+        if data.empty:
+            return
+
+        # Keep the last vector for IDs repeated within the batch
+        positions = {str(node_id): i for i, node_id in enumerate(data["__id__"])}
+        matrix = np.stack(data["__vector__"].to_numpy()).astype(np.float32)
+        matrix = self._normalize(matrix[list(positions.values())])
+
+        rows = []
+        for node_id in positions:
+            row = self._id_to_row.get(node_id)
+            if row is None:
+                row = len(self._ids)
+                self._ids.append(node_id)
+                self._id_to_row[node_id] = row
+            rows.append(row)
+        self._ensure_capacity(len(self._ids))
+
+        row_array = np.array(rows)
+        if self.config.dtype == "int8":
+            scales = np.abs(matrix).max(axis=1) / 127
+            scales[scales == 0] = 1
+            self._vectors[row_array] = np.round(matrix / scales[:, None])
+            self._scales[row_array] = scales
+        else:
+            self._vectors[row_array] = matrix
+        if self._uses_full_precision():
+            self._full[row_array] = matrix
+        self._flush()
+
+    def query(
+        self,
+        query_embedding: List[float],
+        k: int = 10,
+    ) -> List[str]:
+        """
+        Perform a similarity search and return the result IDs.
+
+        Args:
+            query_embedding: Embedding vector for search.
+            k: Number of top results to retrieve.
+
+        Returns:
+            List of IDs from the search results.
+        """
+        return self.query_batch([query_embedding], k)[0]
+
+    def query_batch(
+        self,
+        query_embeddings: np.ndarray | List[List[float]],
+        k: int = 10,
+    ) -> List[List[str]]:
+        """
+        Perform a similarity search for multiple embeddings.
+
+        The matrix is scanned in blocks of `block_size` rows. With a quantized
+        matrix and `rescore` enabled, the best `k * rescore_factor` candidates are
+        re-ranked with their full-precision vectors.
+
+        Args:
+            query_embeddings: Embedding vectors for search, one per row.
+            k: Number of top results to retrieve per vector.
+
+        Returns:
+            List of IDs from the search results for each vector.
+        """
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries.reshape(1, -1)
+        count = len(self._ids)
+        if count == 0 or len(queries) == 0 or k <= 0:
+            return [[] for _ in range(len(queries))]
+        queries = self._normalize(queries)
+
+        rescore = self._uses_full_precision()
+        n_candidates = min(count, k * self.config.rescore_factor if rescore else k)
+
+        best_scores = np.empty((len(queries), 0), dtype=np.float32)
+        best_rows = np.empty((len(queries), 0), dtype=np.int64)
+        for start in range(0, count, self.config.block_size):
+            end = min(start + self.config.block_size, count)
+            scores = queries @ self._vectors[start:end].astype(np.float32).T
+            if self.config.dtype == "int8":
+                scores *= self._scales[start:end]
+            block_rows = np.broadcast_to(
+                np.arange(start, end), (len(queries), end - start)
+            )
+            scores = np.concatenate([best_scores, scores], axis=1)
+            rows = np.concatenate([best_rows, block_rows], axis=1)
+            # Early blocks may hold fewer than n_candidates rows in total
+            kth = min(n_candidates, scores.shape[1])
+            top = np.argpartition(-scores, kth - 1, axis=1)[:, :kth]
+            best_scores = np.take_along_axis(scores, top, axis=1)
+            best_rows = np.take_along_axis(rows, top, axis=1)
+
+        results = []
+        for query, scores, rows in zip(queries, best_scores, best_rows):
+            if rescore:
+                # Re-score the candidates with the exact vectors, reading in row order
+                rows = np.sort(rows)
+                scores = self._full[rows] @ query
+            order = np.argsort(-scores, kind="stable")[:k]
+            results.append([self._ids[rows[i]] for i in order])
+        return results
+
+    def _normalize(self, matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms == 0, 1, norms)
+
+    def _open(self) -> None:
+        with open(self._dir / "ids.json") as f:
+            sidecar = json.load(f)
+        if (
+            sidecar["dimension"] != self.config.embedding_dim
+            or sidecar["dtype"] != self.config.dtype
+        ):
+            raise ValueError(
+                f"Store at {self._dir} has dimension {sidecar['dimension']} and dtype "
+                f"{sidecar['dtype']}, but the configuration expects dimension "
+                f"{self.config.embedding_dim} and dtype {self.config.dtype}."
+            )
+        self._ids = sidecar["ids"]
+        self._id_to_row = {node_id: row for row, node_id in enumerate(self._ids)}
+        self._vectors = np.load(self._dir / "vectors.npy", mmap_mode="r+")
+        if self.config.dtype == "int8":
+            self._scales = np.load(self._dir / "scales.npy", mmap_mode="r+")
+        if self._uses_full_precision():
+            if not (self._dir / "full.npy").exists():
+                raise ValueError(
+                    f"Store at {self._dir} has no full-precision vectors to re-score "
+                    "with. Set rescore to False to open it."
+                )
+            self._full = np.load(self._dir / "full.npy", mmap_mode="r+")
+
+    def _uses_full_precision(self) -> bool:
+        return self.config.dtype != "float32" and self.config.rescore
+
+    def _ensure_capacity(self, size: int) -> None:
+        capacity = len(self._vectors)
+        if size <= capacity:
+            return
+        # Grow geometrically so repeated inserts copy each row O(1) times
+        capacity = max(size, 2 * capacity, 1024)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        dim = self.config.embedding_dim
+        self._vectors = self._resize(
+            "vectors.npy", self._vectors, (capacity, dim), self.config.dtype
+        )
+        if self.config.dtype == "int8":
+            self._scales = self._resize(
+                "scales.npy", self._scales, (capacity,), "float32"
+            )
+        if self._uses_full_precision():
+            self._full = self._resize(
+                "full.npy", self._full, (capacity, dim), "float32"
+            )
+
+    def _resize(
+        self,
+        name: str,
+        old: np.ndarray,
+        shape: tuple,
+        dtype: str,
+    ) -> np.ndarray:
+        path = self._dir / name
+        tmp_path = self._dir / f"{name}.tmp"
+        new = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=dtype, shape=shape)
+        new[: len(old)] = old
+        new.flush()
+        del new
+        os.replace(tmp_path, path)
+        return np.load(path, mmap_mode="r+")
+
+    def _flush(self) -> None:
+        for matrix in (self._vectors, self._scales, self._full):
+            if isinstance(matrix, np.memmap):
+                matrix.flush()
+        # Write the sidecar last, so rows beyond its count are ignored after a crash
+        sidecar = {
+            "dimension": self.config.embedding_dim,
+            "dtype": self.config.dtype,
+            "ids": self._ids,
+        }
+        tmp_path = self._dir / "ids.json.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(sidecar, f)
+        os.replace(tmp_path, self._dir / "ids.json")
@@ -5,7 +5,7 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
-from typing import List
+from typing import Any, Dict, List, Optional
 import pandas as pd
 import numpy as np
 from nano_vectordb import NanoVectorDB
@@ -42,14 +42,24 @@ class NanoVectorDBManager(BaseVectorDB):
         Args:
             data: DataFrame with data to insert.
         """
-        records = []
-        for _, row in data.iterrows():
-            record = {"__id__": row["__id__"], "__vector__": row["__vector__"]}
-            for col in data.columns:
-                if col not in ["__id__", "__vector__"]:
-                    record[col] = row[col]
-            records.append(record)
+        if data.empty:
+            return
 
+        # Convert column-wise instead of building each record from a row Series
+        ids = data["__id__"].tolist()
+        matrix = np.stack(data["__vector__"].to_numpy()).astype(np.float32)
+        other_columns = [
+            col for col in data.columns if col not in ["__id__", "__vector__"]
+        ]
+        if other_columns:
+            attributes = data[other_columns].to_dict("records")
+        else:
+            attributes = [{} for _ in ids]
+
+        records = [
+            {"__id__": node_id, "__vector__": vector, **attrs}
+            for node_id, vector, attrs in zip(ids, matrix, attributes)
+        ]
         self._db.upsert(records)
 
     def query(
@@ -69,3 +79,52 @@ class NanoVectorDBManager(BaseVectorDB):
         """
         results = self._db.query(query=np.array(query_embedding), top_k=k)
         return [result["__id__"] for result in results]
+
+    def query_batch(
+        self,
+        query_embeddings: np.ndarray | List[List[float]],
+        k: int = 10,
+    ) -> List[List[str]]:
+        """
+        Perform a similarity search for multiple embeddings with one matrix product.
+
+        Args:
+            query_embeddings: Embedding vectors for search, one per row.
+            k: Number of top results to retrieve per vector.
+
+        Returns:
+            List of IDs from the search results for each vector.
+        """
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries.reshape(1, -1)
+
+        if len(queries) == 0 or k <= 0:
+            return [[] for _ in range(len(queries))]
+        storage = self._get_storage()
+        if storage is None:
+            return [self.query(query.tolist(), k) for query in queries]
+        records = storage["data"]
+        if len(records) == 0:
+            return [[] for _ in range(len(queries))]
+
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries = queries / np.where(norms == 0, 1, norms)
+        # The stored vectors are normalized on upsert; zero vectors score NaN
+        scores = np.nan_to_num(queries @ storage["matrix"].T, nan=-np.inf)
+
+        # Select the top-k per row, then sort only those k candidates
+        top_k = min(k, len(records))
+        top_indices = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+        top_scores = np.take_along_axis(scores, top_indices, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        sorted_indices = np.take_along_axis(top_indices, order, axis=1)
+        return [[records[i]["__id__"] for i in row] for row in sorted_indices]
+
+    def _get_storage(self) -> Optional[Dict[str, Any]]:
+        # NanoVectorDB has no public accessor for its vectors. Reading its storage
+        # avoids a second copy of the matrix; other layouts fall back to query()
+        storage = getattr(self._db, "_NanoVectorDB__storage", None)
+        if not isinstance(storage, dict) or not {"data", "matrix"} <= storage.keys():
+            return None
+        return storage
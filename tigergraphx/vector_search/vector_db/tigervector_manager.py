@@ -5,12 +5,15 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
-from typing import Dict, List
+from typing import Dict, List, Literal, Optional, Tuple
 from pathlib import Path
 import logging
+import time
+import numpy as np
 import pandas as pd
 
 from .base_vector_db import BaseVectorDB
+from .ivf_index import IVFIndex
 
 from tigergraphx.config import TigerVectorConfig
 from tigergraphx.core import Graph
@@ -28,7 +31,7 @@ class TigerVectorManager(BaseVectorDB):
         Initialize TigerVectorManager.
 
         Args:
-            config: Config for the vector database connection, given as a config 
+            config: Config for the vector database connection, given as a config
                 object, dictionary, string, or path to a configuration file.
             graph: Graph instance for managing nodes.
         """
@@ -36,6 +39,21 @@ class TigerVectorManager(BaseVectorDB):
         super().__init__(config)
         self._graph = graph
 
+        # Optional in-memory mirror, populated by build_local_index
+        self._local_index: Optional[IVFIndex] = None
+        self._local_index_built_at: Optional[float] = None
+        if self.config.use_local_index:
+            vector_attribute = self._graph.get_schema()["nodes"][self.config.node_type][
+                "vector_attributes"
+            ][self.config.vector_attribute_name]
+            self._local_index = IVFIndex(
+                dimension=vector_attribute["dimension"],
+                metric=vector_attribute["metric"],
+                nlist=self.config.local_index_nlist,
+                nprobe=self.config.local_index_nprobe,
+            )
+            self._graph.add_write_listener(self._on_graph_write)
+
     def insert_data(self, data: pd.DataFrame) -> None:
         """
         Insert data into TigerGraph.
@@ -43,40 +61,182 @@ class TigerVectorManager(BaseVectorDB):
         Args:
             data: DataFrame containing data to be inserted.
         """
-        nodes_for_adding = []
-        for _, row in data.iterrows():
-            # Create a dictionary for node attributes
-            node_attributes = {
-                self.config.vector_attribute_name: row["__vector__"],
-            }
-
-            # Add the node ID as the first element in the tuple
-            nodes_for_adding.append((row["__id__"], node_attributes))
-
-        # Call the add_nodes_from method to add nodes to the graph
-        if len(nodes_for_adding) > 0:
+        if data.empty:
+            return
+
+        # Convert column-wise; tolist() yields JSON-serializable Python floats
+        ids = data["__id__"].tolist()
+        vectors = np.stack(data["__vector__"].to_numpy()).tolist()
+        vector_attribute_name = self.config.vector_attribute_name
+
+        # Upsert in batches to keep each request payload bounded
+        batch_size = self.config.batch_size
+        for start in range(0, len(ids), batch_size):
+            end = start + batch_size
+            nodes_for_adding = [
+                (node_id, {vector_attribute_name: vector})
+                for node_id, vector in zip(ids[start:end], vectors[start:end])
+            ]
             self._graph.add_nodes_from(
                 nodes_for_adding=nodes_for_adding, node_type=self.config.node_type
             )
 
-    def query(self, query_embedding: List[float], k: int = 10) -> List[str]:
+    def query(
+        self,
+        query_embedding: List[float],
+        k: int = 10,
+        filter_expression: Optional[str] = None,
+    ) -> List[str]:
         """
         Perform k-NN search on the vector database.
 
+        When the local index is enabled, built and fresh, unfiltered queries are
+        served from memory. Otherwise, or if the local index returns fewer than
+        `k` results, the query is sent to TigerGraph.
+
         Args:
             query_embedding: The query embedding vector.
             k: The number of nearest neighbors to return.
+            filter_expression: Filter expression evaluated on the server, using
+                the alias "s" for the node.
 
         Returns:
             List of identifiers from the search results.
         """
+        if (
+            filter_expression is None
+            and self._local_index is not None
+            and self._is_local_index_fresh()
+        ):
+            local_results = self._local_index.query(query_embedding, k)
+            if len(local_results) >= k:
+                return [node_id for node_id, _ in local_results]
+
         # Perform the vector search using the vector_search method
         search_results = self._graph.search(
             data=query_embedding,
             vector_attribute_name=self.config.vector_attribute_name,
             node_type=self.config.node_type,
             limit=k,
+            filter_expression=filter_expression,
         )
 
         # Extract the node ids
         return [result["id"] for result in search_results]
+
+    def query_batch(
+        self,
+        query_embeddings: np.ndarray | List[List[float]],
+        k: int = 10,
+    ) -> List[List[str]]:
+        """
+        Perform k-NN search for multiple embeddings with one installed query call.
+
+        Args:
+            query_embeddings: The query embedding vectors, one per row.
+            k: The number of nearest neighbors to return per vector.
+
+        Returns:
+            List of identifiers from the search results for each vector.
+        """
+        if self._local_index is not None and self._is_local_index_fresh():
+            local_results = [
+                self._local_index.query(query_embedding, k)
+                for query_embedding in query_embeddings
+            ]
+            if all(len(results) >= k for results in local_results):
+                return [
+                    [node_id for node_id, _ in results] for results in local_results
+                ]
+
+        batch_results = self._graph.search_batch(
+            data=np.asarray(query_embeddings, dtype=float).tolist(),
+            vector_attribute_name=self.config.vector_attribute_name,
+            node_type=self.config.node_type,
+            limit=k,
+        )
+        return [[result["id"] for result in results] for results in batch_results]
+
+    def build_local_index(self) -> int:
+        """
+        Build the in-memory index from all vectors of the configured node type.
+
+        The vectors are exported in batches of `batch_size` through `fetch_nodes`.
+        Afterwards, writes made through the same `Graph` keep the index up to date.
+
+        Returns:
+            The number of vectors in the local index.
+
+        Raises:
+            RuntimeError: If the local index is not enabled in the config.
+        """
+        if self._local_index is None:
+            raise RuntimeError(
+                "The local index is disabled. Set `use_local_index` to enable it."
+            )
+        node_type = self.config.node_type
+        vector_attribute_name = self.config.vector_attribute_name
+        primary_key = self._graph.get_schema()["nodes"][node_type]["primary_key"]
+        nodes = self._graph.get_nodes(
+            node_type=node_type, return_attributes=[primary_key], output_type="List"
+        )
+        node_ids = [str(node[primary_key]) for node in nodes]
+
+        ids: List[str] = []
+        vectors: List[List[float]] = []
+        for start in range(0, len(node_ids), self.config.batch_size):
+            embeddings = self._graph.fetch_nodes(
+                node_ids[start : start + self.config.batch_size],
+                vector_attribute_name,
+                node_type,
+            )
+            ids.extend(embeddings.keys())
+            vectors.extend(embeddings.values())
+
+        self._local_index.build(ids, np.array(vectors, dtype=np.float32))
+        self._local_index_built_at = time.monotonic()
+        logger.info(f"Built local index with {len(self._local_index)} vectors.")
+        return len(self._local_index)
+
+    def _is_local_index_fresh(self) -> bool:
+        if self._local_index is None or self._local_index_built_at is None:
+            return False
+        max_staleness = self.config.local_index_max_staleness
+        if max_staleness is None:
+            return True
+        return time.monotonic() - self._local_index_built_at <= max_staleness
+
+    def _on_graph_write(
+        self,
+        operation: Literal["upsert", "remove", "clear", "invalidate"],
+        node_type: Optional[str],
+        nodes: List[Tuple[str, Dict]],
+    ) -> None:
+        """Apply writes made through the graph to the local index."""
+        if self._local_index is None or self._local_index_built_at is None:
+            return
+        if operation == "clear":
+            self._local_index.build([], np.empty((0, self._local_index.dimension)))
+            return
+        if node_type not in (None, self.config.node_type):
+            return
+        if operation == "invalidate":
+            # The changed nodes are unknown, so query the server until rebuilt
+            self._local_index_built_at = None
+            logger.info("Local index is stale; call build_local_index to rebuild it.")
+            return
+        if node_type is None:
+            return
+        if operation == "remove":
+            self._local_index.remove([node_id for node_id, _ in nodes])
+            return
+
+        vector_attribute_name = self.config.vector_attribute_name
+        updates = [
+            (node_id, attributes[vector_attribute_name])
+            for node_id, attributes in nodes
+            if attributes.get(vector_attribute_name) is not None
+        ]
+        if updates:
+            ids, vectors = zip(*updates)
+            self._local_index.upsert(list(ids), np.array(vectors, dtype=np.float32))